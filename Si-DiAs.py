@@ -1,236 +1,266 @@
-import sys
-print("Interpreter:", sys.executable)
-print("Sys.path:", sys.path)
+import time
+T_MULAI = time.perf_counter()
 
-import tkinter as tk
 import datetime
+import os
+import sys
+import tkinter as tk
+import queue
 import math
+import operator
 import ephem
-import numpy as np
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import geocoder  # Untuk mendapatkan lokasi terkini
+# Matplotlib (peta 3D) dan geocoder sengaja tidak diimpor di sini: keduanya dimuat
+# setelah dial 2D tampil, lihat setelah_frame_pertama()
+from sidias.efemeris import TransformasiKatalog
+from sidias.interpolasi import InterpolasiSnapshot
+from sidias.katalog import buka_katalog, indeks_bernama
+from sidias.lokasi import BATAS_WAKTU_LOKASI, baca_lokasi_tersimpan, cari_lokasi_async
+from sidias.mesin import buat_mesin
+from sidias.pekerja import PekerjaLangit
+from sidias.profil import PengukurTahap
+from sidias.penjadwal import Penjadwal
+from sidias.reaktif import GrafReaktif
+from sidias.tampilan import WARNA_RASI, CacheLatarLangit, DialAstrolab, PetaLangit3D
 
-# -------------------------------
-# Fungsi untuk mendapatkan lokasi terkini
-# -------------------------------
-def get_current_location():
-    try:
-        g = geocoder.ip('me')
-        if g.ok and g.latlng:
-            return g.latlng[0], g.latlng[1]
-    except Exception as e:
-        print("Gagal mendapatkan lokasi:", e)
-    return None, None
+# `python Si-DiAs.py --ukur-startup` mencetak waktu startup lalu keluar (lihat bench/bench_startup.py)
+UKUR_STARTUP = "--ukur-startup" in sys.argv
+
+# Waktu tiap tahap update_gui selalu dicatat (ring buffer). `--profil` atau
+# SIDIAS_PROFIL=1 menampilkan p50/p95/p99 di status_label dan menulis semua sampel
+# ke SIDIAS_PROFIL_CSV saat aplikasi ditutup.
+PROFIL = "--profil" in sys.argv or os.environ.get("SIDIAS_PROFIL") == "1"
+PROFIL_CSV = os.environ.get("SIDIAS_PROFIL_CSV", os.path.expanduser("~/.sidias_profil.csv"))
+pengukur = PengukurTahap()
+
+# `--animasi` atau SIDIAS_ANIMASI=1: efemeris disampel tiap SIDIAS_INTERVAL_SAMPEL detik
+# (default 30) dan pointer/peta digerakkan halus dengan interpolasi ~30 fps
+ANIMASI = "--animasi" in sys.argv or os.environ.get("SIDIAS_ANIMASI") == "1"
+INTERVAL_SAMPEL = float(os.environ.get("SIDIAS_INTERVAL_SAMPEL", "30"))
 
 # -------------------------------
-# Fungsi Perhitungan Objek Langit
+# Katalog bintang
 # -------------------------------
-def hitung_posisi_matahari(lat, lon):
-    observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lon)
-    observer.date = datetime.datetime.utcnow()
-    matahari = ephem.Sun(observer)
-    az = float(matahari.az)  # dalam radian
-    alt = float(matahari.alt)  # dalam radian
-    return az, alt
-
-def hitung_posisi_bulan(lat, lon):
-    observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lon)
-    observer.date = datetime.datetime.utcnow()
-    bulan = ephem.Moon(observer)
-    az = float(bulan.az)
-    alt = float(bulan.alt)
-    fase = bulan.moon_phase  # antara 0 (bulan baru) hingga 1 (purnama)
-    return az, alt, fase
-
-def hitung_terbit_terbenam(lat, lon):
-    observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lon)
-    observer.date = datetime.datetime.utcnow()
-    matahari = ephem.Sun(observer)
-    try:
-        terbit = observer.next_rising(matahari)
-        terbenam = observer.next_setting(matahari)
-        terbit_local = ephem.localtime(terbit)
-        terbenam_local = ephem.localtime(terbenam)
-    except Exception:
-        terbit_local = terbenam_local = "N/A"
-    return terbit_local, terbenam_local
-
-def polar_to_cartesian(angle, radius, cx, cy):
-    # Konversi koordinat polar ke kartesian untuk dial 2D
-    x = cx + radius * math.cos(angle)
-    y = cy - radius * math.sin(angle)
-    return x, y
+# Default: 10 rasi bintang di data/rasi_bintang.csv. Katalog lain (mis. puluhan ribu
+# bintang) bisa dipakai lewat SIDIAS_KATALOG; CSV dikompilasi sekali ke file mmap.
+KATALOG_CSV = os.environ.get(
+    "SIDIAS_KATALOG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rasi_bintang.csv"))
+katalog = buka_katalog(KATALOG_CSV)
+
+# Warna rasi bintang (digambar dengan marker segitiga dan label)
+warna_rasi = WARNA_RASI
+
+# Posisi katalog dihitung dengan satu rotasi matriks per tick, hanya untuk bintang di
+# atas horizon yang tidak lebih redup dari SIDIAS_BATAS_MAG (rasi bintang selalu ikut)
+BATAS_MAG = float(os.environ.get("SIDIAS_BATAS_MAG", "6.5"))
+transformasi_katalog = TransformasiKatalog(katalog, BATAS_MAG, indeks_bernama(katalog, warna_rasi))
+
+# Mesin efemeris (posisi, fase, terbit/terbenam) dipilih lewat SIDIAS_MESIN, default
+# ephem. Terbit/terbenam hanya dicari ulang setelah peristiwanya lewat atau lokasi diubah.
+mesin_efemeris = buat_mesin()
+
+# Efemeris dan katalog dihitung thread pekerja (1 snapshot per detik, atau sampel
+# jarang di depan waktu sekarang saat animasi); thread Tk hanya mengambil snapshot
+# terbaru lewat Penjadwal lalu menggambar tampilan yang perlu
+pekerja = PekerjaLangit(mesin_efemeris, transformasi_katalog, interval=INTERVAL_SAMPEL if ANIMASI else 1.0,
+                        pengukur=pengukur, di_depan=ANIMASI)
+interpolasi = InterpolasiSnapshot()
+
+# Laju refresh per tampilan (lihat sidias.penjadwal): label dan pointer dial lewat
+# graf reaktif (diperbarui hanya bila teksnya berubah / pointer berpindah piksel),
+# peta 3D (paling mahal) paling cepat tiap 5 detik saat langit berputar/bergeser
+# >= 0.25°. Saat animasi Penjadwal berjalan ~30 fps dan peta 3D ikut bergerak tiap 0.02°.
+PERIODE_ANIMASI_MS = 33
+INTERVAL_PETA = 0.2 if ANIMASI else 5.0
+AMBANG_PETA_DERAJAT = 0.02 if ANIMASI else 0.25
+INTERVAL_MAKS = 60.0
+# Cache render latar peta 3D (sidias.tampilan.CacheLatarLangit), batas memori dalam MB;
+# 0 = tanpa cache. Default hanya aktif saat animasi: tanpa animasi peta baru digambar
+# setelah langit berputar >= 0.25° (satu kuantum LST), jadi latarnya tidak pernah terpakai ulang.
+MAKS_MB_LATAR = float(os.environ.get("SIDIAS_CACHE_LATAR_MB", "8" if ANIMASI else "0"))
 
 # -------------------------------
 # Fungsi Peta Langit 3D dengan Matplotlib
 # -------------------------------
-def update_star_map():
-    ax.clear()
-    
-    # Buat grid untuk permukaan bola
-    u = np.linspace(0, np.pi, 50)
-    v = np.linspace(0, 2*np.pi, 50)
-    x = np.outer(np.sin(u), np.cos(v))
-    y = np.outer(np.sin(u), np.sin(v))
-    z = np.outer(np.cos(u), np.ones_like(v))
-    
-    # Warna: bagian atas (z>=0) = langit (biru), bagian bawah (z<0) = bumi (coklat)
-    colors = np.empty(x.shape, dtype=object)
-    colors[z >= 0] = 'skyblue'
-    colors[z < 0] = 'saddlebrown'
-    
-    ax.plot_surface(x, y, z, facecolors=colors, rstride=1, cstride=1, alpha=0.5, linewidth=0)
-    
-    ax.set_xlim([-1, 1])
-    ax.set_ylim([-1, 1])
-    ax.set_zlim([-1, 1])
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_zticks([])
-    ax.set_box_aspect([1,1,1])
-    
-    # Tambahkan label arah: Utara, Selatan, Barat, Timur
-    ax.text(0, 1.05, 0, "T", color="k", fontsize=10, ha="center", fontname="Lucida Console")
-    ax.text(0, -1.05, 0, "B", color="k", fontsize=10, ha="center", fontname="Lucida Console")
-    ax.text(1.05, 0, 0, "S", color="k", fontsize=10, va="center", fontname="Lucida Console")
-    ax.text(-1.05, 0, 0, "U", color="k", fontsize=10, va="center", fontname="Lucida Console")
-    
-    # Dapatkan posisi Matahari dan Bulan (sistem lokal: alt-azimuth)
-    try:
-        lat = float(entry_lat.get())
-        lon = float(entry_lon.get())
-    except ValueError:
+def update_star_map(snapshot):
+    # Bola langit, label arah dan legenda sudah dibuat sekali di PetaLangit3D;
+    # di sini hanya posisi Matahari, Bulan dan rasi bintang yang diperbarui
+    if peta_langit is None:
+        return  # peta 3D belum dimuat
+    if cache_latar is not None:
+        # Latar (bintang & rasi) diambil dari cache per (lintang, LST) bila ada; hanya
+        # Matahari dan Bulan yang digambar ulang lalu di-blit (tahap peta/draw dicatat cache)
+        cache_latar.gambar(snapshot)
         return
+    with pengukur.ukur("peta"):
+        peta_langit.perbarui(snapshot)
+    with pengukur.ukur("draw"):
+        star_canvas.draw()
+
+def muat_peta_langit():
+    global peta_langit, star_canvas, cache_latar
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
 
-    observer = ephem.Observer()
-    observer.lat = str(lat)
-    observer.lon = str(lon)
-    observer.date = datetime.datetime.utcnow()
-    
-    sun = ephem.Sun(observer)
-    moon = ephem.Moon(observer)
-    
-    # Koordinat Matahari
-    sun_az, sun_alt = float(sun.az), float(sun.alt)
-    x_sun = math.cos(sun_alt) * math.cos(sun_az)
-    y_sun = math.cos(sun_alt) * math.sin(sun_az)
-    z_sun = math.sin(sun_alt)
-    
-    # Koordinat Bulan
-    moon_az, moon_alt = float(moon.az), float(moon.alt)
-    x_moon = math.cos(moon_alt) * math.cos(moon_az)
-    y_moon = math.cos(moon_alt) * math.sin(moon_az)
-    z_moon = math.sin(moon_alt)
-    
-    ax.scatter([x_sun], [y_sun], [z_sun], color='red', s=100, label='Matahari')
-    ax.scatter([x_moon], [y_moon], [z_moon], color='blue', s=100, label='Bulan')
-    
-    # Tambahkan rasi bintang dengan marker segitiga
-    constellations = {
-        "Orion": {"coords": (83.8, -5.9), "color": "darkorange"},
-        "Ursa Major": {"coords": (165.0, 56.0), "color": "indigo"},
-        "Ursa Minor": {"coords": (150.0, 75.0), "color": "green"},
-        "Crux": {"coords": (186.0, -63.0), "color": "magenta"},
-        "Canis Major": {"coords": (101.0, -17.0), "color": "cyan"},
-        "Taurus": {"coords": (65.0, 16.0), "color": "sienna"},
-        "Scorpius": {"coords": (247.0, -26.0), "color": "firebrick"},
-        "Sagittarius": {"coords": (266.0, -29.0), "color": "gold"},
-        "Capricornus": {"coords": (340.0, -20.0), "color": "teal"},
-        "Leo": {"coords": (170.0, 12.0), "color": "navy"}
-    }
-    
-    for name, data in constellations.items():
-        ra_deg, dec_deg = data["coords"]
-        color = data["color"]
-        # Buat FixedBody agar posisinya di-update oleh observer
-        body = ephem.FixedBody()
-        body._ra = math.radians(ra_deg)
-        body._dec = math.radians(dec_deg)
-        body.compute(observer)
-        # Dapatkan alt dan az dari body (sistem lokal)
-        alt_local = float(body.alt)
-        az_local = float(body.az)
-        # Konversi ke koordinat kartesian (unit sphere)
-        x_star = math.cos(alt_local) * math.cos(az_local)
-        y_star = math.cos(alt_local) * math.sin(az_local)
-        z_star = math.sin(alt_local)
-        ax.scatter([x_star], [y_star], [z_star], color=color, s=50, marker='^')
-        ax.text(x_star, y_star, z_star, f" {name}", color=color, fontsize=8, fontname="Lucida Console")
-    
-    ax.legend(loc='upper right', prop={"family": "Lucida Console", "size": 10})
-    star_canvas.draw()
+    fig = Figure(figsize=(6, 6))
+    ax = fig.add_subplot(111, projection='3d')
+    peta_langit = PetaLangit3D(ax, katalog, warna_rasi)
+    star_canvas = FigureCanvasTkAgg(fig, master=frame_star_map)
+    star_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+    if MAKS_MB_LATAR > 0:
+        cache_latar = CacheLatarLangit(peta_langit, star_canvas, MAKS_MB_LATAR * 2**20, pengukur=pengukur)
+
+# -------------------------------
+# Startup bertahap
+# -------------------------------
+def catat_startup(nama):
+    if UKUR_STARTUP:
+        print(f"startup {nama}: {(time.perf_counter() - T_MULAI) * 1000:.1f} ms", flush=True)
+
+def setelah_frame_pertama(snapshot):
+    # Dial sudah tampil: baru sekarang muat peta 3D dan mulai cari lokasi terkini
+    muat_peta_langit()
+    update_star_map(snapshot)
+    catat_startup("time_to_star_map")
+    window.after(200, terapkan_lokasi_terkini, cari_lokasi_async(), time.monotonic() + BATAS_WAKTU_LOKASI + 1.0)
+    if UKUR_STARTUP:
+        window.after(0, window.destroy)
 
 # -------------------------------
 # Fungsi Update GUI Utama
 # -------------------------------
-def update_gui():
+# Satu snapshot (satu observer, satu instan) untuk semua tampilan pada tick ini;
+# Penjadwal memanggil tiap fungsi tampilan hanya bila tampilannya perlu berubah,
+# dan graf reaktif hanya menyentuh widget yang teks atau geometrinya berubah.
+# Tahap "snapshot" beserta rinciannya "efemeris" dan "katalog" dicatat oleh thread pekerja.
+def format_jam(waktu):
+    return waktu if isinstance(waktu, str) else waktu.strftime('%H:%M:%S')
+
+# Simpul graf reaktif (lihat sidias.reaktif dan pembuatan graf di bawah). Tiap fungsi
+# hanya dihitung ulang bila masukannya berubah; snapshot None berarti belum ada data.
+def parse_lokasi(teks):
     try:
-        lat = float(entry_lat.get())
-        lon = float(entry_lon.get())
+        lat, lon = float(teks[0]), float(teks[1])
     except ValueError:
-        status_label.config(text="Masukkan latitude dan longitude yang valid!", font=("Lucida Console", 10))
-        window.after(1000, update_gui)
-        return
+        return None
+    if not (math.isfinite(lat) and math.isfinite(lon) and -90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
 
-    az, alt = hitung_posisi_matahari(lat, lon)
-    az_bulan, alt_bulan, fase_bulan = hitung_posisi_bulan(lat, lon)
-    terbit, terbenam = hitung_terbit_terbenam(lat, lon)
-    
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    status_text = (
-        f"Waktu lokal: {now}\n"
-        f"Matahari -> Azimuth: {math.degrees(az):.1f}°, Ketinggian: {math.degrees(alt):.1f}°\n"
-        f"Bulan    -> Azimuth: {math.degrees(az_bulan):.1f}°, Ketinggian: {math.degrees(alt_bulan):.1f}°, Fase: {fase_bulan:.2f}\n"
-        f"Matahari Terbit: {terbit if isinstance(terbit, str) else terbit.strftime('%H:%M:%S')} | "
-        f"Terbenam: {terbenam if isinstance(terbenam, str) else terbenam.strftime('%H:%M:%S')}"
+def hitung_waktu_lokal(snapshot):
+    # Ember waktu: teksnya (dan semua yang bergantung padanya) berubah sekali per detik
+    if snapshot is None:
+        return None
+    return ephem.localtime(ephem.Date(snapshot.waktu)).strftime("%Y-%m-%d %H:%M:%S")
+
+def hitung_posisi(snapshot):
+    if snapshot is None:
+        return None
+    return (
+        f"Matahari -> Azimuth: {math.degrees(snapshot.az_matahari):.1f}°, Ketinggian: {math.degrees(snapshot.alt_matahari):.1f}°\n"
+        f"Bulan    -> Azimuth: {math.degrees(snapshot.az_bulan):.1f}°, Ketinggian: {math.degrees(snapshot.alt_bulan):.1f}°, Fase: {snapshot.fase_bulan:.2f}"
     )
-    status_label.config(text=status_text, font=("Lucida Console", 10))
-
-    # Update label waktu dan info terbit/tenggelam di pojok kiri bawah
-    label_time.config(text=f"Waktu Lokal: {now}", font=("Lucida Console", 10))
-    label_sun.config(
-        text=(
-            f"Matahari Terbit: {terbit if isinstance(terbit, str) else terbit.strftime('%H:%M:%S')} | "
-            f"Matahari Tenggelam: {terbenam if isinstance(terbenam, str) else terbenam.strftime('%H:%M:%S')}"
-        ),
-        font=("Lucida Console", 10)
+
+def hitung_terbit_terbenam(snapshot):
+    if snapshot is None:
+        return None
+    return format_jam(snapshot.terbit), format_jam(snapshot.terbenam)
+
+def hitung_overlay(waktu_lokal):
+    # Overlay profil ikut ember waktu, bukan tiap frame
+    if not PROFIL or waktu_lokal is None:
+        return ""
+    teks = pengukur.teks_overlay()
+    if cache_latar is not None:
+        teks += "\n" + cache_latar.teks_statistik()
+    return teks
+
+def teks_status(lokasi, lokasi_gagal, waktu_lokal, posisi, terbit_terbenam, overlay):
+    if lokasi is None or lokasi == lokasi_gagal:
+        return "Masukkan latitude dan longitude yang valid!"
+    if waktu_lokal is None:
+        return "Memperbarui..."
+    teks = (
+        f"Waktu lokal: {waktu_lokal}\n"
+        f"{posisi}\n"
+        f"Matahari Terbit: {terbit_terbenam[0]} | Terbenam: {terbit_terbenam[1]}"
     )
-    
-    # Update dial astrolab 2D
-    canvas.delete("all")
-    cx, cy = 250, 250
-    radius = 170
-    canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius, outline="black", width=2)
-    for deg in range(0, 360, 30):
-        rad = math.radians(deg)
-        x_end, y_end = polar_to_cartesian(rad, radius, cx, cy)
-        canvas.create_line(cx, cy, x_end, y_end, fill="gray", dash=(2,2))
-        x_label, y_label = polar_to_cartesian(rad, radius + 15, cx, cy)
-        canvas.create_text(x_label, y_label, text=f"{deg}°", font=("Lucida Console", 8))
-
-    # Pointer Matahari
-    pointer_length = radius * 0.9
-    x_pointer, y_pointer = polar_to_cartesian(az, pointer_length, cx, cy)
-    canvas.create_line(cx, cy, x_pointer, y_pointer, fill="red", width=3, arrow=tk.LAST)
-    canvas.create_text(x_pointer, y_pointer, text="Matahari", fill="red", anchor=tk.SW, font=("Lucida Console", 8))
-
-    # Pointer Bulan
-    x_pointer_bulan, y_pointer_bulan = polar_to_cartesian(az_bulan, pointer_length * 0.8, cx, cy)
-    canvas.create_line(cx, cy, x_pointer_bulan, y_pointer_bulan, fill="blue", width=3, arrow=tk.LAST)
-    canvas.create_text(x_pointer_bulan, y_pointer_bulan, text="Bulan", fill="blue", anchor=tk.SE, font=("Lucida Console", 8))
-    
-    # Update peta langit 3D
-    update_star_map()
-
-    # Perbarui setiap 1 detik
-    window.after(1000, update_gui)
+    if overlay:
+        teks += "\n\n" + overlay
+    return teks
+
+def teks_jam(waktu_lokal):
+    return f"Waktu Lokal: {waktu_lokal or ''}"
+
+def teks_terbit(terbit_terbenam):
+    terbit, terbenam = terbit_terbenam or ("...", "...")
+    return f"Matahari Terbit: {terbit} | Matahari Tenggelam: {terbenam}"
+
+def hitung_geometri_dial(snapshot):
+    # Dibulatkan ke piksel: pointer hanya dipindah bila ujungnya berpindah piksel
+    if snapshot is None:
+        return None
+    return tuple((round(x), round(y)) for x, y in dial.geometri(snapshot))
+
+def gambar_dial(geometri):
+    # Geometri statis dial 2D sudah ada, hanya pointer yang dipindah
+    if geometri is not None:
+        with pengukur.ukur("dial"):
+            dial.gambar(geometri)
+
+def pindah_lokasi(lokasi):
+    # Lokasi diubah -> pekerja langsung menghitung snapshot untuk lokasi baru
+    if lokasi is not None:
+        pekerja.atur_lokasi(*lokasi)
+
+def update_tampilan(snapshot):
+    # Snapshot baru masuk graf; widget hanya disentuh bila teks/geometrinya berubah
+    graf.atur("snapshot", snapshot)
+    graf.segarkan()
+
+def setelah_tick(snapshot):
+    global frame_pertama
+    if frame_pertama:
+        frame_pertama = False
+        window.update_idletasks()
+        catat_startup("time_to_first_frame")
+        window.after_idle(setelah_frame_pertama, snapshot)
+
+def lokasi_berubah(event=None):
+    # Entri hanya di-parse ulang bila teksnya berubah (bukan tiap tick/tombol panah)
+    graf.atur("teks_lokasi", (entry_lat.get(), entry_lon.get()))
+    graf.segarkan()
+
+def atur_pekerja(terlihat):
+    # Jendela di-iconify/tertutup penuh: pekerja berhenti menghitung efemeris & katalog
+    if terlihat:
+        pekerja.lanjutkan()
+    else:
+        pekerja.jeda()
+
+def periksa_pekerja():
+    # Lokasi yang gagal dihitung pekerja ditampilkan sebagai isian tidak valid
+    graf.atur("lokasi_gagal", pekerja.lokasi_gagal)
+    graf.segarkan()
+
+def ambil_snapshot():
+    # Hanya snapshot terbaru yang dipakai; snapshot untuk lokasi sebelum entri
+    # diubah (masih dihitung saat pengguna mengetik) dibuang
+    periksa_pekerja()
+    snapshot = pekerja.ambil_terbaru()
+    if snapshot is not None and (snapshot.lat, snapshot.lon) == graf.nilai("lokasi"):
+        return snapshot
+    return None
+
+def ambil_snapshot_animasi():
+    # Sampel jarang dari pekerja diinterpolasi ke waktu sekarang pada tiap frame
+    periksa_pekerja()
+    lokasi = graf.nilai("lokasi")
+    for snapshot in pekerja.ambil_semua():
+        if (snapshot.lat, snapshot.lon) == lokasi:
+            interpolasi.tambah(snapshot)
+    if lokasi is None or interpolasi.lokasi != lokasi:
+        return None
+    return interpolasi.pada(datetime.datetime.utcnow())
 
 # -------------------------------
 # Pembuatan GUI dengan Tkinter (Layout Responsif)
@@ -270,14 +300,39 @@ tk.Label(frame_input, text="Longitude:", font=("Lucida Console", 10)).grid(row=0
 entry_lon = tk.Entry(frame_input, width=10, font=("Lucida Console", 10))
 entry_lon.grid(row=0, column=3, padx=5, sticky="w")
 
-# Auto-populasi lokasi jika memungkinkan
-lat_curr, lon_curr = get_current_location()
+# Lokasi diubah -> graf mem-parse entri dan memberi tahu pekerja
+entry_lat.bind("<KeyRelease>", lokasi_berubah)
+entry_lon.bind("<KeyRelease>", lokasi_berubah)
+
+# Auto-populasi lokasi: pakai lokasi terakhir yang tersimpan (atau Jakarta) agar
+# jendela langsung tampil, lalu cari lokasi terkini di latar belakang
+lat_curr, lon_curr = baca_lokasi_tersimpan()
 if lat_curr is not None and lon_curr is not None:
     entry_lat.insert(0, f"{lat_curr:.4f}")
     entry_lon.insert(0, f"{lon_curr:.4f}")
 else:
     entry_lat.insert(0, "-6.2000")
     entry_lon.insert(0, "106.8166")
+lokasi_awal = (entry_lat.get(), entry_lon.get())
+
+def terapkan_lokasi_terkini(antrean, batas):
+    try:
+        lat_baru, lon_baru = antrean.get_nowait()
+    except queue.Empty:
+        # Batas waktu keras: hasil yang datang terlambat diabaikan
+        if time.monotonic() < batas:
+            window.after(200, terapkan_lokasi_terkini, antrean, batas)
+        return
+    if lat_baru is None or lon_baru is None:
+        return
+    # Jangan timpa isian yang sudah diubah pengguna sejak aplikasi dibuka
+    if (entry_lat.get(), entry_lon.get()) != lokasi_awal:
+        return
+    entry_lat.delete(0, tk.END)
+    entry_lat.insert(0, f"{lat_baru:.4f}")
+    entry_lon.delete(0, tk.END)
+    entry_lon.insert(0, f"{lon_baru:.4f}")
+    lokasi_berubah()
 
 # Frame untuk informasi waktu dan Matahari terbit/tenggelam (pojok kiri bawah)
 frame_info = tk.Frame(window)
@@ -303,16 +358,17 @@ frame_dial.rowconfigure(0, weight=1)
 frame_dial.columnconfigure(0, weight=1)
 canvas = tk.Canvas(frame_dial, bg="white")
 canvas.grid(row=0, column=0, sticky="nsew")
+dial = DialAstrolab(canvas)
 
 # Frame peta langit 3D
 frame_star_map = tk.Frame(frame_main)
 frame_star_map.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
 frame_star_map.rowconfigure(0, weight=1)
 frame_star_map.columnconfigure(0, weight=1)
-fig = Figure(figsize=(6, 6))
-ax = fig.add_subplot(111, projection='3d')
-star_canvas = FigureCanvasTkAgg(fig, master=frame_star_map)
-star_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+# Figure dan PetaLangit3D dibuat oleh muat_peta_langit() setelah frame pertama
+peta_langit = None
+star_canvas = None
+cache_latar = None
 
 # Frame untuk judul & copyright (pojok kanan bawah)
 frame_footer = tk.Frame(window)
@@ -326,5 +382,56 @@ label_copy.pack(side="bottom", padx=(10,10))
 status_label = tk.Label(window, text="Memperbarui...", font=("Lucida Console", 10))
 status_label.grid(row=3, column=0, columnspan=2, pady=5)
 
-update_gui()
+# -------------------------------
+# Graf reaktif: lokasi -> snapshot (posisi, terbit/terbenam) -> teks & geometri
+# -------------------------------
+# Snapshot (observer + posisi benda + terbit/terbenam) dihitung thread pekerja;
+# di sini hanya turunannya. Efek (config label, coords pointer) dipanggil hanya
+# saat nilai simpulnya berubah.
+graf = GrafReaktif()
+graf.sumber("teks_lokasi", (None, None))
+graf.sumber("lokasi_gagal")
+graf.sumber("snapshot", sama=operator.is_)  # namedtuple berisi array: bandingkan identitas
+graf.turunan("lokasi", parse_lokasi, "teks_lokasi")
+graf.turunan("waktu_lokal", hitung_waktu_lokal, "snapshot")
+graf.turunan("posisi", hitung_posisi, "snapshot")
+graf.turunan("terbit_terbenam", hitung_terbit_terbenam, "snapshot")
+graf.turunan("overlay", hitung_overlay, "waktu_lokal")
+graf.turunan("teks_status", teks_status, "lokasi", "lokasi_gagal", "waktu_lokal", "posisi",
+             "terbit_terbenam", "overlay")
+graf.turunan("teks_jam", teks_jam, "waktu_lokal")
+graf.turunan("teks_terbit", teks_terbit, "terbit_terbenam")
+graf.turunan("geometri_dial", hitung_geometri_dial, "snapshot")
+graf.amati("lokasi", pindah_lokasi)
+graf.amati("teks_status", lambda teks: status_label.config(text=teks))
+graf.amati("teks_jam", lambda teks: label_time.config(text=teks))
+graf.amati("teks_terbit", lambda teks: label_sun.config(text=teks))
+graf.amati("geometri_dial", gambar_dial)
+lokasi_berubah()
+
+frame_pertama = True
+catat_startup("imports_and_widgets")
+if ANIMASI:
+    penjadwal = Penjadwal(window, ambil_snapshot_animasi, periode_ms=PERIODE_ANIMASI_MS, pengukur=pengukur)
+else:
+    penjadwal = Penjadwal(window, ambil_snapshot, pengukur=pengukur)
+# Label dan dial lewat graf (tiap snapshot); peta 3D tetap dibatasi laju & ambangnya
+penjadwal.tambah("tampilan", update_tampilan)
+penjadwal.tambah("peta", update_star_map, interval=INTERVAL_PETA, perubahan=PetaLangit3D.perubahan_derajat,
+                 ambang=AMBANG_PETA_DERAJAT, interval_maks=INTERVAL_MAKS)
+penjadwal.setelah_terapkan = setelah_tick
+penjadwal.saat_terlihat = atur_pekerja
+penjadwal.pantau_visibilitas()
+
+pekerja.mulai(*(graf.nilai("lokasi") or (-6.2, 106.8166)))
+penjadwal.mulai()
 window.mainloop()
+pekerja.hentikan()
+
+if PROFIL:
+    try:
+        pengukur.simpan_csv(PROFIL_CSV)
+    except OSError as e:
+        print(f"Sampel waktu per tahap gagal disimpan ke {PROFIL_CSV}: {e}", file=sys.stderr)
+    else:
+        print(f"Sampel waktu per tahap disimpan ke {PROFIL_CSV}")
@@ -0,0 +1,71 @@
+# -------------------------------
+# Benchmark startup Si-DiAs
+# -------------------------------
+# Menjalankan `python -X importtime Si-DiAs.py --ukur-startup` beberapa kali lalu
+# melaporkan waktu impor per modul dan time-to-first-frame (median). Keluar dengan
+# kode 1 bila time-to-first-frame melebihi anggaran, supaya regresi latensi startup
+# ketahuan. Membutuhkan layar (DISPLAY) karena jendela Tk benar-benar dibuat.
+#
+#   python bench/bench_startup.py --ulang 5 --anggaran-ms 1500
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODUL_DIPANTAU = ["tkinter", "ephem", "numpy", "sidias", "matplotlib", "mpl_toolkits", "geocoder"]
+
+def jalankan_sekali():
+    proses = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(ROOT, "Si-DiAs.py"), "--ukur-startup"],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    if proses.returncode != 0:
+        raise RuntimeError(proses.stderr.strip().splitlines()[-1] if proses.stderr.strip() else "gagal")
+
+    # Baris importtime: "import time:  self [us] | cumulative | imported package"
+    impor = {}
+    for baris in proses.stderr.splitlines():
+        if not baris.startswith("import time:") or "cumulative" in baris:
+            continue
+        _, kumulatif, paket = baris[len("import time:"):].split("|")
+        nama = paket.strip()
+        akar = nama.split(".")[0]
+        # Hanya impor tingkat atas (tanpa indentasi) yang dihitung agar tidak dobel
+        if akar in MODUL_DIPANTAU and not paket[1:].startswith(" "):
+            impor[akar] = impor.get(akar, 0.0) + int(kumulatif) / 1000.0
+
+    tahap = {}
+    for baris in proses.stdout.splitlines():
+        if baris.startswith("startup "):
+            nama, nilai = baris[len("startup "):].split(":")
+            tahap[nama.strip()] = float(nilai.split()[0])
+    return impor, tahap
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup Si-DiAs")
+    parser.add_argument("--ulang", type=int, default=5)
+    parser.add_argument("--anggaran-ms", type=float, default=1500.0,
+                        help="batas time-to-first-frame (median) dalam milidetik")
+    args = parser.parse_args()
+
+    hasil = [jalankan_sekali() for _ in range(args.ulang)]
+
+    print("Waktu impor (median, ms):")
+    for modul in MODUL_DIPANTAU:
+        nilai = [impor.get(modul, 0.0) for impor, _ in hasil]
+        print(f"  {modul:<14}{statistics.median(nilai):8.1f}")
+    print("Tahap startup (median, ms sejak awal skrip):")
+    for nama in hasil[0][1]:
+        print(f"  {nama:<24}{statistics.median(t[nama] for _, t in hasil):8.1f}")
+
+    ttff = statistics.median(t["time_to_first_frame"] for _, t in hasil)
+    if ttff > args.anggaran_ms:
+        print(f"REGRESI: time-to-first-frame {ttff:.1f} ms > anggaran {args.anggaran_ms:.1f} ms")
+        sys.exit(1)
+    print(f"OK: time-to-first-frame {ttff:.1f} ms <= anggaran {args.anggaran_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# -------------------------------
+# Benchmark satu tick update_gui (tanpa layar)
+# -------------------------------
+# Mengukur tahap-tahap satu tick seperti di Si-DiAs.py: efemeris (posisi, fase,
+# terbit/terbenam), katalog (pilih bintang + rotasi alt-az), dial 2D, peta 3D
+# (PetaLangit3D.perbarui) dan draw kanvas. Snapshot dibuat dengan
+# sidias.mesin.buat_snapshot yang sama dengan thread pekerja aplikasi; tahap efemeris
+# dan katalog dicatat oleh buat_snapshot sendiri. Dial digambar ke kanvas palsu dan
+# peta 3D ke Figure Agg offscreen, jadi berjalan di Linux biasa tanpa DISPLAY.
+#
+# Setiap kombinasi mesin efemeris × ukuran katalog diukur; median per tahap
+# dibandingkan dengan baseline lokal (bench/baseline_tick.json, tidak ikut git karena
+# angkanya milik mesin yang mengukurnya). Kombinasi yang belum ada di baseline (atau
+# baseline yang belum ada sama sekali) disimpan sebagai baseline pada run pertama.
+# Keluar dengan kode 1 bila ada tahap yang lebih lambat dari baseline melebihi ambang.
+#
+#   python bench/bench_tick.py                       # bandingkan dengan baseline
+#   python bench/bench_tick.py --simpan-baseline     # tulis ulang baseline
+#   python bench/bench_tick.py --mesin ephem --ukuran 10 100000 --tick 50
+#   python bench/bench_tick.py --cache-latar       # peta lewat CacheLatarLangit
+#   python bench/bench_tick.py --cache-latar --langkah 15   # peta digambar tiap 0.06° LST
+#
+# Dengan --cache-latar, laju kena cache bergantung pada jarak waktu antar-tick
+# (--langkah, detik): 1 s per tick = ~60 tick per kuantum LST (mirip animasi),
+# sedangkan aplikasi tanpa animasi baru menggambar peta tiap >= 60 s (selalu gagal).
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+# Font Lucida Console sering tidak ada di server; peringatannya hanya mengotori tabel
+logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from sidias.efemeris import TransformasiKatalog
+from sidias.katalog import DTYPE_KATALOG, Katalog, buka_katalog, indeks_bernama
+from sidias.mesin import MESIN_EFEMERIS, buat_snapshot
+from sidias.tampilan import CacheLatarLangit, DialAstrolab, PetaLangit3D
+
+FILE_BASELINE = os.path.join(ROOT, "bench", "baseline_tick.json")
+TAHAP = ("efemeris", "katalog", "dial", "peta", "draw")
+LOKASI = (-6.2, 106.8166)  # Jakarta
+WAKTU_AWAL = datetime.datetime(2024, 3, 20, 12, 0, 0)
+BATAS_MAG = 6.5
+AMBANG_ABSOLUT_MS = 0.2  # selisih di bawah ini dianggap derau
+
+class KanvasPalsu:
+    # Pengganti tk.Canvas secukupnya untuk DialAstrolab: item hanya dicatat
+    def __init__(self):
+        self.item = {}
+
+    def _buat(self, *koordinat, **opsi):
+        self.item[len(self.item) + 1] = list(koordinat)
+        return len(self.item)
+
+    create_line = create_oval = create_text = _buat
+
+    def coords(self, item, *koordinat):
+        self.item[item] = list(koordinat)
+
+class CatatanTahap:
+    # Pengganti PengukurTahap untuk buat_snapshot dan CacheLatarLangit: hanya durasi
+    # terakhir per tahap
+    def __init__(self):
+        self.terakhir = {}
+
+    def catat(self, tahap, ms):
+        self.terakhir[tahap] = ms
+
+def katalog_sintetis(n, dasar, rng):
+    # n bintang acak merata di bola, distribusi magnitudo mirip katalog nyata
+    # (jumlah bintang naik ~x3 per magnitudo), ditambah rasi bintang dari `dasar`
+    data = np.empty(n + len(dasar.data), dtype=DTYPE_KATALOG)
+    data["ra"][:n] = rng.uniform(0, 2 * np.pi, n)
+    data["dec"][:n] = np.arcsin(rng.uniform(-1, 1, n))
+    data["mag"][:n] = 9.0 + np.log(rng.uniform(1e-5, 1, n)) / np.log(3.0)
+    data["nama"][:n] = -1
+    data[n:] = dasar.data
+    return Katalog(data, dasar.nama)
+
+def warna_untuk(katalog):
+    siklus = matplotlib.rcParams["axes.prop_cycle"].by_key()["color"]
+    return {nama: siklus[i % len(siklus)] for i, nama in enumerate(katalog.nama)}
+
+def ukur(nama_mesin, katalog, n_tick, cache_latar=False, langkah=1.0):
+    warna_rasi = warna_untuk(katalog)
+    mesin = MESIN_EFEMERIS[nama_mesin]()
+    transformasi = TransformasiKatalog(katalog, BATAS_MAG, indeks_bernama(katalog, warna_rasi))
+    dial = DialAstrolab(KanvasPalsu())
+    fig = Figure(figsize=(6, 6))
+    kanvas = FigureCanvasAgg(fig)
+    peta = PetaLangit3D(fig.add_subplot(111, projection="3d"), katalog, warna_rasi)
+    # Dengan cache latar, tahap "peta" hanya memindah Matahari/Bulan dan "draw" memulihkan
+    # latar dari cache (atau merender latar baru saat LST pindah kuantum); keduanya
+    # dicatat oleh cache sendiri, seperti efemeris & katalog oleh buat_snapshot
+    catatan = CatatanTahap()
+    latar = CacheLatarLangit(peta, kanvas, pengukur=catatan) if cache_latar else None
+
+    sampel = {tahap: [] for tahap in TAHAP}
+    lat, lon = LOKASI
+    # Tick pertama (pemanasan cache, fit Chebyshev, layout figure) tidak dihitung
+    for tick in range(n_tick + 1):
+        waktu = WAKTU_AWAL + datetime.timedelta(seconds=tick * langkah)
+        snapshot = buat_snapshot(lat, lon, transformasi, waktu, mesin=mesin, pengukur=catatan)
+        t0 = time.perf_counter()
+        dial.perbarui(snapshot)
+        t1 = time.perf_counter()
+        catatan.catat("dial", (t1 - t0) * 1000.0)
+        if latar is None:
+            peta.perbarui(snapshot)
+            t2 = time.perf_counter()
+            kanvas.draw()
+            catatan.catat("peta", (t2 - t1) * 1000.0)
+            catatan.catat("draw", (time.perf_counter() - t2) * 1000.0)
+        else:
+            latar.gambar(snapshot)
+        if tick:
+            for tahap in TAHAP:
+                sampel[tahap].append(catatan.terakhir[tahap])
+    if latar is not None:
+        print(f"  {latar.teks_statistik()}")
+    return {tahap: statistics.median(nilai) for tahap, nilai in sampel.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per tahap satu tick update_gui tanpa layar")
+    parser.add_argument("--mesin", nargs="+", default=list(MESIN_EFEMERIS), choices=list(MESIN_EFEMERIS))
+    parser.add_argument("--ukuran", type=int, nargs="+", default=[0, 10000, 100000],
+                        help="jumlah bintang sintetis di samping rasi bintang bawaan")
+    parser.add_argument("--tick", type=int, default=30)
+    parser.add_argument("--ambang", type=float, default=0.25, help="toleransi regresi relatif (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=FILE_BASELINE)
+    parser.add_argument("--simpan-baseline", action="store_true")
+    parser.add_argument("--cache-latar", action="store_true", help="gambar peta lewat CacheLatarLangit")
+    parser.add_argument("--langkah", type=float, default=1.0, help="detik waktu langit per tick")
+    args = parser.parse_args()
+
+    dasar = buka_katalog(os.path.join(ROOT, "data", "rasi_bintang.csv"))
+    hasil = {}
+    print(f"{'mesin':<10}{'bintang':>8}" + "".join(f"{t:>10}" for t in TAHAP) + f"{'total':>10}  (ms, median)")
+    for nama_mesin in args.mesin:
+        for n in args.ukuran:
+            katalog = katalog_sintetis(n, dasar, np.random.default_rng(n))
+            median = ukur(nama_mesin, katalog, args.tick, args.cache_latar, args.langkah)
+            kunci = f"{nama_mesin}/{n}" + ("/cache-latar" if args.cache_latar else "")
+            hasil[kunci + (f"/langkah-{args.langkah:g}" if args.langkah != 1.0 else "")] = median
+            print(f"{nama_mesin:<10}{len(katalog.data):>8}" + "".join(f"{median[t]:10.2f}" for t in TAHAP)
+                  + f"{sum(median.values()):10.2f}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    # Kombinasi yang belum punya baseline di mesin ini menjadi baseline-nya (run pertama)
+    baru = {kunci: median for kunci, median in hasil.items() if args.simpan_baseline or kunci not in baseline}
+    if baru:
+        baseline.update(baru)
+        sementara = args.baseline + ".tmp"
+        with open(sementara, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(sementara, args.baseline)
+        print(f"Baseline untuk {', '.join(sorted(baru))} disimpan ke {args.baseline}")
+    if args.simpan_baseline:
+        return
+
+    regresi = []
+    for kunci, median in hasil.items():
+        if kunci in baru:
+            continue
+        for tahap, nilai in median.items():
+            acuan = baseline.get(kunci, {}).get(tahap)
+            if acuan is None:
+                continue
+            if nilai > acuan * (1.0 + args.ambang) and nilai - acuan > AMBANG_ABSOLUT_MS:
+                regresi.append(f"  {kunci} {tahap}: {acuan:.2f} -> {nilai:.2f} ms (+{(nilai / acuan - 1) * 100:.0f}%)")
+    if regresi:
+        print(f"REGRESI (> {args.ambang * 100:.0f}% terhadap baseline):")
+        print("\n".join(regresi))
+        sys.exit(1)
+    print("Tidak ada regresi terhadap baseline")
+
+if __name__ == "__main__":
+    main()
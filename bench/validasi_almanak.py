@@ -0,0 +1,90 @@
+# -------------------------------
+# Validasi almanak tervektorisasi terhadap ephem
+# -------------------------------
+# Waktu terbit/terbenam, transit dan fajar/senja hasil sidias.almanak dibandingkan
+# dengan next_rising/next_setting/next_transit ephem pada sampel hari × lokasi,
+# ditambah waktu yang dibutuhkan dua jalur untuk seluruh tabel.
+#
+#   python bench/validasi_almanak.py --tahun 2025 --lokasi 200
+
+import argparse
+import datetime
+import math
+import os
+import sys
+import time
+
+import ephem
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sidias.almanak import AMBANG, hitung_almanak
+
+JD_EPHEM = 2415020.0  # hari Julian tanggal ephem 0
+
+def peristiwa_ephem(lat, lon, jd, kolom):
+    # Peristiwa ephem pertama setelah (jd - 2 jam); hari Julian UT atau NaN
+    observer = ephem.Observer()
+    observer.lat, observer.lon = math.radians(lat), math.radians(lon)
+    observer.date = jd - JD_EPHEM - 1.0 / 12
+    matahari = ephem.Sun()
+    try:
+        if kolom == "transit":
+            return float(observer.next_transit(matahari)) + JD_EPHEM
+        for naik, turun, derajat in AMBANG:
+            if kolom in (naik, turun):
+                cari = observer.next_rising if kolom == naik else observer.next_setting
+                if derajat is None:
+                    return float(cari(matahari)) + JD_EPHEM
+                observer.horizon = math.radians(derajat)
+                observer.pressure = 0
+                return float(cari(matahari, use_center=True)) + JD_EPHEM
+    except (ephem.AlwaysUpError, ephem.NeverUpError):
+        return np.nan
+
+def main():
+    parser = argparse.ArgumentParser(description="Validasi almanak tervektorisasi terhadap ephem")
+    parser.add_argument("--tahun", type=int, default=2025)
+    parser.add_argument("--lokasi", type=int, default=200, help="jumlah lokasi acak (lintang -60..60)")
+    parser.add_argument("--sampel", type=int, default=400, help="pasangan hari × lokasi yang dicek ke ephem")
+    parser.add_argument("--batas", type=float, default=5.0, help="galat maksimum yang diterima (detik)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    lats = rng.uniform(-60, 60, args.lokasi)
+    lons = rng.uniform(-180, 180, args.lokasi)
+    awal = datetime.date(args.tahun, 1, 1)
+    hari = (datetime.date(args.tahun + 1, 1, 1) - awal).days
+
+    t0 = time.perf_counter()
+    hasil = hitung_almanak(lats, lons, awal, hari)
+    durasi = time.perf_counter() - t0
+    print(f"{args.lokasi} lokasi × {hari} hari: {durasi:.3f} s")
+
+    galat_maks = 0.0
+    t_ephem, n_ephem = 0.0, 0
+    for kolom, tabel in hasil.items():
+        galat = []
+        for _ in range(args.sampel // len(hasil)):
+            i, d = rng.integers(args.lokasi), rng.integers(hari)
+            jd = tabel[i, d]
+            if np.isnan(jd):
+                continue
+            t0 = time.perf_counter()
+            acuan = peristiwa_ephem(lats[i], lons[i], jd, kolom)
+            t_ephem += time.perf_counter() - t0
+            n_ephem += 1
+            galat.append(abs(acuan - jd) * 86400.0)
+        galat = np.array(galat)
+        galat_maks = max(galat_maks, galat.max())
+        print(f"  {kolom:<16} maks {galat.max():6.2f} s   rata-rata {galat.mean():5.2f} s")
+
+    per_peristiwa = t_ephem / n_ephem
+    print(f"Perkiraan jalur ephem (per peristiwa {per_peristiwa * 1e3:.2f} ms): "
+          f"{per_peristiwa * args.lokasi * hari * len(hasil):.1f} s")
+    if galat_maks > args.batas:
+        print(f"GAGAL: galat melebihi {args.batas} s")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
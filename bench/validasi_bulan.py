@@ -0,0 +1,62 @@
+# -------------------------------
+# Validasi posisi Bulan mesin efemeris terhadap ephem
+# -------------------------------
+# Grid lokasi × tanggal: galat maksimum posisi Bulan (sudut pisah alt/az), galat
+# fase dan kecepatan relatif posisi_batch mesin pilihan (default "numpy",
+# sidias.bulan) dibanding mesin "ephem".
+#
+#   python bench/validasi_bulan.py --tahun 2000 2030 --langkah-jam 13
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sidias.mesin import MESIN_EFEMERIS
+from validasi_matahari import pisah_sudut
+
+def main():
+    parser = argparse.ArgumentParser(description="Validasi posisi Bulan mesin efemeris terhadap ephem")
+    parser.add_argument("--mesin", default="numpy", choices=[m for m in MESIN_EFEMERIS if m != "ephem"])
+    parser.add_argument("--tahun", type=int, nargs=2, default=(2000, 2030))
+    parser.add_argument("--langkah-jam", type=float, default=13.0)
+    parser.add_argument("--langkah-lat", type=float, default=20.0)
+    parser.add_argument("--langkah-lon", type=float, default=45.0)
+    parser.add_argument("--batas", type=float, default=0.02, help="galat posisi maksimum yang diterima (derajat)")
+    parser.add_argument("--batas-fase", type=float, default=0.005, help="galat fase maksimum yang diterima")
+    args = parser.parse_args()
+
+    lat_grid, lon_grid = np.meshgrid(np.arange(-80, 80.1, args.langkah_lat), np.arange(-180, 180, args.langkah_lon))
+    lats, lons = lat_grid.ravel(), lon_grid.ravel()
+    awal = np.datetime64(f"{args.tahun[0]}-01-01")
+    akhir = np.datetime64(f"{args.tahun[1]}-01-01")
+    langkah = np.timedelta64(int(args.langkah_jam * 3600), "s")
+    waktu = np.arange(awal, akhir, langkah)
+    print(f"{len(waktu)} waktu × {len(lats)} lokasi = {len(waktu) * len(lats)} sampel")
+
+    hasil, durasi = {}, {}
+    for nama in ("ephem", args.mesin):
+        mesin = MESIN_EFEMERIS[nama]()
+        t0 = time.perf_counter()
+        posisi = mesin.posisi_batch(lats, lons, waktu)
+        durasi[nama] = time.perf_counter() - t0
+        hasil[nama] = posisi.az_bulan, posisi.alt_bulan, posisi.fase_bulan
+        print(f"  {nama:<10}{durasi[nama]:8.3f} s")
+
+    galat = pisah_sudut(*hasil["ephem"][:2], *hasil[args.mesin][:2])
+    galat_fase = np.abs(hasil["ephem"][2] - hasil[args.mesin][2])
+    di_atas = hasil["ephem"][1] > np.radians(-1.0)
+    print(f"Galat maks (semua)          : {galat.max():.5f}°")
+    print(f"Galat maks (alt > -1°)      : {galat[di_atas].max():.5f}°")
+    print(f"Galat rata-rata             : {galat.mean():.5f}°")
+    print(f"Galat fase maks / rata-rata : {galat_fase.max():.5f} / {galat_fase.mean():.5f}")
+    print(f"Percepatan                  : {durasi['ephem'] / durasi[args.mesin]:.1f}x")
+    if galat[di_atas].max() > args.batas or galat_fase.max() > args.batas_fase:
+        print(f"GAGAL: galat melebihi {args.batas}° / fase {args.batas_fase}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# -------------------------------
+# Validasi cache Chebyshev terhadap ephem
+# -------------------------------
+# Membandingkan sidias.chebyshev.CacheChebyshev dengan ephem pada hari-hari acak
+# (default 1950-2050, banyak sampel per hari seperti pemakaian batch) dan melaporkan
+# galat maksimum serta kecepatan, termasuk jalur skalar tick GUI (CacheChebyshev.posisi)
+# terhadap jalur batch dan terhadap ephem.Sun/Moon per panggilan.
+#
+#   python bench/validasi_chebyshev.py --hari 200 --per-hari 100
+
+import argparse
+import os
+import sys
+import time
+
+import ephem
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sidias.chebyshev import CacheChebyshev
+from sidias.efemeris import hitung_posisi_batch, posisi_geosentris, waktu_sideris_greenwich
+
+DETIK_BUSUR = 180 / np.pi * 3600
+
+def pisah_sudut(ra1, dec1, ra2, dec2):
+    # Sudut antara dua arah (atan2 dari cross/dot, stabil untuk sudut kecil)
+    a = np.stack([np.cos(dec1) * np.cos(ra1), np.cos(dec1) * np.sin(ra1), np.sin(dec1)], axis=-1)
+    b = np.stack([np.cos(dec2) * np.cos(ra2), np.cos(dec2) * np.sin(ra2), np.sin(dec2)], axis=-1)
+    return np.arctan2(np.linalg.norm(np.cross(a, b), axis=-1), np.sum(a * b, axis=-1))
+
+def main():
+    parser = argparse.ArgumentParser(description="Validasi cache Chebyshev terhadap ephem")
+    parser.add_argument("--hari", type=int, default=200)
+    parser.add_argument("--per-hari", type=int, default=100)
+    parser.add_argument("--dari", default="1950/1/1")
+    parser.add_argument("--sampai", default="2050/1/1")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    awal, akhir = float(ephem.Date(args.dari)), float(ephem.Date(args.sampai))
+    hari = np.floor(rng.uniform(awal, akhir, args.hari))
+    tanggal = (hari[:, np.newaxis] + rng.uniform(0, 1, (args.hari, args.per_hari))).ravel()
+
+    cache = CacheChebyshev()
+    t0 = time.perf_counter()
+    geo, gast = cache.posisi_geosentris(tanggal)
+    waktu_fit = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    cache.posisi_geosentris(tanggal)
+    waktu_cheb = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ref = posisi_geosentris(tanggal)
+    ref_gast = waktu_sideris_greenwich(tanggal)
+    waktu_ephem = time.perf_counter() - t0
+
+    print(f"{tanggal.size} sampel pada {args.hari} hari acak {args.dari} .. {args.sampai}")
+    for benda, label in (("sun", "Matahari"), ("moon", "Bulan")):
+        galat = pisah_sudut(geo["ra_" + benda], geo["dec_" + benda], ref["ra_" + benda], ref["dec_" + benda])
+        jarak = np.abs(geo["r_" + benda] / ref["r_" + benda] - 1)
+        print(f"  {label:<9} posisi maks {galat.max() * DETIK_BUSUR:.5f}\"  jarak relatif maks {jarak.max():.2e}")
+    galat_gast = np.abs(np.remainder(gast - ref_gast + np.pi, 2 * np.pi) - np.pi)
+    print(f"  GAST      maks {galat_gast.max() * DETIK_BUSUR:.5f}\"")
+    print(f"  fase      maks {np.abs(geo['fase'] - ref['fase']).max():.2e}")
+    print(f"  waktu: ephem {waktu_ephem:.3f} s, Chebyshev {waktu_cheb:.4f} s "
+          f"(fitting pertama {waktu_fit:.3f} s untuk {len(cache._segmen)} segmen)")
+
+    # Alt/az toposentris: satu hari per menit × beberapa lokasi
+    lats = rng.uniform(-60, 60, 20)
+    lons = rng.uniform(-180, 180, 20)
+    waktu = np.datetime64("2025-01-01") + np.arange(24 * 60) * np.timedelta64(1, "m")
+    a = hitung_posisi_batch(lats, lons, waktu)
+    b = cache.hitung_posisi_batch(lats, lons, waktu)
+    for label, (az1, alt1, az2, alt2) in (
+        ("Matahari", (a.az_matahari, a.alt_matahari, b.az_matahari, b.alt_matahari)),
+        ("Bulan", (a.az_bulan, a.alt_bulan, b.az_bulan, b.alt_bulan)),
+    ):
+        galat = pisah_sudut(-az1, alt1, -az2, alt2)
+        print(f"  {label:<9} alt/az toposentris maks {galat.max() * DETIK_BUSUR:.5f}\"")
+
+    # Jalur skalar (tick GUI) harus sama dengan jalur batch, dan lebih murah dari ephem
+    galat_skalar = 0.0
+    t_skalar = t_ephem = 0.0
+    for _ in range(200):
+        i, j = rng.integers(len(lats)), rng.integers(len(waktu))
+        t0 = time.perf_counter()
+        p = cache.posisi(lats[i], lons[i], waktu[j].item())
+        t_skalar += time.perf_counter() - t0
+        observer = ephem.Observer()
+        observer.lat, observer.lon, observer.date = np.radians(lats[i]), np.radians(lons[i]), waktu[j].item()
+        t0 = time.perf_counter()
+        matahari, bulan = ephem.Sun(observer), ephem.Moon(observer)  # dihitung malas saat atribut dibaca
+        matahari.az, matahari.alt, bulan.az, bulan.alt, bulan.moon_phase
+        t_ephem += time.perf_counter() - t0
+        for az, alt, az_b, alt_b in ((p.az_matahari, p.alt_matahari, b.az_matahari, b.alt_matahari),
+                                     (p.az_bulan, p.alt_bulan, b.az_bulan, b.alt_bulan)):
+            galat_skalar = max(galat_skalar, pisah_sudut(-az, alt, -az_b[j, i], alt_b[j, i]))
+    print(f"  skalar    maks {galat_skalar * DETIK_BUSUR:.5f}\" terhadap batch; "
+          f"{t_skalar / 200 * 1e6:.1f} µs per posisi (ephem.Sun + Moon {t_ephem / 200 * 1e6:.1f} µs)")
+
+if __name__ == "__main__":
+    main()
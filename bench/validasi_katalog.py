@@ -0,0 +1,134 @@
+# -------------------------------
+# Validasi transformasi & indeks katalog bintang
+# -------------------------------
+# Dua pemeriksaan untuk jalur katalog vektor (sidias.efemeris.TransformasiKatalog dan
+# sidias.indeks_langit.IndeksLangit):
+#   1. alt/az TransformasiKatalog.altaz dibanding ephem.FixedBody (epoch J2000) untuk
+#      bintang, lokasi, dan waktu acak; galat maksimum di atas --alt-min. Bintang dalam
+#      --elongasi-min dari Matahari dilewati: ephem menambahkan defleksi cahaya oleh
+#      Matahari (~0.1" pada 5°, beberapa detik busur di tepinya), jalur vektor tidak.
+#   2. hasil IndeksLangit.kerucut dibanding pencarian brute force (semua bintang) pada
+#      kerucut acak di atas katalog sintetis; jumlah baris yang berbeda harus 0.
+#
+#   python bench/validasi_katalog.py --observer 50 --bintang 200
+#   python bench/validasi_katalog.py --kerucut 200 --n-indeks 200000
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import ephem
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sidias.efemeris import TransformasiKatalog, buat_observer
+from sidias.indeks_langit import IndeksLangit
+from sidias.katalog import DTYPE_KATALOG, Katalog
+
+DETIK_BUSUR = 180 / np.pi * 3600
+
+def pisah_sudut(az1, alt1, az2, alt2):
+    a = np.stack([np.cos(alt1) * np.cos(az1), np.cos(alt1) * np.sin(az1), np.sin(alt1)], axis=-1)
+    b = np.stack([np.cos(alt2) * np.cos(az2), np.cos(alt2) * np.sin(az2), np.sin(alt2)], axis=-1)
+    return np.arctan2(np.linalg.norm(np.cross(a, b), axis=-1), np.sum(a * b, axis=-1))
+
+def katalog_acak(n, rng):
+    # Bintang merata di bola langit, magnitudo -1.5 .. 12 (sebagian tanpa magnitudo)
+    data = np.empty(n, dtype=DTYPE_KATALOG)
+    data["ra"] = rng.uniform(0, 2 * np.pi, n)
+    data["dec"] = np.arcsin(rng.uniform(-1, 1, n))
+    data["mag"] = rng.uniform(-1.5, 12.0, n)
+    data["mag"][rng.uniform(0, 1, n) < 0.01] = np.nan
+    data["nama"] = -1
+    return Katalog(data, [])
+
+def cek_fixedbody(args, rng):
+    katalog = katalog_acak(args.bintang, rng)
+    transformasi = TransformasiKatalog(katalog)
+    awal, akhir = float(ephem.Date(args.dari)), float(ephem.Date(args.sampai))
+    galat_semua = []
+    for _ in range(args.observer):
+        observer = buat_observer(rng.uniform(-80, 80), rng.uniform(-180, 180))
+        observer.date = rng.uniform(awal, akhir)
+        az, alt = transformasi.altaz(observer)
+        az_ref, alt_ref, elongasi = np.empty_like(az), np.empty_like(alt), np.empty_like(az)
+        matahari = ephem.Sun(observer)
+        for i, bintang in enumerate(katalog.data):
+            benda = ephem.FixedBody()
+            benda._ra, benda._dec, benda._epoch = float(bintang["ra"]), float(bintang["dec"]), ephem.J2000
+            benda.compute(observer)
+            az_ref[i], alt_ref[i] = benda.az, benda.alt
+            elongasi[i] = ephem.separation(benda, matahari)
+        di_atas = (alt_ref > math.radians(args.alt_min)) & (elongasi > math.radians(args.elongasi_min))
+        galat_semua.append(pisah_sudut(az, alt, az_ref, alt_ref)[di_atas])
+    galat = np.concatenate(galat_semua) * DETIK_BUSUR
+    print(f"FixedBody: {args.observer} observer × {args.bintang} bintang, {galat.size} di atas {args.alt_min}° "
+          f"dan > {args.elongasi_min}° dari Matahari")
+    print(f"  galat maks   : {galat.max():.3f}″")
+    print(f"  galat median : {np.median(galat):.3f}″")
+    if galat.max() > args.batas_detik:
+        print(f"GAGAL: galat melebihi {args.batas_detik}″")
+        return False
+    return True
+
+def cek_kerucut(args, rng):
+    katalog = katalog_acak(args.n_indeks, rng)
+    vektor = np.stack([np.cos(katalog.data["dec"]) * np.cos(katalog.data["ra"]),
+                       np.cos(katalog.data["dec"]) * np.sin(katalog.data["ra"]),
+                       np.sin(katalog.data["dec"])], axis=-1).astype(float)
+    mag = katalog.data["mag"].astype(float)
+    t0 = time.perf_counter()
+    indeks = IndeksLangit(vektor, mag)
+    waktu_bangun = time.perf_counter() - t0
+
+    beda = 0
+    waktu_indeks = waktu_brute = 0.0
+    for _ in range(args.kerucut):
+        sumbu = rng.normal(size=3)
+        sumbu /= np.linalg.norm(sumbu)
+        radius = rng.uniform(0.001, np.pi)
+        batas_mag = None if rng.uniform() < 0.3 else rng.uniform(0.0, 12.0)
+        t0 = time.perf_counter()
+        hasil = indeks.kerucut(sumbu, radius, batas_mag)
+        waktu_indeks += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        cocok = vektor @ sumbu >= math.cos(radius)
+        if batas_mag is not None:
+            cocok &= np.nan_to_num(mag, nan=np.inf) <= batas_mag
+        acuan = np.nonzero(cocok)[0]
+        waktu_brute += time.perf_counter() - t0
+        beda += np.setxor1d(hasil, acuan).size
+    print(f"Kerucut: {args.kerucut} kerucut acak atas {args.n_indeks} bintang "
+          f"(bangun indeks {waktu_bangun * 1000:.0f} ms)")
+    print(f"  baris berbeda dari brute force : {beda}")
+    print(f"  rata-rata per kueri            : indeks {waktu_indeks / args.kerucut * 1000:.2f} ms, "
+          f"brute force {waktu_brute / args.kerucut * 1000:.2f} ms")
+    if beda:
+        print("GAGAL: hasil indeks berbeda dari brute force")
+        return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Validasi transformasi & indeks katalog bintang")
+    parser.add_argument("--observer", type=int, default=50)
+    parser.add_argument("--bintang", type=int, default=200)
+    parser.add_argument("--dari", default="1950/1/1")
+    parser.add_argument("--sampai", default="2050/1/1")
+    parser.add_argument("--alt-min", type=float, default=5.0, help="altitude minimum yang dibandingkan (derajat)")
+    parser.add_argument("--elongasi-min", type=float, default=5.0, help="jarak minimum dari Matahari (derajat)")
+    parser.add_argument("--batas-detik", type=float, default=0.7, help="galat maksimum yang diterima (detik busur)")
+    parser.add_argument("--kerucut", type=int, default=200)
+    parser.add_argument("--n-indeks", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    lulus = cek_fixedbody(args, rng)
+    lulus = cek_kerucut(args, rng) and lulus
+    if not lulus:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# -------------------------------
+# Validasi posisi Matahari mesin efemeris terhadap ephem
+# -------------------------------
+# Grid padat lokasi × tanggal: galat maksimum posisi Matahari (sudut pisah alt/az)
+# dari posisi_batch mesin pilihan (default "numpy", sidias.matahari) dibanding mesin
+# "ephem", plus kecepatan relatif (posisi_batch menghitung Matahari dan Bulan).
+#
+#   python bench/validasi_matahari.py --tahun 2000 2030 --langkah-jam 7
+#   python bench/validasi_matahari.py --mesin chebyshev --batas 0.0001
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sidias.mesin import MESIN_EFEMERIS
+
+def pisah_sudut(az1, alt1, az2, alt2):
+    a = np.stack([np.cos(alt1) * np.cos(az1), np.cos(alt1) * np.sin(az1), np.sin(alt1)], axis=-1)
+    b = np.stack([np.cos(alt2) * np.cos(az2), np.cos(alt2) * np.sin(az2), np.sin(alt2)], axis=-1)
+    return np.degrees(np.arctan2(np.linalg.norm(np.cross(a, b), axis=-1), np.sum(a * b, axis=-1)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Validasi posisi Matahari mesin efemeris terhadap ephem")
+    parser.add_argument("--mesin", default="numpy", choices=[m for m in MESIN_EFEMERIS if m != "ephem"])
+    parser.add_argument("--tahun", type=int, nargs=2, default=(2000, 2030))
+    parser.add_argument("--langkah-jam", type=float, default=7.0)
+    parser.add_argument("--langkah-lat", type=float, default=10.0)
+    parser.add_argument("--langkah-lon", type=float, default=30.0)
+    parser.add_argument("--batas", type=float, default=0.01, help="galat maksimum yang diterima (derajat)")
+    args = parser.parse_args()
+
+    lat_grid, lon_grid = np.meshgrid(np.arange(-80, 80.1, args.langkah_lat), np.arange(-180, 180, args.langkah_lon))
+    lats, lons = lat_grid.ravel(), lon_grid.ravel()
+    awal = np.datetime64(f"{args.tahun[0]}-01-01")
+    akhir = np.datetime64(f"{args.tahun[1]}-01-01")
+    langkah = np.timedelta64(int(args.langkah_jam * 3600), "s")
+    waktu = np.arange(awal, akhir, langkah)
+    print(f"{len(waktu)} waktu × {len(lats)} lokasi = {len(waktu) * len(lats)} sampel")
+
+    hasil, durasi = {}, {}
+    for nama in ("ephem", args.mesin):
+        mesin = MESIN_EFEMERIS[nama]()
+        t0 = time.perf_counter()
+        posisi = mesin.posisi_batch(lats, lons, waktu)
+        durasi[nama] = time.perf_counter() - t0
+        hasil[nama] = posisi.az_matahari, posisi.alt_matahari
+        print(f"  {nama:<10}{durasi[nama]:8.3f} s")
+
+    galat = pisah_sudut(*hasil["ephem"], *hasil[args.mesin])
+    di_atas = hasil["ephem"][1] > np.radians(-1.0)
+    print(f"Galat maks (semua)          : {galat.max():.5f}°")
+    print(f"Galat maks (alt > -1°)      : {galat[di_atas].max():.5f}°")
+    print(f"Galat rata-rata             : {galat.mean():.5f}°")
+    print(f"Percepatan                  : {durasi['ephem'] / durasi[args.mesin]:.1f}x")
+    if galat[di_atas].max() > args.batas:
+        print(f"GAGAL: galat melebihi {args.batas}°")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# Si-DiAs: pustaka perhitungan langit yang dipakai oleh Si-DiAs.py.
+# Sengaja kosong agar `import sidias` tetap ringan; impor submodul sesuai kebutuhan.
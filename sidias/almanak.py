@@ -0,0 +1,230 @@
+# -------------------------------
+# Si-DiAs: almanak Matahari setahun untuk banyak lokasi
+# -------------------------------
+# Terbit, transit, terbenam dan fajar/senja sipil, nautika, astronomi untuk tiap
+# hari × lokasi. Alih-alih next_rising/next_setting per hari (730+ pencarian akar
+# per lokasi), ketinggian Matahari dihitung sekali pada grid waktu (default tiap
+# jam) untuk sepotong lokasi sekaligus; akar dikurung dari pergantian tanda lalu
+# diperhalus beberapa iterasi regula falsi yang juga tervektorisasi. RA/Dec dan
+# waktu sideris grid hanya bergantung pada waktu, jadi dihitung sekali untuk semua
+# potongan lokasi (sidias.matahari).
+#
+# Peristiwa yang naik-turun dua kali di dalam satu langkah grid (Matahari nyaris
+# menyinggung ambang di lintang tinggi) bisa terlewat; perkecil --langkah-menit.
+#
+#   python -m sidias.almanak --tahun 2025 --lokasi kota.csv --keluaran almanak.csv
+#   python -m sidias.almanak --tahun 2025 --koordinat -6.2 106.8166 --keluaran jakarta.csv
+#
+# File lokasi: CSV dengan kolom nama, lat, lon dan (opsional) zona = selisih jam
+# waktu lokal terhadap UTC; default round(lon / 15), mis. 7 untuk WIB.
+
+import argparse
+import csv
+import datetime
+import os
+import time
+
+import numpy as np
+
+from sidias.efemeris import SUHU_DEFAULT, TEKANAN_DEFAULT, _unrefraksi
+from sidias.matahari import PARALAKS_MATAHARI, hari_julian, posisi_ekuatorial_matahari, waktu_sideris_semu
+
+SEMIDIAMETER_MATAHARI = np.radians(0.2666)  # pada 1 AU
+LANGKAH_MENIT = 60.0
+ITERASI = 4
+POTONGAN = 64  # lokasi per potongan grid (batas memori ~ hari × 24 × POTONGAN × 8 byte per array)
+
+# (kolom saat Matahari naik, kolom saat turun, ketinggian pusat Matahari, derajat).
+# None: terbit/terbenam, tepi atas tampak menyentuh horizon (refraksi model ephem
+# pada 1010 mBar, 15 °C, sama dengan next_rising/next_setting di aplikasi).
+AMBANG = (
+    ("fajar_astronomi", "senja_astronomi", -18.0),
+    ("fajar_nautika", "senja_nautika", -12.0),
+    ("fajar_sipil", "senja_sipil", -6.0),
+    ("terbit", "terbenam", None),
+)
+KOLOM = ("fajar_astronomi", "fajar_nautika", "fajar_sipil", "terbit", "transit",
+         "terbenam", "senja_sipil", "senja_nautika", "senja_astronomi")
+
+def zona_default(lon):
+    return np.round(np.asarray(lon, dtype=float) / 15.0)
+
+def _sin_ambang(derajat, jarak):
+    # Ketinggian geosentris pusat Matahari saat peristiwa; paralaks menaikkannya ~8.8"
+    if derajat is None:
+        semu = -np.atleast_1d(SEMIDIAMETER_MATAHARI / jarak)
+        h0 = _unrefraksi(semu.ravel(), TEKANAN_DEFAULT, SUHU_DEFAULT).reshape(semu.shape)
+    else:
+        h0 = np.radians(derajat)
+    return np.sin(h0 + PARALAKS_MATAHARI / jarak)
+
+def _perhalus(fungsi, t0, t1, f0, f1, iterasi=ITERASI):
+    # Regula falsi pada kurung [t0, t1] (f0, f1 berlawanan tanda) untuk semua akar sekaligus
+    for _ in range(iterasi):
+        t = t0 - f0 * (t1 - t0) / (f1 - f0)
+        f = fungsi(t)
+        kiri = (f < 0) == (f0 < 0)
+        t0, f0 = np.where(kiri, t, t0), np.where(kiri, f, f0)
+        t1, f1 = np.where(kiri, t1, t), np.where(kiri, f1, f)
+    return t0 - f0 * (t1 - t0) / (f1 - f0)
+
+def ambang_ketinggian(derajat):
+    # Fungsi ambang (lat, dec, jarak) -> sin ketinggian geosentris untuk ketinggian tetap
+    return lambda lat, dec, jarak: _sin_ambang(derajat, jarak)
+
+class GridMatahari:
+    # Posisi ekuatorial Matahari pada grid waktu, dipakai bersama semua potongan lokasi
+    def __init__(self, tanggal_awal, jumlah_hari, langkah_menit=LANGKAH_MENIT):
+        self.jd0 = float(hari_julian(np.datetime64(tanggal_awal, "D")))
+        self.jumlah_hari = jumlah_hari
+        # Satu hari ekstra di kedua sisi: hari lokal bergeser menurut zona
+        self.langkah = langkah_menit / 1440.0
+        self.jd = self.jd0 - 1.0 + np.arange(int(round((jumlah_hari + 2) / self.langkah)) + 1) * self.langkah
+        ra, dec, jarak, omega, eps = posisi_ekuatorial_matahari(self.jd)
+        # Di dalam satu langkah RA, Dec dan waktu sideris (tanpa lompatan 2π) nyaris
+        # linear (galat interpolasi per jam << 0.1"), jadi iterasi akar cukup menginterpolasi grid
+        self.ra = np.unwrap(ra)[:, np.newaxis]
+        self.dec = dec[:, np.newaxis]
+        self.jarak = jarak[:, np.newaxis]
+        self.gast = np.unwrap(waktu_sideris_semu(self.jd, omega, eps))[:, np.newaxis]
+
+    def potongan(self, lats, lons, zona=None):
+        return PotonganLokasi(self, lats, lons, zona)
+
+    def hitung(self, lats, lons, zona=None):
+        # {kolom: array (n_lokasi, jumlah_hari) hari Julian UT}, NaN bila peristiwa tidak terjadi
+        potongan = self.potongan(lats, lons, zona)
+        hasil = {}
+        for naik, turun, derajat in AMBANG:
+            hasil[naik] = potongan.peristiwa(ambang_ketinggian(derajat), naik=True)
+            hasil[turun] = potongan.peristiwa(ambang_ketinggian(derajat), naik=False)
+        hasil["transit"] = potongan.transit()
+        return hasil
+
+class PotonganLokasi:
+    # Sepotong lokasi pada GridMatahari: ketinggian grid dihitung sekali lalu dipakai
+    # semua peristiwa (ambang ketinggian tetap maupun yang bergantung Dec, mis. Ashar)
+    def __init__(self, grid, lats, lons, zona=None):
+        self.grid = grid
+        self.lat = np.radians(np.atleast_1d(np.asarray(lats, dtype=float)))
+        self.lon = np.radians(np.atleast_1d(np.asarray(lons, dtype=float)))
+        if self.lat.shape != self.lon.shape:
+            raise ValueError("lats dan lons harus berukuran sama")
+        self.zona = (zona_default(lons) if zona is None
+                     else np.broadcast_to(np.asarray(zona, dtype=float), self.lat.shape))
+        self.sudut_jam = grid.gast + self.lon - grid.ra
+        self.sin_h = (np.sin(self.lat) * np.sin(grid.dec)
+                      + np.cos(self.lat) * np.cos(grid.dec) * np.cos(self.sudut_jam))
+
+    def peristiwa(self, ambang, naik):
+        # Saat Matahari melewati ambang(lat, dec, jarak) (sin ketinggian) ke atas bila
+        # naik, ke bawah bila tidak; ambang dievaluasi ulang di tiap iterasi akar
+        f = self.sin_h - ambang(self.lat, self.grid.dec, self.grid.jarak)
+        tanda = (f[:-1] < 0) & (f[1:] >= 0) if naik else (f[:-1] >= 0) & (f[1:] < 0)
+
+        def fungsi(t, i, j):
+            sin_h, _, dec, jarak = self._pada(t, i, j)
+            return sin_h - ambang(self.lat[j], dec, jarak)
+        return self._akar(fungsi, f, tanda)
+
+    def transit(self):
+        sin_jam = np.sin(self.sudut_jam)
+        tanda = (sin_jam[:-1] < 0) & (sin_jam[1:] >= 0) & (np.cos(self.sudut_jam[:-1]) > 0)
+        return self._akar(lambda t, i, j: np.sin(self._pada(t, i, j)[1]), sin_jam, tanda)
+
+    def _pada(self, t, i, j):
+        # sin(ketinggian), sudut jam, Dec dan jarak pada waktu t di dalam langkah grid i, lokasi j
+        grid = self.grid
+        f = (t - grid.jd[i]) / grid.langkah
+
+        def antara(nilai):
+            return nilai[i, 0] + (nilai[i + 1, 0] - nilai[i, 0]) * f
+        dec = antara(grid.dec)
+        sudut_jam = antara(grid.gast) + self.lon[j] - antara(grid.ra)
+        lat = self.lat[j]
+        sin_h = np.sin(lat) * np.sin(dec) + np.cos(lat) * np.cos(dec) * np.cos(sudut_jam)
+        return sin_h, sudut_jam, dec, antara(grid.jarak)
+
+    def _akar(self, fungsi, f, tanda):
+        # Perhalus akar dari semua kurung bertanda lalu kelompokkan per hari lokal;
+        # bila dua peristiwa jatuh pada hari yang sama, yang pertama dipakai.
+        # fungsi(t, i, j): nilai f pada waktu t untuk langkah grid i dan lokasi j
+        grid = self.grid
+        i, j = np.nonzero(tanda)
+        jd = _perhalus(lambda t: fungsi(t, i, j), grid.jd[i], grid.jd[i + 1], f[i, j], f[i + 1, j])
+        hari = np.floor(jd - grid.jd0 + self.zona[j] / 24.0).astype(int)
+        dalam = (hari >= 0) & (hari < grid.jumlah_hari)
+        tabel = np.full((len(self.lat), grid.jumlah_hari), np.inf)
+        np.minimum.at(tabel, (j[dalam], hari[dalam]), jd[dalam])
+        tabel[np.isinf(tabel)] = np.nan
+        return tabel
+
+def hitung_almanak(lats, lons, tanggal_awal, jumlah_hari, zona=None, langkah_menit=LANGKAH_MENIT):
+    return GridMatahari(tanggal_awal, jumlah_hari, langkah_menit).hitung(lats, lons, zona)
+
+# "HH:MM:SS" untuk tiap detik dalam sehari; format jam cukup berupa pengindeksan
+TEKS_JAM = np.array([f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)] + [""], dtype=object)
+
+def jam_lokal(jd, jd0, zona):
+    # "HH:MM:SS" waktu lokal (dibulatkan ke detik), "" untuk NaN
+    detik = np.round(((jd - jd0) * 86400.0 + zona * 3600.0) % 86400.0) % 86400.0
+    return TEKS_JAM[np.where(np.isnan(detik), 86400, np.nan_to_num(detik)).astype(int)]
+
+def tulis_almanak_csv(lokasi, tanggal_awal, jumlah_hari, path, langkah_menit=LANGKAH_MENIT, potongan=POTONGAN):
+    # lokasi: daftar (nama, lat, lon, zona atau None). Baris ditulis per potongan
+    # lokasi, jadi memori tidak tumbuh dengan jumlah lokasi. Hasil: jumlah baris.
+    grid = GridMatahari(tanggal_awal, jumlah_hari, langkah_menit)
+    tanggal = [(tanggal_awal + datetime.timedelta(days=d)).isoformat() for d in range(jumlah_hari)]
+    jumlah = 0
+    sementara = path + ".tmp"
+    with open(sementara, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.writer(f)
+        penulis.writerow(("nama", "lat", "lon", "zona", "tanggal") + KOLOM)
+        for awal in range(0, len(lokasi), potongan):
+            bagian = lokasi[awal:awal + potongan]
+            lats = np.array([l[1] for l in bagian], dtype=float)
+            lons = np.array([l[2] for l in bagian], dtype=float)
+            zona = np.array([zona_default(l[2]) if l[3] is None else l[3] for l in bagian], dtype=float)
+            hasil = grid.hitung(lats, lons, zona)
+            jam = [jam_lokal(hasil[k], grid.jd0, zona[:, np.newaxis]) for k in KOLOM]
+            for n, (nama, lat, lon, _) in enumerate(bagian):
+                kepala = (nama, lat, lon, f"{zona[n]:g}")
+                penulis.writerows(kepala + (tanggal[d],) + tuple(k[n, d] for k in jam) for d in range(jumlah_hari))
+            jumlah += len(bagian) * jumlah_hari
+    os.replace(sementara, path)
+    return jumlah
+
+def baca_lokasi(path_csv):
+    with open(path_csv, newline="", encoding="utf-8") as f:
+        return [(baris.get("nama") or f"{baris['lat']},{baris['lon']}", float(baris["lat"]), float(baris["lon"]),
+                 float(baris["zona"]) if baris.get("zona") else None)
+                for baris in csv.DictReader(f)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tabel terbit/terbenam, transit dan fajar/senja Matahari ke CSV")
+    sumber = parser.add_mutually_exclusive_group(required=True)
+    sumber.add_argument("--lokasi", help="CSV berkolom nama, lat, lon[, zona]")
+    sumber.add_argument("--koordinat", type=float, nargs=2, metavar=("LAT", "LON"), help="satu lokasi")
+    parser.add_argument("--zona", type=float, default=None, help="zona waktu untuk --koordinat (jam dari UTC)")
+    parser.add_argument("--tahun", type=int, default=datetime.date.today().year)
+    parser.add_argument("--mulai", type=datetime.date.fromisoformat, help="tanggal awal (menggantikan --tahun)")
+    parser.add_argument("--hari", type=int, help="jumlah hari (default: satu tahun)")
+    parser.add_argument("--langkah-menit", type=float, default=LANGKAH_MENIT)
+    parser.add_argument("--potongan", type=int, default=POTONGAN)
+    parser.add_argument("--keluaran", default="almanak.csv")
+    args = parser.parse_args(argv)
+
+    if args.lokasi:
+        lokasi = baca_lokasi(args.lokasi)
+    else:
+        lokasi = [("lokasi", args.koordinat[0], args.koordinat[1], args.zona)]
+    mulai = args.mulai or datetime.date(args.tahun, 1, 1)
+    hari = args.hari or (365 if args.mulai else (datetime.date(args.tahun + 1, 1, 1) - mulai).days)
+
+    t0 = time.perf_counter()
+    baris = tulis_almanak_csv(lokasi, mulai, hari, args.keluaran, args.langkah_menit, args.potongan)
+    print(f"{baris} baris ({len(lokasi)} lokasi × {hari} hari) ditulis ke {args.keluaran} "
+          f"dalam {time.perf_counter() - t0:.2f} s")
+
+if __name__ == "__main__":
+    main()
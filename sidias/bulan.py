@@ -0,0 +1,194 @@
+# -------------------------------
+# Si-DiAs: mesin posisi Bulan murni NumPy
+# -------------------------------
+# Deret ELP-2000/82 yang dipotong (Meeus, Astronomical Algorithms bab 47: suku
+# bujur/jarak >= ~0.0003° dan lintang >= ~0.001°), tervektorisasi untuk array
+# waktu × lokasi. Semua suku dievaluasi sekaligus sebagai satu perkalian matriks
+# argumen (n_suku × n_waktu). Paralaks toposentris dan refraksi memakai fungsi yang
+# sama dengan jalur ephem, fase = fraksi piringan yang tersinari (moon_phase ephem).
+# Amplop galat terhadap ephem 2000-2030 (bench/validasi_bulan.py): posisi maks ~0.008°
+# di atas horizon (rata-rata ~0.0015°), fase maks ~0.0025.
+#
+# Dipakai lewat mesin efemeris "numpy" (sidias.mesin, SIDIAS_MESIN=numpy).
+
+import numpy as np
+
+from sidias.efemeris import (
+    SUHU_DEFAULT, TEKANAN_DEFAULT, ekuatorial_ke_horizontal, paralaks_toposentris, refraksi,
+)
+from sidias.matahari import DELTA_T, hari_julian, posisi_ekuatorial_matahari, waktu_sideris_semu
+
+KM_PER_AU = 149597870.7
+
+# Tabel 47.A: kelipatan D, M, M', F; bujur (1e-6 derajat); jarak (1e-3 km)
+SUKU_BUJUR_JARAK = np.array([
+    [0, 0, 1, 0, 6288774, -20905355],
+    [2, 0, -1, 0, 1274027, -3699111],
+    [2, 0, 0, 0, 658314, -2955968],
+    [0, 0, 2, 0, 213618, -569925],
+    [0, 1, 0, 0, -185116, 48888],
+    [0, 0, 0, 2, -114332, -3149],
+    [2, 0, -2, 0, 58793, 246158],
+    [2, -1, -1, 0, 57066, -152138],
+    [2, 0, 1, 0, 53322, -170733],
+    [2, -1, 0, 0, 45758, -204586],
+    [0, 1, -1, 0, -40923, -129620],
+    [1, 0, 0, 0, -34720, 108743],
+    [0, 1, 1, 0, -30383, 104755],
+    [2, 0, 0, -2, 15327, 10321],
+    [0, 0, 1, 2, -12528, 0],
+    [0, 0, 1, -2, 10980, 79661],
+    [4, 0, -1, 0, 10675, -34782],
+    [0, 0, 3, 0, 10034, -23210],
+    [4, 0, -2, 0, 8548, -21636],
+    [2, 1, -1, 0, -7888, 24208],
+    [2, 1, 0, 0, -6766, 30824],
+    [1, 0, -1, 0, -5163, -8379],
+    [1, 1, 0, 0, 4987, -16675],
+    [2, -1, 1, 0, 4036, -12831],
+    [2, 0, 2, 0, 3994, -10445],
+    [4, 0, 0, 0, 3861, -11650],
+    [2, 0, -3, 0, 3665, 14403],
+    [0, 1, -2, 0, -2689, -7003],
+    [2, 0, -1, 2, -2602, 0],
+    [2, -1, -2, 0, 2390, 10056],
+    [1, 0, 1, 0, -2348, 6322],
+    [2, -2, 0, 0, 2236, -9884],
+    [0, 1, 2, 0, -2120, 5751],
+    [0, 2, 0, 0, -2069, 0],
+    [2, -2, -1, 0, 2048, -4950],
+    [2, 0, 1, -2, -1773, 4130],
+    [2, 0, 0, 2, -1595, 0],
+    [4, -1, -1, 0, 1215, -3958],
+    [0, 0, 2, 2, -1110, 0],
+    [3, 0, -1, 0, -892, 3258],
+    [2, 1, 1, 0, -810, 2616],
+    [4, -1, -2, 0, 759, -1897],
+    [0, 2, -1, 0, -713, -2117],
+    [2, 2, -1, 0, -700, 2354],
+    [2, 1, -2, 0, 691, 0],
+    [2, -1, 0, -2, 596, 0],
+    [4, 0, 1, 0, 549, -1423],
+    [0, 0, 4, 0, 537, -1117],
+    [4, -1, 0, 0, 520, -1571],
+    [1, 0, -2, 0, -487, -1739],
+    [2, 1, 0, -2, -399, 0],
+    [0, 0, 2, -2, -381, -4421],
+    [1, 1, 1, 0, 351, 0],
+    [3, 0, -2, 0, -340, 0],
+    [4, 0, -3, 0, 330, 0],
+    [2, -1, 2, 0, 327, 0],
+    [0, 2, 1, 0, -323, 1165],
+    [1, 1, -1, 0, 299, 0],
+    [2, 0, 3, 0, 294, 0],
+    [2, 0, -1, -2, 0, 8752],
+], dtype=float)
+
+# Tabel 47.B: kelipatan D, M, M', F; lintang (1e-6 derajat)
+SUKU_LINTANG = np.array([
+    [0, 0, 0, 1, 5128122],
+    [0, 0, 1, 1, 280602],
+    [0, 0, 1, -1, 277693],
+    [2, 0, 0, -1, 173237],
+    [2, 0, -1, 1, 55413],
+    [2, 0, -1, -1, 46271],
+    [2, 0, 0, 1, 32573],
+    [0, 0, 2, 1, 17198],
+    [2, 0, 1, -1, 9266],
+    [0, 0, 2, -1, 8822],
+    [2, -1, 0, -1, 8216],
+    [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200],
+    [2, 1, 0, -1, -3359],
+    [2, -1, -1, 1, 2463],
+    [2, -1, 0, 1, 2211],
+    [2, -1, -1, -1, 2065],
+    [0, 1, -1, -1, -1870],
+    [4, 0, -1, -1, 1828],
+    [0, 1, 0, 1, -1794],
+    [0, 0, 0, 3, -1749],
+    [0, 1, -1, 1, -1565],
+    [1, 0, 0, 1, -1491],
+    [0, 1, 1, 1, -1475],
+    [0, 1, 1, -1, -1410],
+    [0, 1, 0, -1, -1344],
+    [1, 0, 0, -1, -1335],
+    [0, 0, 3, 1, 1107],
+    [4, 0, 0, -1, 1021],
+    [4, 0, -1, 1, 833],
+], dtype=float)
+
+def _faktor_eksentrisitas(kelipatan_m, e):
+    # Suku yang memuat M dikalikan E (|M| = 1) atau E² (|M| = 2)
+    return np.where(np.abs(kelipatan_m)[:, np.newaxis] == 0, 1.0, e ** np.abs(kelipatan_m)[:, np.newaxis])
+
+def posisi_ekuatorial_bulan(jd):
+    # RA/Dec semu geosentris (radian) dan jarak (AU) untuk array hari Julian (UT),
+    # plus omega & eps (nutasi) agar pemanggil bisa memakai ulang untuk GAST
+    t = (np.asarray(jd, dtype=float) + DELTA_T / 86400.0 - 2451545.0) / 36525.0
+    l_ = 218.3164477 + t * (481267.88123421 + t * (-0.0015786 + t * (1 / 538841 - t / 65194000)))
+    d = 297.8501921 + t * (445267.1114034 + t * (-0.0018819 + t * (1 / 545868 - t / 113065000)))
+    m = 357.5291092 + t * (35999.0502909 + t * (-0.0001536 + t / 24490000))
+    m_ = 134.9633964 + t * (477198.8675055 + t * (0.0087414 + t * (1 / 69699 - t / 14712000)))
+    f = 93.2720950 + t * (483202.0175233 + t * (-0.0036539 + t * (-1 / 3526000 + t / 863310000)))
+    e = 1.0 - 0.002516 * t - 0.0000074 * t * t
+    dasar = np.radians(np.stack([d, m, m_, f]))  # (4, n_waktu)
+
+    arg = SUKU_BUJUR_JARAK[:, :4] @ dasar
+    faktor = _faktor_eksentrisitas(SUKU_BUJUR_JARAK[:, 1], e)
+    sigma_l = (SUKU_BUJUR_JARAK[:, 4:5] * faktor * np.sin(arg)).sum(axis=0)
+    sigma_r = (SUKU_BUJUR_JARAK[:, 5:6] * faktor * np.cos(arg)).sum(axis=0)
+    arg = SUKU_LINTANG[:, :4] @ dasar
+    faktor = _faktor_eksentrisitas(SUKU_LINTANG[:, 1], e)
+    sigma_b = (SUKU_LINTANG[:, 4:5] * faktor * np.sin(arg)).sum(axis=0)
+
+    # Suku tambahan Venus (A1), Jupiter (A2) dan pepatan Bumi (L')
+    a1 = np.radians(119.75 + 131.849 * t)
+    a2 = np.radians(53.09 + 479264.290 * t)
+    a3 = np.radians(313.45 + 481266.484 * t)
+    l_r, m_r, f_r = np.radians(l_), np.radians(m_), np.radians(f)
+    sigma_l += 3958 * np.sin(a1) + 1962 * np.sin(l_r - f_r) + 318 * np.sin(a2)
+    sigma_b += (-2235 * np.sin(l_r) + 382 * np.sin(a3) + 175 * np.sin(a1 - f_r)
+                + 175 * np.sin(a1 + f_r) + 127 * np.sin(l_r - m_r) - 115 * np.sin(l_r + m_r))
+
+    # Nutasi (suku utama) dan kemiringan ekliptika sejati
+    omega = np.radians(125.04452 - 1934.136261 * t)
+    l_matahari = np.radians(280.4665 + 36000.7698 * t)
+    delta_psi = (-17.20 * np.sin(omega) - 1.32 * np.sin(2 * l_matahari)
+                 - 0.23 * np.sin(2 * l_r) + 0.21 * np.sin(2 * omega)) / 3600.0
+    delta_eps = (9.20 * np.cos(omega) + 0.57 * np.cos(2 * l_matahari)
+                 + 0.10 * np.cos(2 * l_r) - 0.09 * np.cos(2 * omega)) / 3600.0
+    eps0 = 23.0 + (26.0 + (21.448 - t * (46.8150 + t * (0.00059 - t * 0.001813))) / 60.0) / 60.0
+    eps = np.radians(eps0 + delta_eps)
+
+    bujur = np.radians(l_ + sigma_l / 1e6 + delta_psi)
+    lintang = np.radians(sigma_b / 1e6)
+    jarak = (385000.56 + sigma_r / 1000.0) / KM_PER_AU
+
+    ra = np.mod(np.arctan2(np.sin(bujur) * np.cos(eps) - np.tan(lintang) * np.sin(eps), np.cos(bujur)), 2 * np.pi)
+    dec = np.arcsin(np.sin(lintang) * np.cos(eps) + np.cos(lintang) * np.sin(eps) * np.sin(bujur))
+    return ra, dec, jarak, omega, eps
+
+def fraksi_tersinari(ra_bulan, dec_bulan, jarak_bulan, ra_matahari, dec_matahari, jarak_matahari):
+    # Fraksi piringan Bulan yang tersinari (0 bulan baru .. 1 purnama) dari posisi geosentris
+    cos_psi = (np.sin(dec_matahari) * np.sin(dec_bulan)
+               + np.cos(dec_matahari) * np.cos(dec_bulan) * np.cos(ra_matahari - ra_bulan))
+    psi = np.arccos(np.clip(cos_psi, -1.0, 1.0))
+    sudut_fase = np.arctan2(jarak_matahari * np.sin(psi), jarak_bulan - jarak_matahari * cos_psi)
+    return (1.0 + np.cos(sudut_fase)) / 2.0
+
+def posisi_bulan_numpy(lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+    # Hasil (az, alt) radian berbentuk (n_waktu, n_lokasi) dan fase (n_waktu,)
+    lat = np.radians(np.atleast_1d(np.asarray(lats, dtype=float)))[np.newaxis, :]
+    lon = np.radians(np.atleast_1d(np.asarray(lons, dtype=float)))[np.newaxis, :]
+    if lat.shape != lon.shape:
+        raise ValueError("lats dan lons harus berukuran sama")
+    jd = np.atleast_1d(hari_julian(waktu))
+    ra, dec, jarak, omega, eps = posisi_ekuatorial_bulan(jd)
+    ra_m, dec_m, jarak_m, _, _ = posisi_ekuatorial_matahari(jd)
+    fase = fraksi_tersinari(ra, dec, jarak, ra_m, dec_m, jarak_m)
+    lst = waktu_sideris_semu(jd, omega, eps)[:, np.newaxis] + lon
+
+    ra_t, dec_t = paralaks_toposentris(ra[:, np.newaxis], dec[:, np.newaxis], jarak[:, np.newaxis], lst, lat)
+    az, alt = ekuatorial_ke_horizontal(ra_t, dec_t, lst, lat)
+    return az, refraksi(alt, tekanan, suhu), fase
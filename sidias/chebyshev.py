@@ -0,0 +1,189 @@
+# -------------------------------
+# Si-DiAs: cache efemeris polinomial Chebyshev
+# -------------------------------
+# Posisi geosentris semu Matahari & Bulan (vektor kartesian, AU), fase Bulan dan
+# waktu sideris Greenwich di-fit per segmen (default 1 hari) dengan deret Chebyshev
+# dari sampel ephem. Sesudahnya evaluasi hanya beberapa perkalian polinomial;
+# alt/az toposentris didapat dengan rotasi biasa (sidias.efemeris.proyeksi_toposentris).
+#
+# Batas galat terhadap ephem (diukur bench/validasi_chebyshev.py, 1950-2050,
+# segmen 1 hari, derajat default):
+#   posisi geosentris Matahari  < 0.0001"   (jarak relatif < 2e-7)
+#   posisi geosentris Bulan     < 0.001"    (jarak relatif < 2e-7)
+#   waktu sideris Greenwich     < 0.002"
+#   fase Bulan                  < 2e-6
+#   alt/az toposentris          < 0.005" terhadap hitung_posisi_batch
+# Jalur batch (posisi_geosentris, hitung_posisi_batch) memakai chebval NumPy. Jalur
+# skalar untuk tick GUI (posisi) memakai rekurensi Clenshaw atas koefisien list
+# Python, paralaks/alt-az lewat vektor dan refraksi_skalar, semuanya modul math:
+# ~20-25 µs per panggilan setelah segmen di-fit, dibanding ~40 µs ephem.Sun + Moon,
+# dan sama dengan jalur batch dalam 0.0001" (bench/validasi_chebyshev.py).
+
+import collections
+import datetime
+import math
+
+import ephem
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from sidias.efemeris import (
+    HasilBatch, PEPATAH_BUMI, RADIUS_BUMI_AU, TEKANAN_DEFAULT, SUHU_DEFAULT, ke_tanggal_ephem,
+    proyeksi_toposentris, refraksi_skalar,
+)
+
+DERAJAT_MATAHARI = 10
+DERAJAT_BULAN = 18
+DERAJAT_SIDERIS = 8
+DERAJAT_FASE = 18
+KECEPATAN_SIDERIS = 2 * math.pi * 1.00273790935  # radian per hari
+MAKS_SEGMEN = 4096  # ~11 tahun segmen harian, ± 2 MB
+
+# matahari/bulan/fase/gast: koefisien array untuk chebval; skalar: koefisien yang sama
+# sebagai list Python (matahari dan bulan per sumbu x, y, z) untuk jalur skalar
+Segmen = collections.namedtuple(
+    "Segmen", ["awal", "panjang", "matahari", "bulan", "fase", "gast0", "gast", "skalar"])
+
+def _simpul(derajat, awal, panjang):
+    # Titik Chebyshev (jenis pertama) di [-1, 1] dan padanannya dalam tanggal ephem
+    k = np.arange(2 * (derajat + 1))
+    x = np.cos(np.pi * (k + 0.5) / len(k))
+    return x, awal + (x + 1.0) * panjang / 2.0
+
+def _vektor(ra, dec, r):
+    return [r * math.cos(dec) * math.cos(ra), r * math.cos(dec) * math.sin(ra), r * math.sin(dec)]
+
+def _clenshaw(x, koef):
+    # Deret Chebyshev sum(c_k T_k(x)) untuk x float (rekurensi Clenshaw)
+    x2 = 2.0 * x
+    b1 = b2 = 0.0
+    for c in reversed(koef[1:]):
+        b1, b2 = c + x2 * b1 - b2, b1
+    return koef[0] + x * b1 - b2
+
+def _altaz_skalar(vx, vy, vz, sin_lst, cos_lst, sin_lat, cos_lat, rho_cos, rho_sin):
+    # Vektor geosentris -> (az, alt) toposentris tanpa refraksi, seperti
+    # paralaks_toposentris + ekuatorial_ke_horizontal tetapi untuk float
+    x = vx - rho_cos * cos_lst
+    y = vy - rho_cos * sin_lst
+    z = vz - rho_sin
+    r = math.sqrt(x * x + y * y + z * z)
+    sin_dec = z / r
+    cos_dec_cos_h = (x * cos_lst + y * sin_lst) / r
+    cos_dec_sin_h = (x * sin_lst - y * cos_lst) / r
+    alt = math.asin(max(-1.0, min(1.0, sin_lat * sin_dec + cos_lat * cos_dec_cos_h)))
+    az = math.atan2(-cos_dec_sin_h, sin_dec * cos_lat - cos_dec_cos_h * sin_lat)
+    return az % (2 * math.pi), alt
+
+class CacheChebyshev:
+    def __init__(self, panjang_segmen=1.0, maks_segmen=MAKS_SEGMEN):
+        self.panjang_segmen = panjang_segmen
+        self.maks_segmen = maks_segmen
+        self._segmen = collections.OrderedDict()  # nomor segmen -> Segmen (LRU)
+
+    # -------------------------------
+    # Fitting
+    # -------------------------------
+    def _fit(self, nomor):
+        awal = nomor * self.panjang_segmen
+        sun, moon = ephem.Sun(), ephem.Moon()
+
+        x, tanggal = _simpul(DERAJAT_MATAHARI, awal, self.panjang_segmen)
+        sampel = []
+        for d in tanggal:
+            sun.compute(d)
+            sampel.append(_vektor(sun.g_ra, sun.g_dec, sun.earth_distance))
+        koef_matahari = chebyshev.chebfit(x, np.array(sampel), DERAJAT_MATAHARI)
+
+        x, tanggal = _simpul(DERAJAT_BULAN, awal, self.panjang_segmen)
+        sampel, fase = [], []
+        for d in tanggal:
+            moon.compute(d)
+            sampel.append(_vektor(moon.g_ra, moon.g_dec, moon.earth_distance))
+            fase.append(moon.moon_phase)
+        koef_bulan = chebyshev.chebfit(x, np.array(sampel), DERAJAT_BULAN)
+        koef_fase = chebyshev.chebfit(x, np.array(fase), DERAJAT_FASE)
+
+        # Waktu sideris: fit sisa setelah dikurangi laju rata-rata agar tidak ada lompatan 2π
+        observer = ephem.Observer()
+        observer.lat = observer.lon = 0.0
+        observer.date = awal + self.panjang_segmen / 2.0
+        gast0 = float(observer.sidereal_time())
+        x, tanggal = _simpul(DERAJAT_SIDERIS, awal, self.panjang_segmen)
+        sisa = []
+        for d in tanggal:
+            observer.date = d
+            linear = gast0 + KECEPATAN_SIDERIS * (d - awal - self.panjang_segmen / 2.0)
+            sisa.append(math.remainder(float(observer.sidereal_time()) - linear, 2 * math.pi))
+        koef_gast = chebyshev.chebfit(x, np.array(sisa), DERAJAT_SIDERIS)
+
+        skalar = (koef_matahari.T.tolist(), koef_bulan.T.tolist(), koef_fase.tolist(), koef_gast.tolist())
+        return Segmen(awal, self.panjang_segmen, koef_matahari, koef_bulan, koef_fase, gast0, koef_gast, skalar)
+
+    def segmen(self, nomor):
+        seg = self._segmen.get(nomor)
+        if seg is None:
+            seg = self._fit(nomor)
+            self._segmen[nomor] = seg
+            if len(self._segmen) > self.maks_segmen:
+                self._segmen.popitem(last=False)
+        else:
+            self._segmen.move_to_end(nomor)
+        return seg
+
+    # -------------------------------
+    # Evaluasi
+    # -------------------------------
+    def posisi_geosentris(self, tanggal):
+        # Pengganti sidias.efemeris.posisi_geosentris + waktu_sideris_greenwich:
+        # hasil (geo, gast) untuk array tanggal ephem
+        tanggal = np.atleast_1d(np.asarray(tanggal, dtype=float))
+        nomor = np.floor(tanggal / self.panjang_segmen).astype(np.int64)
+        vektor_sun = np.empty((tanggal.size, 3))
+        vektor_moon = np.empty((tanggal.size, 3))
+        fase = np.empty(tanggal.size)
+        gast = np.empty(tanggal.size)
+        for n in np.unique(nomor):
+            pilih = nomor == n
+            seg = self.segmen(int(n))
+            d = tanggal[pilih]
+            x = 2.0 * (d - seg.awal) / seg.panjang - 1.0
+            vektor_sun[pilih] = chebyshev.chebval(x, seg.matahari).T
+            vektor_moon[pilih] = chebyshev.chebval(x, seg.bulan).T
+            fase[pilih] = chebyshev.chebval(x, seg.fase)
+            linear = seg.gast0 + KECEPATAN_SIDERIS * (d - seg.awal - seg.panjang / 2.0)
+            gast[pilih] = np.mod(linear + chebyshev.chebval(x, seg.gast), 2 * np.pi)
+
+        geo = {"fase": fase}
+        for benda, v in (("sun", vektor_sun), ("moon", vektor_moon)):
+            geo["ra_" + benda] = np.mod(np.arctan2(v[:, 1], v[:, 0]), 2 * np.pi)
+            geo["dec_" + benda] = np.arctan2(v[:, 2], np.hypot(v[:, 0], v[:, 1]))
+            geo["r_" + benda] = np.linalg.norm(v, axis=1)
+        return geo, gast
+
+    def hitung_posisi_batch(self, lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        # Sama dengan sidias.efemeris.hitung_posisi_batch, tanpa memanggil ephem per sampel
+        geo, gast = self.posisi_geosentris(ke_tanggal_ephem(waktu))
+        return proyeksi_toposentris(geo, gast, lats, lons, tekanan, suhu)
+
+    def posisi(self, lat, lon, waktu=None, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        # Versi skalar untuk tick GUI, tanpa NumPy: HasilBatch berisi float.
+        # waktu: datetime UTC atau tanggal ephem (float / ephem.Date)
+        if waktu is None:
+            waktu = datetime.datetime.utcnow()
+        d = float(waktu) if isinstance(waktu, float) else float(ephem.Date(waktu))
+        seg = self.segmen(math.floor(d / self.panjang_segmen))
+        koef_matahari, koef_bulan, koef_fase, koef_gast = seg.skalar
+        x = 2.0 * (d - seg.awal) / seg.panjang - 1.0
+        linear = seg.gast0 + KECEPATAN_SIDERIS * (d - seg.awal - seg.panjang / 2.0)
+        lst = linear + _clenshaw(x, koef_gast) + math.radians(lon)
+
+        lat = math.radians(lat)
+        u = math.atan((1.0 - PEPATAH_BUMI) * math.tan(lat))
+        pengamat = (math.sin(lst), math.cos(lst), math.sin(lat), math.cos(lat),
+                    math.cos(u) * RADIUS_BUMI_AU, (1.0 - PEPATAH_BUMI) * math.sin(u) * RADIUS_BUMI_AU)
+        hasil = []
+        for koef in (koef_matahari, koef_bulan):
+            az, alt = _altaz_skalar(*(_clenshaw(x, k) for k in koef), *pengamat)
+            hasil += [az, refraksi_skalar(alt, tekanan, suhu)]
+        return HasilBatch(*hasil, _clenshaw(x, koef_fase))
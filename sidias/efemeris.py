@@ -0,0 +1,356 @@
+# -------------------------------
+# Si-DiAs: perhitungan efemeris tanpa GUI
+# -------------------------------
+# Posisi Matahari dan Bulan versi "batch": posisi geosentris dihitung sekali per
+# waktu dengan ephem, lalu proyeksi ke banyak lokasi sekaligus dikerjakan NumPy
+# (paralaks toposentris, alt-az, dan refraksi meniru libastro). Versi skalar untuk
+# satu observer ada di mesin efemeris (sidias.mesin.MesinEphem.posisi).
+
+import collections
+import datetime
+import math
+
+import ephem
+import numpy as np
+
+from sidias.indeks_langit import IndeksLangit
+
+# Tanggal ephem (Dublin JD) untuk epoch Unix 1970-01-01T00:00Z
+EPHEM_EPOCH_UNIX = 25567.5
+# Parameter default ephem.Observer
+TEKANAN_DEFAULT = 1010.0  # mBar
+SUHU_DEFAULT = 15.0       # °C
+# Bentuk Bumi (IAU 1976) untuk paralaks toposentris
+PEPATAH_BUMI = 1.0 / 298.257
+RADIUS_BUMI_AU = 6378.14 / 149597870.0
+
+HasilBatch = collections.namedtuple(
+    "HasilBatch", ["az_matahari", "alt_matahari", "az_bulan", "alt_bulan", "fase_bulan"]
+)
+
+# -------------------------------
+# Konversi waktu
+# -------------------------------
+def ke_tanggal_ephem(waktu):
+    # Terima datetime, datetime64, atau array keduanya (UTC) -> array float tanggal ephem
+    t = np.asarray(waktu, dtype="datetime64[us]")
+    detik = (t - np.datetime64("1970-01-01T00:00:00", "us")) / np.timedelta64(1, "s")
+    return detik / 86400.0 + EPHEM_EPOCH_UNIX
+
+def waktu_sideris_greenwich(tanggal):
+    # Waktu sideris semu Greenwich (radian) per tanggal ephem, diambil dari ephem
+    # agar nutasinya sama persis dengan jalur skalar.
+    observer = ephem.Observer()
+    observer.lon = observer.lat = 0.0
+    tanggal = np.atleast_1d(np.asarray(tanggal, dtype=float))
+    gast = np.empty(tanggal.shape)
+    for i, d in enumerate(tanggal.flat):
+        observer.date = d
+        gast.flat[i] = float(observer.sidereal_time())
+    return gast
+
+# -------------------------------
+# Geometri vektor (semua dalam radian)
+# -------------------------------
+def paralaks_toposentris(ra, dec, jarak_au, lst, lat):
+    # Geser posisi geosentris (ra, dec, jarak) ke permukaan Bumi di (lst, lat).
+    # Semua argumen di-broadcast; hasil (ra, dec) toposentris.
+    u = np.arctan((1.0 - PEPATAH_BUMI) * np.tan(lat))
+    rho_cos = np.cos(u) * RADIUS_BUMI_AU
+    rho_sin = (1.0 - PEPATAH_BUMI) * np.sin(u) * RADIUS_BUMI_AU
+    x = jarak_au * np.cos(dec) * np.cos(ra) - rho_cos * np.cos(lst)
+    y = jarak_au * np.cos(dec) * np.sin(ra) - rho_cos * np.sin(lst)
+    z = jarak_au * np.sin(dec) - rho_sin
+    return np.arctan2(y, x), np.arctan2(z, np.hypot(x, y))
+
+def ekuatorial_ke_horizontal(ra, dec, lst, lat):
+    # Sudut jam -> (az, alt) dengan azimuth dari utara lewat timur, seperti ephem
+    h = lst - ra
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_dec, cos_dec = np.sin(dec), np.cos(dec)
+    alt = np.arcsin(np.clip(sin_lat * sin_dec + cos_lat * cos_dec * np.cos(h), -1.0, 1.0))
+    az = np.arctan2(-cos_dec * np.sin(h), sin_dec * cos_lat - cos_dec * sin_lat * np.cos(h))
+    return np.mod(az, 2 * np.pi), alt
+
+def _unrefraksi(alt_semu, tekanan, suhu):
+    # Ketinggian semu -> ketinggian sebenarnya (rumus libastro, di-blend 14.5°..15.5°).
+    # alt_semu 1-D; tiap rumus hanya dihitung pada elemen yang memerlukannya.
+    a = np.degrees(alt_semu)
+    r = np.empty_like(a)
+    rendah = a < 15.5
+    tinggi = a >= 14.5
+    a_lt = a[rendah]
+    r_lt = tekanan * (0.1594 + 0.0196 * a_lt + 0.00002 * a_lt * a_lt) / (
+        (273 + suhu) * (1.0 + 0.505 * a_lt + 0.0845 * a_lt * a_lt))
+    r_ge = np.degrees(7.888888e-5 * tekanan / ((273 + suhu) * np.tan(alt_semu[tinggi])))
+    r[rendah] = r_lt
+    r[tinggi] = r_ge
+    campur = rendah & tinggi
+    if campur.any():
+        bobot = a[campur] - 14.5
+        r[campur] = (1 - bobot) * r_lt[campur[rendah]] + bobot * r_ge[campur[tinggi]]
+    return alt_semu - np.radians(r)
+
+def refraksi(alt, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+    # Ketinggian sebenarnya -> ketinggian semu, dibalik dengan iterasi secant
+    # seperti refract() di libastro. Elemen yang sudah konvergen dikeluarkan dari
+    # iterasi berikutnya.
+    if tekanan == 0:
+        return alt
+    alt = np.asarray(alt, dtype=float)
+    target = alt.ravel()
+    hasil = np.empty_like(target)
+    idx = np.arange(target.size)
+    a0, t0 = target, _unrefraksi(target, tekanan, suhu)
+    a1 = target + 0.8 * (target - t0)
+    for _ in range(8):
+        t1 = _unrefraksi(a1, tekanan, suhu)
+        sisa = np.abs(target[idx] - t1) >= 1e-10
+        hasil[idx] = a1
+        idx, a0, t0, a1, t1 = idx[sisa], a0[sisa], t0[sisa], a1[sisa], t1[sisa]
+        if idx.size == 0:
+            break
+        selisih = t1 - t0
+        aman = np.where(selisih != 0, selisih, 1.0)
+        langkah = np.where(selisih != 0, (target[idx] - t1) * (a1 - a0) / aman, 0.0)
+        a0, t0 = a1, t1
+        a1 = a1 + langkah
+    hasil[idx] = a1
+    # Di bawah ~-8° rumusnya berbalik arah; ephem lalu tidak mengoreksi sama sekali
+    return np.maximum(hasil, target).reshape(alt.shape)
+
+def _unrefraksi_skalar(alt_semu, tekanan, suhu):
+    # Versi float dari _unrefraksi (modul math, tanpa array)
+    a = math.degrees(alt_semu)
+    if a < 15.5:
+        r_lt = tekanan * (0.1594 + 0.0196 * a + 0.00002 * a * a) / (
+            (273 + suhu) * (1.0 + 0.505 * a + 0.0845 * a * a))
+    if a >= 14.5:
+        r_ge = math.degrees(7.888888e-5 * tekanan / ((273 + suhu) * math.tan(alt_semu)))
+    if a < 14.5:
+        r = r_lt
+    elif a >= 15.5:
+        r = r_ge
+    else:
+        bobot = a - 14.5
+        r = (1 - bobot) * r_lt + bobot * r_ge
+    return alt_semu - math.radians(r)
+
+def refraksi_skalar(alt, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+    # Versi float dari refraksi untuk satu posisi per tick; iterasi secant yang sama
+    if tekanan == 0:
+        return alt
+    a0, t0 = alt, _unrefraksi_skalar(alt, tekanan, suhu)
+    a1 = alt + 0.8 * (alt - t0)
+    for _ in range(8):
+        t1 = _unrefraksi_skalar(a1, tekanan, suhu)
+        if abs(alt - t1) < 1e-10:
+            break
+        selisih = t1 - t0
+        langkah = (alt - t1) * (a1 - a0) / selisih if selisih != 0 else 0.0
+        a0, t0 = a1, t1
+        a1 = a1 + langkah
+    return max(a1, alt)
+
+# -------------------------------
+# API batch
+# -------------------------------
+def posisi_geosentris(tanggal):
+    # Ra/dec semu geosentris Matahari & Bulan, jarak (AU) dan fase Bulan per tanggal ephem
+    tanggal = np.atleast_1d(np.asarray(tanggal, dtype=float))
+    n = tanggal.size
+    keluaran = {k: np.empty(n) for k in ("ra_sun", "dec_sun", "r_sun", "ra_moon", "dec_moon", "r_moon", "fase")}
+    sun, moon = ephem.Sun(), ephem.Moon()
+    for i, d in enumerate(tanggal.flat):
+        sun.compute(d)
+        moon.compute(d)
+        keluaran["ra_sun"][i], keluaran["dec_sun"][i], keluaran["r_sun"][i] = sun.g_ra, sun.g_dec, sun.earth_distance
+        keluaran["ra_moon"][i], keluaran["dec_moon"][i], keluaran["r_moon"][i] = moon.g_ra, moon.g_dec, moon.earth_distance
+        keluaran["fase"][i] = moon.moon_phase
+    return keluaran
+
+def proyeksi_toposentris(geo, gast, lats, lons, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+    # geo: keluaran posisi_geosentris (n_waktu,); gast: waktu sideris Greenwich (n_waktu,).
+    # Hasil HasilBatch dengan (az, alt) berbentuk (n_waktu, n_lokasi).
+    lat = np.radians(np.atleast_1d(np.asarray(lats, dtype=float)))[np.newaxis, :]
+    lon = np.radians(np.atleast_1d(np.asarray(lons, dtype=float)))[np.newaxis, :]
+    if lat.shape != lon.shape:
+        raise ValueError("lats dan lons harus berukuran sama")
+    lst = np.asarray(gast)[:, np.newaxis] + lon
+
+    hasil = []
+    for benda in ("sun", "moon"):
+        ra, dec = paralaks_toposentris(
+            geo["ra_" + benda][:, np.newaxis], geo["dec_" + benda][:, np.newaxis],
+            geo["r_" + benda][:, np.newaxis], lst, lat,
+        )
+        az, alt = ekuatorial_ke_horizontal(ra, dec, lst, lat)
+        hasil += [az, refraksi(alt, tekanan, suhu)]
+    return HasilBatch(hasil[0], hasil[1], hasil[2], hasil[3], geo["fase"])
+
+def hitung_posisi_batch(lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+    # Posisi Matahari & Bulan untuk semua kombinasi waktu × lokasi.
+    # lats, lons: derajat, bentuk (n_lokasi,); waktu: datetime/datetime64 UTC, bentuk (n_waktu,).
+    # Hasil: HasilBatch berisi array radian (az, alt) berbentuk (n_waktu, n_lokasi);
+    # fase_bulan (n_waktu,) antara 0 (bulan baru) hingga 1 (purnama).
+    tanggal = np.atleast_1d(ke_tanggal_ephem(waktu))
+    geo = posisi_geosentris(tanggal)
+    return proyeksi_toposentris(geo, waktu_sideris_greenwich(tanggal), lats, lons, tekanan, suhu)
+
+# -------------------------------
+# Transformasi katalog ekuatorial -> horizontal
+# -------------------------------
+# Satu matriks rotasi untuk seluruh katalog: u_semu = normal(u_J2000 + beta)
+# (aberasi tahunan) lalu xyz = u_semu @ (H(lst, lat) @ R).T, dengan R = presesi +
+# nutasi J2000 -> tanggal. R dan beta di-cache per hari (dihitung pada tengah hari,
+# sehingga pergeseran aberasi dalam sehari paling besar ~0.2") dan keduanya
+# dikalibrasi dari ephem sendiri (arah uji FixedBody), jadi hasilnya sama dengan jalur
+# FixedBody dalam ~0.4" di atas 0°. Defleksi cahaya oleh Matahari yang ditambahkan
+# ephem tidak dimodelkan (hanya terasa < 5° dari Matahari). Lihat bench/validasi_katalog.py.
+ARAH_UJI = np.array([
+    [1.0, 0.1, 0.2], [-1.0, 0.3, -0.1], [0.2, 1.0, 0.1],
+    [-0.1, -1.0, 0.3], [0.3, 0.2, 1.0], [0.1, -0.3, -1.0],
+    [0.7, 0.7, 0.4], [-0.6, 0.5, 0.7], [0.5, -0.7, -0.6], [-0.7, -0.6, -0.3],
+])
+ARAH_UJI = ARAH_UJI / np.linalg.norm(ARAH_UJI, axis=1)[:, np.newaxis]
+
+def _radec_ke_vektor(ra, dec):
+    ra, dec = np.asarray(ra, dtype=float), np.asarray(dec, dtype=float)
+    return np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1)
+
+def _kalibrasi_hari(tanggal):
+    # Posisi semu geosentris ephem untuk arah uji memenuhi t ∝ R (u + beta) = A u + c.
+    # A dan c dicari secara linear (DLT: t × (A u + c) = 0, solusi SVD), lalu
+    # R = rotasi terdekat ke A (polar/SVD) dan beta = A^-1 c. Hasil: (beta, R).
+    body = ephem.FixedBody()
+    body._epoch = ephem.J2000
+    persamaan = []
+    for x, y, z in ARAH_UJI:
+        body._ra = math.atan2(y, x)
+        body._dec = math.asin(z)
+        body.compute(tanggal)
+        t = _radec_ke_vektor(body.g_ra, body.g_dec)
+        silang = np.array([[0.0, -t[2], t[1]], [t[2], 0.0, -t[0]], [-t[1], t[0], 0.0]])
+        persamaan.append(silang @ np.kron(np.eye(3), [x, y, z, 1.0]))
+    _, _, vt = np.linalg.svd(np.concatenate(persamaan))
+    proyeksi = vt[-1].reshape(3, 4)
+    a, c = proyeksi[:, :3], proyeksi[:, 3]
+    if np.linalg.det(a) < 0:
+        a, c = -a, -c
+    u, _, vt = np.linalg.svd(a)
+    return np.linalg.solve(a, c), u @ vt
+
+def matriks_horizontal(lst, lat):
+    # Ekuatorial tanggal -> (utara, timur, zenit) untuk waktu sideris lokal & lintang
+    sin_l, cos_l = math.sin(lst), math.cos(lst)
+    sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+    rotasi_lst = np.array([[cos_l, sin_l, 0.0], [-sin_l, cos_l, 0.0], [0.0, 0.0, 1.0]])
+    lokal = np.array([[-sin_lat, 0.0, cos_lat], [0.0, 1.0, 0.0], [cos_lat, 0.0, sin_lat]])
+    return lokal @ rotasi_lst
+
+class TransformasiKatalog:
+    def __init__(self, katalog, batas_mag=None, selalu=()):
+        # batas_mag: bila diberikan, hanya bintang di atas horizon yang tidak lebih redup
+        # dari batas ini yang dihitung (lewat IndeksLangit); baris `selalu` (mis. rasi
+        # bintang berlabel) tetap disertakan di mana pun posisinya.
+        self.katalog = katalog
+        self.batas_mag = batas_mag
+        self.selalu = np.asarray(selalu, dtype=int)
+        self.indeks_langit = None
+        self._vektor_j2000 = None
+        self._hari = None
+        self._matriks_hari = None
+        self._vektor_semu = None
+
+    def _siapkan_hari(self, hari):
+        if hari == self._hari:
+            return
+        if self._vektor_j2000 is None:
+            data = self.katalog.data
+            self._vektor_j2000 = _radec_ke_vektor(data["ra"], data["dec"])
+        beta, self._matriks_hari = _kalibrasi_hari(hari + 0.5)
+        vektor = self._vektor_j2000 + beta
+        vektor /= np.linalg.norm(vektor, axis=1)[:, np.newaxis]
+        self._vektor_semu = vektor
+        self._hari = hari
+
+    def matriks(self, observer):
+        # Vektor semu (kerangka J2000) -> (utara, timur, zenit) untuk observer ini
+        self._siapkan_hari(math.floor(float(observer.date)))
+        return matriks_horizontal(float(observer.sidereal_time()), float(observer.lat)) @ self._matriks_hari
+
+    def vektor_horizontal(self, observer, indeks=None):
+        # Hasil (N, 3): (utara, timur, zenit) tanpa refraksi, satu perkalian matriks
+        matriks = self.matriks(observer)
+        vektor = self._vektor_semu if indeks is None else self._vektor_semu[indeks]
+        return vektor @ matriks.T
+
+    def pilih_terlihat(self, observer):
+        # Baris katalog (terurut) yang perlu dihitung & digambar pada tick ini
+        if self.batas_mag is None:
+            return np.arange(len(self.katalog.data))
+        if self.indeks_langit is None:
+            self._siapkan_hari(math.floor(float(observer.date)))
+            self.indeks_langit = IndeksLangit(self._vektor_j2000, self.katalog.data["mag"])
+        # Baris ketiga matriks = arah zenit dalam kerangka katalog
+        zenit = self.matriks(observer)[2]
+        terlihat = self.indeks_langit.di_atas_horizon(zenit, self.batas_mag)
+        return np.union1d(terlihat, self.selalu)
+
+    def altaz(self, observer, indeks=None):
+        xyz = self.vektor_horizontal(observer, indeks)
+        az = np.mod(np.arctan2(xyz[:, 1], xyz[:, 0]), 2 * np.pi)
+        alt = np.arcsin(np.clip(xyz[:, 2], -1.0, 1.0))
+        return az, refraksi(alt, observer.pressure, observer.temp)
+
+# -------------------------------
+# Snapshot langit per tick
+# -------------------------------
+# Semua tampilan (dial 2D, peta 3D, label) membaca satu snapshot yang dihitung
+# dari satu observer dan satu instan, sehingga tidak ada selisih antar-tampilan.
+SnapshotLangit = collections.namedtuple(
+    "SnapshotLangit",
+    ["lat", "lon", "waktu", "az_matahari", "alt_matahari", "az_bulan", "alt_bulan",
+     "fase_bulan", "terbit", "terbenam", "bintang"],
+)
+
+def buat_observer(lat, lon, waktu=None):
+    # lat/lon dalam derajat; diberikan ke ephem sebagai radian (tanpa parsing string)
+    observer = ephem.Observer()
+    observer.lat = math.radians(lat)
+    observer.lon = math.radians(lon)
+    observer.date = waktu if waktu is not None else datetime.datetime.utcnow()
+    return observer
+
+# -------------------------------
+# Cache terbit/terbenam
+# -------------------------------
+# next_rising/next_setting adalah pencarian akar iteratif, padahal jawabannya baru
+# berubah setelah peristiwa terdekat lewat (atau lokasinya berganti). Cache ini
+# menyimpan hasil per lokasi sampai saat itu, jadi per tick cukup satu perbandingan.
+INTERVAL_CEK_SIRKUMPOLAR = 1.0 / 24  # hari; siang/malam kutub ("N/A") dicek ulang tiap jam
+
+class CacheTerbitTerbenam:
+    def __init__(self):
+        # (lat, lon) -> (dihitung_pada, berlaku_sampai, terbit_local, terbenam_local)
+        self._isi = {}
+
+    def ambil(self, observer, lat, lon):
+        sekarang = float(observer.date)
+        isi = self._isi.get((lat, lon))
+        if isi is not None and isi[0] <= sekarang < isi[1]:
+            return isi[2], isi[3]
+        matahari = ephem.Sun()
+        try:
+            terbit = observer.next_rising(matahari)
+            terbenam = observer.next_setting(matahari)
+            berlaku_sampai = min(float(terbit), float(terbenam))
+            hasil = ephem.localtime(terbit), ephem.localtime(terbenam)
+        except Exception:
+            berlaku_sampai = sekarang + INTERVAL_CEK_SIRKUMPOLAR
+            hasil = "N/A", "N/A"
+        self._isi[(lat, lon)] = (sekarang, berlaku_sampai) + hasil
+        return hasil
+
+    def bersihkan(self):
+        self._isi.clear()
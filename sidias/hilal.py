@@ -0,0 +1,203 @@
+# -------------------------------
+# Si-DiAs: peta visibilitas hilal
+# -------------------------------
+# Untuk satu tanggal, tiap titik grid lintang × bujur (default seluruh Indonesia)
+# dihitung pada saat Matahari terbenam setempat: tinggi hilal, elongasi, umur Bulan
+# sejak ijtimak dan fraksi iluminasi, lalu diuji dengan kriteria visibilitas
+# (mis. MABIMS: tinggi >= 3° dan elongasi >= 6.4°). Terbenam dicari dengan grid
+# Matahari almanak dan posisi Bulan/Matahari dengan mesin NumPy (sidias.bulan,
+# sidias.matahari), semuanya tervektorisasi per potongan titik. Grid yang sangat
+# besar dibagi ke pool proses.
+#
+#   Tinggi   : pusat Bulan, toposentris, tanpa refraksi (derajat)
+#   Elongasi : jarak sudut geosentris pusat Bulan - pusat Matahari (derajat)
+#   Umur     : jam sejak ijtimak (konjungsi geosentris, ephem) sampai terbenam;
+#              negatif bila Matahari terbenam sebelum ijtimak
+#
+#   python -m sidias.hilal --tanggal 2025-02-28 --kriteria mabims --keluaran hilal.png
+#
+# Kriteria dipilih lewat --kriteria atau SIDIAS_KRITERIA_HILAL (default mabims).
+
+import argparse
+import collections
+import concurrent.futures
+import csv
+import datetime
+import logging
+import os
+
+import ephem
+import numpy as np
+
+from sidias.almanak import GridMatahari, ambang_ketinggian, baca_lokasi
+from sidias.bulan import fraksi_tersinari, posisi_ekuatorial_bulan
+from sidias.efemeris import ekuatorial_ke_horizontal, paralaks_toposentris
+from sidias.matahari import posisi_ekuatorial_matahari, waktu_sideris_semu
+from sidias.sholat import KOTA_DEFAULT
+
+LINTANG_INDONESIA = (-11.5, 6.5)
+BUJUR_INDONESIA = (94.5, 141.5)
+RESOLUSI = 0.1           # derajat
+POTONGAN_TITIK = 8192    # titik per potongan vektor (grid Matahari ~75 × POTONGAN_TITIK)
+BATAS_TITIK_PROSES = 200000  # di atas ini (dan proses None) titik dibagi ke pool proses
+JD_EPHEM = 2415020.0     # hari Julian tanggal ephem 0
+
+HasilHilal = collections.namedtuple(
+    "HasilHilal", ["tanggal", "lats", "lons", "ijtimak", "terbenam", "tinggi", "elongasi", "umur", "iluminasi"])
+
+# Kriteria: fungsi(HasilHilal) -> array bool (n_lat, n_lon), hilal dianggap terlihat
+KRITERIA_HILAL = {
+    "mabims": lambda h: (h.tinggi >= 3.0) & (h.elongasi >= 6.4),
+    "mabims_lama": lambda h: (h.tinggi >= 2.0) & (h.elongasi >= 3.0) & (h.umur >= 8.0),
+    "wujudul_hilal": lambda h: (h.umur > 0.0) & (h.tinggi > 0.0),
+    "turki": lambda h: (h.tinggi >= 5.0) & (h.elongasi >= 8.0),
+}
+
+def pilih_kriteria(nama=None):
+    if nama is None:
+        nama = os.environ.get("SIDIAS_KRITERIA_HILAL", "mabims")
+    try:
+        return KRITERIA_HILAL[nama]
+    except KeyError:
+        raise ValueError(f"kriteria hilal tidak dikenal: {nama!r} (pilih: {', '.join(KRITERIA_HILAL)})") from None
+
+def hitung_titik(tanggal, lats, lons):
+    # Titik 1-D: (terbenam JD, tinggi °, elongasi °, iluminasi) saat Matahari terbenam
+    # pada tanggal lokal `tanggal` (zona default per bujur)
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    grid = GridMatahari(tanggal, 1)
+    jd = grid.potongan(lats, lons).peristiwa(ambang_ketinggian(None), naik=False)[:, 0]
+    lat, lon = np.radians(lats), np.radians(lons)
+
+    ra_b, dec_b, jarak_b, omega, eps = posisi_ekuatorial_bulan(jd)
+    ra_m, dec_m, jarak_m, _, _ = posisi_ekuatorial_matahari(jd)
+    lst = waktu_sideris_semu(jd, omega, eps) + lon
+    ra_t, dec_t = paralaks_toposentris(ra_b, dec_b, jarak_b, lst, lat)
+    _, tinggi = ekuatorial_ke_horizontal(ra_t, dec_t, lst, lat)
+    cos_elongasi = np.sin(dec_b) * np.sin(dec_m) + np.cos(dec_b) * np.cos(dec_m) * np.cos(ra_b - ra_m)
+    elongasi = np.arccos(np.clip(cos_elongasi, -1.0, 1.0))
+    iluminasi = fraksi_tersinari(ra_b, dec_b, jarak_b, ra_m, dec_m, jarak_m)
+    return jd, np.degrees(tinggi), np.degrees(elongasi), iluminasi
+
+def _hitung_potongan(tugas):
+    return hitung_titik(*tugas)
+
+def ijtimak_sebelum(jd):
+    # Konjungsi geosentris terakhir sebelum hari Julian jd
+    return float(ephem.previous_new_moon(jd - JD_EPHEM)) + JD_EPHEM
+
+def hitung_grid_hilal(tanggal, lintang=LINTANG_INDONESIA, bujur=BUJUR_INDONESIA, resolusi=RESOLUSI, proses=None):
+    # proses: None = dalam proses ini kecuali grid > BATAS_TITIK_PROSES titik;
+    # 1 = selalu dalam proses ini; n = pool n proses
+    lats = np.arange(lintang[0], lintang[1] + resolusi / 2, resolusi)
+    lons = np.arange(bujur[0], bujur[1] + resolusi / 2, resolusi)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+    titik_lat, titik_lon = lat_grid.ravel(), lon_grid.ravel()
+    tugas = [(tanggal, titik_lat[i:i + POTONGAN_TITIK], titik_lon[i:i + POTONGAN_TITIK])
+             for i in range(0, len(titik_lat), POTONGAN_TITIK)]
+
+    if proses is None:
+        proses = 1 if len(titik_lat) <= BATAS_TITIK_PROSES else (os.cpu_count() or 1)
+    if proses == 1 or len(tugas) == 1:
+        bagian = [_hitung_potongan(t) for t in tugas]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(proses) as pool:
+            bagian = list(pool.map(_hitung_potongan, tugas))
+    terbenam, tinggi, elongasi, iluminasi = (np.concatenate(k).reshape(lat_grid.shape) for k in zip(*bagian))
+    if np.isnan(terbenam).all():
+        raise ValueError(f"Matahari tidak terbenam di titik grid mana pun pada {tanggal.isoformat()}")
+
+    # Ijtimak yang relevan: terakhir sebelum terbenam paling akhir di grid
+    ijtimak = ijtimak_sebelum(np.nanmax(terbenam))
+    umur = (terbenam - ijtimak) * 24.0
+    return HasilHilal(tanggal, lats, lons, ijtimak, terbenam, tinggi, elongasi, umur, iluminasi)
+
+def _waktu_ut(jd):
+    return (datetime.datetime(2000, 1, 1, 12) + datetime.timedelta(days=jd - 2451545.0)).replace(microsecond=0)
+
+def gambar_peta_hilal(hasil, nama_kriteria, path, path_kota=KOTA_DEFAULT, dpi=120):
+    # Heatmap tinggi hilal, kontur tinggi 0°/3° dan elongasi 6.4°, arsir daerah yang
+    # memenuhi kriteria, serta ibu kota provinsi sebagai penanda lokasi
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    terlihat = pilih_kriteria(nama_kriteria)(hasil)
+    fig = Figure(figsize=(12, 5.5), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    batas = max(1.0, float(np.nanmax(np.abs(hasil.tinggi))))
+    peta = ax.pcolormesh(hasil.lons, hasil.lats, hasil.tinggi, cmap="RdYlGn", vmin=-batas, vmax=batas,
+                         shading="nearest")
+    fig.colorbar(peta, ax=ax, label="Tinggi hilal saat terbenam (°)", pad=0.01)
+    kontur = ax.contour(hasil.lons, hasil.lats, hasil.tinggi, levels=[0.0, 3.0], colors="black", linewidths=0.8)
+    ax.clabel(kontur, fmt="%g°", fontsize=8)
+    kontur = ax.contour(hasil.lons, hasil.lats, hasil.elongasi, levels=[6.4], colors="navy",
+                        linewidths=0.8, linestyles="dashed")
+    ax.clabel(kontur, fmt="elongasi %g°", fontsize=8)
+    if terlihat.any():
+        ax.contourf(hasil.lons, hasil.lats, terlihat.astype(float), levels=[0.5, 1.5], colors="none", hatches=["//"])
+
+    if path_kota is not None:
+        for nama, lat, lon, _ in baca_lokasi(path_kota):
+            ax.plot(lon, lat, "k.", markersize=3)
+            ax.annotate(nama, (lon, lat), xytext=(2, 2), textcoords="offset points", fontsize=6)
+
+    ax.set_xlabel("Bujur (°)")
+    ax.set_ylabel("Lintang (°)")
+    ax.set_aspect("equal")
+    ax.set_title(f"Hilal {hasil.tanggal.isoformat()} saat Matahari terbenam - kriteria {nama_kriteria} "
+                 f"(arsir: terpenuhi, {terlihat.mean() * 100:.0f}% grid)\n"
+                 f"ijtimak {_waktu_ut(hasil.ijtimak):%Y-%m-%d %H:%M} UT", fontsize=10)
+    fig.savefig(path, bbox_inches="tight")
+    return path
+
+def tulis_grid_csv(hasil, nama_kriteria, path):
+    # Titik tanpa terbenam (siang/malam kutub) ditulis dengan sel kosong
+    terlihat = pilih_kriteria(nama_kriteria)(hasil)
+
+    def angka(nilai, format):
+        return "" if np.isnan(nilai) else f"{nilai:{format}}"
+    sementara = path + ".tmp"
+    with open(sementara, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.writer(f)
+        penulis.writerow(["lat", "lon", "terbenam_ut", "tinggi", "elongasi", "umur_jam", "iluminasi", nama_kriteria])
+        for i, lat in enumerate(hasil.lats):
+            for j, lon in enumerate(hasil.lons):
+                terbenam = hasil.terbenam[i, j]
+                penulis.writerow([f"{lat:.4f}", f"{lon:.4f}",
+                                  "" if np.isnan(terbenam) else f"{_waktu_ut(terbenam):%H:%M:%S}",
+                                  angka(hasil.tinggi[i, j], ".3f"), angka(hasil.elongasi[i, j], ".3f"),
+                                  angka(hasil.umur[i, j], ".2f"), angka(hasil.iluminasi[i, j], ".5f"),
+                                  int(terlihat[i, j])])
+    os.replace(sementara, path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Peta visibilitas hilal saat Matahari terbenam")
+    parser.add_argument("--tanggal", type=datetime.date.fromisoformat, default=datetime.date.today())
+    parser.add_argument("--kriteria", default=os.environ.get("SIDIAS_KRITERIA_HILAL", "mabims"),
+                        help=f"pilih: {', '.join(KRITERIA_HILAL)}")
+    parser.add_argument("--lintang", type=float, nargs=2, default=LINTANG_INDONESIA, metavar=("MIN", "MAKS"))
+    parser.add_argument("--bujur", type=float, nargs=2, default=BUJUR_INDONESIA, metavar=("MIN", "MAKS"))
+    parser.add_argument("--resolusi", type=float, default=RESOLUSI, help="jarak titik grid (derajat)")
+    parser.add_argument("--proses", type=int, default=None, help="jumlah proses (default: otomatis)")
+    parser.add_argument("--keluaran", default="hilal.png", help="gambar peta (.png/.svg)")
+    parser.add_argument("--csv", help="tulis juga nilai per titik grid ke CSV")
+    args = parser.parse_args(argv)
+
+    pilih_kriteria(args.kriteria)
+    try:
+        hasil = hitung_grid_hilal(args.tanggal, args.lintang, args.bujur, args.resolusi, args.proses)
+    except ValueError as e:
+        parser.error(str(e))
+    gambar_peta_hilal(hasil, args.kriteria, args.keluaran)
+    if args.csv:
+        tulis_grid_csv(hasil, args.kriteria, args.csv)
+    terlihat = pilih_kriteria(args.kriteria)(hasil)
+    print(f"{hasil.tinggi.size} titik; tinggi {np.nanmin(hasil.tinggi):.2f}..{np.nanmax(hasil.tinggi):.2f}°, "
+          f"elongasi {np.nanmin(hasil.elongasi):.2f}..{np.nanmax(hasil.elongasi):.2f}°; "
+          f"kriteria {args.kriteria} terpenuhi di {terlihat.mean() * 100:.1f}% grid -> {args.keluaran}")
+
+if __name__ == "__main__":
+    main()
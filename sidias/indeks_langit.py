@@ -0,0 +1,87 @@
+# -------------------------------
+# Si-DiAs: indeks spasial katalog bintang
+# -------------------------------
+# Bola langit dibagi menjadi piksel berluas sama (pita z = sin(dec) yang sama tebal,
+# tiap pita dibagi sama rata menurut RA), mirip HEALPix versi sederhana. Bintang
+# diurutkan per piksel lalu per magnitudo, sehingga kueri kerucut hanya memeriksa
+# piksel di sekitar sumbu dan batas magnitudo cukup berupa pencarian biner.
+
+import math
+
+import numpy as np
+
+N_PITA_DEFAULT = 64  # 64 pita × 128 kolom RA = 8192 piksel
+MAG_KOSONG = 99.0    # bintang tanpa magnitudo dianggap paling redup
+
+class IndeksLangit:
+    def __init__(self, vektor, mag, n_pita=N_PITA_DEFAULT):
+        # vektor: (N, 3) vektor satuan; mag: (N,) magnitudo (NaN = tidak diketahui)
+        self.vektor = vektor
+        self.n_pita = n_pita
+        self.n_kolom = 2 * n_pita
+        n_piksel = self.n_pita * self.n_kolom
+
+        piksel = self._piksel(vektor)
+        mag = np.nan_to_num(np.asarray(mag, dtype=float), nan=MAG_KOSONG)
+        self.urutan = np.lexsort((mag, piksel))
+        piksel_urut = piksel[self.urutan]
+        self.awal = np.searchsorted(piksel_urut, np.arange(n_piksel + 1))
+        # Kunci gabungan (piksel, magnitudo) yang terurut: batas magnitudo per piksel
+        # bisa dicari sekaligus dengan satu searchsorted
+        self._kunci = piksel_urut * 1000.0 + np.clip(mag[self.urutan], -100.0, 899.0) + 100.0
+
+        # Pusat dan radius (sudut pusat ke pojok terjauh) tiap piksel
+        tepi_z = np.linspace(-1.0, 1.0, self.n_pita + 1)
+        tepi_ra = np.linspace(0.0, 2 * np.pi, self.n_kolom + 1)
+        pusat_z = np.repeat((tepi_z[:-1] + tepi_z[1:]) / 2, self.n_kolom)
+        pusat_ra = np.tile((tepi_ra[:-1] + tepi_ra[1:]) / 2, self.n_pita)
+        self.pusat = _vektor_dari_z_ra(pusat_z, pusat_ra)
+        radius = np.zeros(n_piksel)
+        for dz in (0, 1):
+            for dra in (0, 1):
+                pojok = _vektor_dari_z_ra(
+                    np.repeat(tepi_z[dz:self.n_pita + dz], self.n_kolom),
+                    np.tile(tepi_ra[dra:self.n_kolom + dra], self.n_pita),
+                )
+                sudut = np.arccos(np.clip(np.sum(pojok * self.pusat, axis=1), -1.0, 1.0))
+                radius = np.maximum(radius, sudut)
+        self.radius_piksel = radius + 1e-9
+
+    def _piksel(self, vektor):
+        z = np.clip(vektor[:, 2], -1.0, 1.0)
+        ra = np.mod(np.arctan2(vektor[:, 1], vektor[:, 0]), 2 * np.pi)
+        pita = np.minimum(((z + 1.0) / 2.0 * self.n_pita).astype(int), self.n_pita - 1)
+        kolom = np.minimum((ra / (2 * np.pi) * self.n_kolom).astype(int), self.n_kolom - 1)
+        return pita * self.n_kolom + kolom
+
+    def kerucut(self, sumbu, radius, batas_mag=None):
+        # Indeks baris (terurut) semua bintang dalam jarak sudut `radius` (radian) dari
+        # `sumbu`, dan (opsional) tidak lebih redup dari batas_mag.
+        sumbu = np.asarray(sumbu, dtype=float)
+        sumbu = sumbu / np.linalg.norm(sumbu)
+        jarak = np.arccos(np.clip(self.pusat @ sumbu, -1.0, 1.0))
+        kandidat = np.nonzero(jarak <= radius + self.radius_piksel)[0]
+
+        mulai = self.awal[kandidat]
+        if batas_mag is None:
+            selesai = self.awal[kandidat + 1]
+        else:
+            batas = kandidat * 1000.0 + min(max(batas_mag, -100.0), 899.0) + 100.0
+            selesai = np.searchsorted(self._kunci, batas, side="right")
+        panjang = selesai - mulai
+        if panjang.sum() == 0:
+            return np.empty(0, dtype=int)
+        # Gabungkan rentang [mulai, selesai) tanpa loop Python
+        posisi = np.repeat(mulai - np.concatenate(([0], np.cumsum(panjang)[:-1])), panjang) + np.arange(panjang.sum())
+        baris = self.urutan[posisi]
+        # Uji pasti: sebagian piksel kandidat hanya beririsan dengan kerucut
+        baris = baris[self.vektor[baris] @ sumbu >= math.cos(min(radius, np.pi))]
+        return np.sort(baris)
+
+    def di_atas_horizon(self, zenit, batas_mag=None, margin=math.radians(1.0)):
+        # Kerucut 90° di sekitar zenit; margin menampung refraksi di dekat horizon
+        return self.kerucut(zenit, np.pi / 2 + margin, batas_mag)
+
+def _vektor_dari_z_ra(z, ra):
+    r = np.sqrt(np.clip(1.0 - z * z, 0.0, 1.0))
+    return np.stack([r * np.cos(ra), r * np.sin(ra), z], axis=-1)
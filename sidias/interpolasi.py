@@ -0,0 +1,67 @@
+# -------------------------------
+# Si-DiAs: interpolasi snapshot untuk animasi halus
+# -------------------------------
+# Efemeris cukup disampel jarang (mis. tiap 30 detik, selangkah di depan waktu
+# sekarang, lihat PekerjaLangit); posisi Matahari & Bulan di antara dua sampel
+# diinterpolasi pada laju tampilan. Interpolasi dilakukan pada vektor satuan alt-az
+# (lalu dinormalkan) sehingga aman di lintasan azimuth 0/360° dan dekat zenit.
+# Dengan sampel tiap 60 detik galatnya < 0.002° (terbesar dekat horizon, akibat
+# refraksi), jauh di bawah satu piksel dial maupun peta 3D.
+#
+# Bintang katalog tidak diinterpolasi: snapshot interpolasi memakai posisi bintang
+# sampel awal selang (langit berputar 0.25° per menit).
+
+import bisect
+import math
+
+MAKS_SAMPEL = 4
+
+def _vektor(az, alt):
+    return math.cos(alt) * math.cos(az), math.cos(alt) * math.sin(az), math.sin(alt)
+
+def interpolasi_altaz(az0, alt0, az1, alt1, f):
+    # Titik pada fraksi f (0..1) di antara dua arah (az, alt) radian
+    a = _vektor(az0, alt0)
+    b = _vektor(az1, alt1)
+    x, y, z = (p + (q - p) * f for p, q in zip(a, b))
+    panjang = math.sqrt(x * x + y * y + z * z)
+    return math.atan2(y, x) % (2 * math.pi), math.asin(max(-1.0, min(1.0, z / panjang)))
+
+class InterpolasiSnapshot:
+    def __init__(self, maks_sampel=MAKS_SAMPEL):
+        self.maks_sampel = maks_sampel
+        self.sampel = []  # SnapshotLangit urut menurut waktu, satu lokasi
+
+    @property
+    def lokasi(self):
+        return (self.sampel[0].lat, self.sampel[0].lon) if self.sampel else None
+
+    def tambah(self, snapshot):
+        if self.lokasi != (snapshot.lat, snapshot.lon):
+            self.sampel = []
+        waktu = [s.waktu for s in self.sampel]
+        i = bisect.bisect_left(waktu, snapshot.waktu)
+        if i < len(waktu) and waktu[i] == snapshot.waktu:
+            self.sampel[i] = snapshot
+        else:
+            self.sampel.insert(i, snapshot)
+        del self.sampel[:-self.maks_sampel]
+
+    def pada(self, waktu):
+        # SnapshotLangit pada `waktu` (datetime UTC); di luar rentang sampel posisi
+        # ditahan pada sampel terdekat. None bila belum ada sampel.
+        if not self.sampel:
+            return None
+        i = bisect.bisect_right([s.waktu for s in self.sampel], waktu)
+        if i == 0:
+            return self.sampel[0]._replace(waktu=waktu)
+        if i == len(self.sampel):
+            return self.sampel[-1]._replace(waktu=waktu)
+        a, b = self.sampel[i - 1], self.sampel[i]
+        f = (waktu - a.waktu) / (b.waktu - a.waktu)
+        az_matahari, alt_matahari = interpolasi_altaz(a.az_matahari, a.alt_matahari, b.az_matahari, b.alt_matahari, f)
+        az_bulan, alt_bulan = interpolasi_altaz(a.az_bulan, a.alt_bulan, b.az_bulan, b.alt_bulan, f)
+        return a._replace(
+            waktu=waktu, az_matahari=az_matahari, alt_matahari=alt_matahari,
+            az_bulan=az_bulan, alt_bulan=alt_bulan, fase_bulan=a.fase_bulan + (b.fase_bulan - a.fase_bulan) * f,
+        )
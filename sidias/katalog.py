@@ -0,0 +1,129 @@
+# -------------------------------
+# Si-DiAs: katalog bintang biner (memory-mapped)
+# -------------------------------
+# Katalog CSV (ra, dec, mag, name) dikompilasi sekali menjadi array NumPy terstruktur
+# (.katalog.npy) plus daftar nama (.katalog.nama). Setelah itu membuka katalog cukup
+# dengan mmap, bukan parsing ulang, dan memori tetap datar berapa pun ukurannya.
+# Bila direktori CSV tidak bisa ditulis (mis. instalasi read-only), hasil kompilasi
+# disimpan di SIDIAS_CACHE_KATALOG (default ~/.cache/sidias/katalog).
+#
+#   python -m sidias.katalog hygdata.csv --ra-jam --kolom-nama proper
+
+import argparse
+import collections
+import csv
+import hashlib
+import math
+import os
+
+import numpy as np
+
+# RA/Dec dalam radian (float32 ~0.1" presisi), magnitudo, indeks nama (-1 = tanpa nama)
+DTYPE_KATALOG = np.dtype([("ra", "<f4"), ("dec", "<f4"), ("mag", "<f4"), ("nama", "<i4")])
+UKURAN_BLOK = 65536
+DIREKTORI_CACHE = os.environ.get("SIDIAS_CACHE_KATALOG", os.path.expanduser("~/.cache/sidias/katalog"))
+
+Katalog = collections.namedtuple("Katalog", ["data", "nama"])
+
+def _path_kompilasi(path_csv, direktori=None):
+    # direktori None: di samping CSV; selain itu nama file diberi hash path CSV
+    dasar = os.path.splitext(path_csv)[0]
+    if direktori is not None:
+        kunci = hashlib.sha1(os.path.abspath(path_csv).encode("utf-8")).hexdigest()[:12]
+        dasar = os.path.join(direktori, f"{os.path.basename(dasar)}-{kunci}")
+    return dasar + ".katalog.npy", dasar + ".katalog.nama"
+
+def _baca_baris(path_csv, kolom_ra, kolom_dec, kolom_mag, kolom_nama):
+    with open(path_csv, newline="", encoding="utf-8") as f:
+        for baris in csv.DictReader(f):
+            mag = baris.get(kolom_mag) or ""
+            yield (float(baris[kolom_ra]), float(baris[kolom_dec]),
+                   float(mag) if mag.strip() else math.nan, (baris.get(kolom_nama) or "").strip())
+
+def kompilasi_katalog(path_csv, ra_jam=False, kolom_ra="ra", kolom_dec="dec",
+                      kolom_mag="mag", kolom_nama="name", direktori=None):
+    # Dua kali baca secara streaming (hitung baris, lalu isi) agar CSV besar tidak
+    # pernah dimuat utuh ke memori. ra_jam=True untuk katalog yang RA-nya dalam jam (HYG).
+    path_npy, path_nama = _path_kompilasi(path_csv, direktori)
+    if direktori is not None:
+        os.makedirs(direktori, exist_ok=True)
+    kolom = (kolom_ra, kolom_dec, kolom_mag, kolom_nama)
+    n = sum(1 for _ in _baca_baris(path_csv, *kolom))
+    skala_ra = 15.0 if ra_jam else 1.0
+
+    sementara = path_npy + ".tmp"
+    data = np.lib.format.open_memmap(sementara, mode="w+", dtype=DTYPE_KATALOG, shape=(n,))
+    nama, indeks_nama = [], {}
+    blok = np.empty(UKURAN_BLOK, dtype=DTYPE_KATALOG)
+    awal = isi = 0
+    for ra, dec, mag, label in _baca_baris(path_csv, *kolom):
+        if label and label not in indeks_nama:
+            indeks_nama[label] = len(nama)
+            nama.append(label)
+        blok[isi] = (math.radians(ra * skala_ra), math.radians(dec), mag, indeks_nama.get(label, -1))
+        isi += 1
+        if isi == UKURAN_BLOK:
+            data[awal:awal + isi] = blok
+            awal, isi = awal + isi, 0
+    data[awal:awal + isi] = blok[:isi]
+    data.flush()
+    del data
+
+    # Nama dulu, .npy terakhir: keduanya diganti atomik dan kesegaran dinilai dari
+    # waktu .npy, jadi proses yang terputus di antaranya memicu kompilasi ulang,
+    # bukan .npy baru dengan daftar nama lama
+    with open(path_nama + ".tmp", "w", encoding="utf-8") as f:
+        f.write("\n".join(nama))
+    os.replace(path_nama + ".tmp", path_nama)
+    os.replace(sementara, path_npy)
+    return path_npy
+
+def muat_katalog(path_npy):
+    data = np.load(path_npy, mmap_mode="r")
+    if data.dtype != DTYPE_KATALOG:
+        raise ValueError(f"{path_npy}: format katalog tidak dikenal ({data.dtype})")
+    path_nama = path_npy[:-len(".npy")] + ".nama"
+    with open(path_nama, encoding="utf-8") as f:
+        nama = f.read().split("\n") if os.path.getsize(path_nama) else []
+    return Katalog(data, nama)
+
+def indeks_bernama(katalog, nama):
+    # Baris katalog yang namanya termasuk dalam `nama` (mis. rasi bintang berlabel)
+    kode = [i for i, n in enumerate(katalog.nama) if n in nama]
+    return np.nonzero(np.isin(katalog.data["nama"], kode))[0]
+
+def _basi(path_csv, path_npy, path_nama):
+    try:
+        return (os.path.getmtime(path_npy) < os.path.getmtime(path_csv)
+                or not os.path.exists(path_nama))
+    except OSError:
+        return True
+
+def buka_katalog(path_csv, **opsi):
+    # Buka katalog hasil kompilasi; kompilasi ulang hanya bila CSV lebih baru.
+    # Hasil kompilasi di samping CSV dipakai bila masih segar; bila basi dan
+    # direktorinya read-only, kompilasi ke (dan baca dari) DIREKTORI_CACHE.
+    path_npy, path_nama = _path_kompilasi(path_csv)
+    direktori = None
+    if _basi(path_csv, path_npy, path_nama) and not os.access(os.path.dirname(os.path.abspath(path_csv)), os.W_OK):
+        direktori = DIREKTORI_CACHE
+        path_npy, path_nama = _path_kompilasi(path_csv, direktori)
+    if _basi(path_csv, path_npy, path_nama):
+        kompilasi_katalog(path_csv, direktori=direktori, **opsi)
+    return muat_katalog(path_npy)
+
+def main():
+    parser = argparse.ArgumentParser(description="Kompilasi katalog bintang CSV ke format mmap Si-DiAs")
+    parser.add_argument("csv")
+    parser.add_argument("--ra-jam", action="store_true", help="kolom RA dalam jam, bukan derajat")
+    parser.add_argument("--kolom-ra", default="ra")
+    parser.add_argument("--kolom-dec", default="dec")
+    parser.add_argument("--kolom-mag", default="mag")
+    parser.add_argument("--kolom-nama", default="name")
+    args = parser.parse_args()
+    path_npy = kompilasi_katalog(args.csv, args.ra_jam, args.kolom_ra, args.kolom_dec,
+                                 args.kolom_mag, args.kolom_nama)
+    print(f"{len(muat_katalog(path_npy).data)} bintang -> {path_npy}")
+
+if __name__ == "__main__":
+    main()
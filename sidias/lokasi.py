@@ -0,0 +1,58 @@
+# -------------------------------
+# Si-DiAs: lokasi terkini (non-blocking) dengan cache di disk
+# -------------------------------
+# Pencarian lokasi lewat IP berjalan di thread terpisah dengan batas waktu, sedangkan
+# lokasi terakhir yang berhasil disimpan di disk agar jendela bisa langsung tampil
+# (juga pada mesin tanpa jaringan).
+
+import datetime
+import json
+import os
+import queue
+import threading
+
+FILE_CACHE_LOKASI = os.path.join(os.path.expanduser("~"), ".sidias_lokasi.json")
+BATAS_WAKTU_LOKASI = 3.0  # detik
+
+def get_current_location(timeout=BATAS_WAKTU_LOKASI):
+    try:
+        import geocoder  # Untuk mendapatkan lokasi terkini; baru dimuat saat dibutuhkan
+        g = geocoder.ip('me', timeout=timeout)
+        if g.ok and g.latlng:
+            return g.latlng[0], g.latlng[1]
+    except Exception as e:
+        print("Gagal mendapatkan lokasi:", e)
+    return None, None
+
+def baca_lokasi_tersimpan(path=FILE_CACHE_LOKASI):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return float(data["lat"]), float(data["lon"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+def simpan_lokasi(lat, lon, path=FILE_CACHE_LOKASI):
+    # Tulis ke file sementara lalu ganti, supaya cache tidak pernah setengah tertulis
+    data = {"lat": lat, "lon": lon, "waktu": datetime.datetime.utcnow().isoformat()}
+    sementara = path + ".tmp"
+    try:
+        with open(sementara, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(sementara, path)
+    except OSError as e:
+        print("Gagal menyimpan lokasi:", e)
+
+def cari_lokasi_async(timeout=BATAS_WAKTU_LOKASI, path=FILE_CACHE_LOKASI):
+    # Mulai pencarian di latar belakang; hasil (lat, lon) atau (None, None) masuk ke
+    # antrean yang dikembalikan. Lokasi yang berhasil langsung disimpan ke cache.
+    hasil = queue.Queue(maxsize=1)
+
+    def kerja():
+        lat, lon = get_current_location(timeout)
+        if lat is not None and lon is not None:
+            simpan_lokasi(lat, lon, path)
+        hasil.put((lat, lon))
+
+    threading.Thread(target=kerja, name="sidias-lokasi", daemon=True).start()
+    return hasil
@@ -0,0 +1,169 @@
+# -------------------------------
+# Si-DiAs: antarmuka mesin efemeris
+# -------------------------------
+# Satu antarmuka untuk posisi Matahari & Bulan, terbit/terbenam dan fase, versi
+# skalar (satu observer, untuk tick GUI) maupun batch (waktu × lokasi):
+#
+#   posisi(observer)                       -> HasilBatch berisi float
+#   posisi_batch(lats, lons, waktu, ...)   -> HasilBatch berisi array (n_waktu, n_lokasi)
+#   fase(waktu)                            -> array fase Bulan (n_waktu,)
+#   terbit_terbenam(observer)              -> (terbit_local, terbenam_local) atau "N/A"
+#   terbit_terbenam_batch(lats, lons, tanggal, jumlah_hari=1)
+#                                          -> (terbit, terbenam) hari Julian UT (n_lokasi, jumlah_hari)
+#
+# terbit_terbenam_batch sama untuk semua mesin (tidak memakai posisi mesin) dan
+# hasilnya hari Julian UT dengan NaN, bukan datetime lokal / "N/A" seperti versi
+# skalar: tabel setahun × ratusan lokasi tidak perlu dibungkus objek per sel.
+#
+# Mesin yang tersedia ada di MESIN_EFEMERIS dan dipilih lewat buat_mesin(nama) atau
+# variabel lingkungan SIDIAS_MESIN:
+#   "ephem"      ephem per sampel (acuan, default)
+#   "chebyshev"  polinomial Chebyshev per hari dari ephem (galat < 0.005")
+#   "numpy"      deret Meeus terpotong (galat ~0.01°, tanpa ephem untuk posisi)
+# Semua mesin mencari terbit/terbenam skalar dengan ephem lewat CacheTerbitTerbenam,
+# dan versi batch dengan grid Matahari tervektorisasi sidias.almanak (galat ~1 s
+# terhadap ephem, bench/validasi_almanak.py). Mesin baru wajib mengimplementasikan
+# posisi, posisi_batch dan fase (kelas abstrak: mesin yang belum lengkap gagal saat
+# dibuat, bukan di tengah tick).
+
+import abc
+import datetime
+import math
+import os
+import time
+
+import ephem
+import numpy as np
+
+from sidias.almanak import hitung_almanak
+from sidias.bulan import fraksi_tersinari, posisi_bulan_numpy, posisi_ekuatorial_bulan
+from sidias.chebyshev import CacheChebyshev
+from sidias.efemeris import (
+    CacheTerbitTerbenam, HasilBatch, SUHU_DEFAULT, SnapshotLangit, TEKANAN_DEFAULT,
+    buat_observer, hitung_posisi_batch, ke_tanggal_ephem, posisi_geosentris,
+)
+from sidias.matahari import hari_julian, posisi_ekuatorial_matahari, posisi_matahari_numpy
+
+class MesinEfemeris(abc.ABC):
+    nama = None
+
+    def __init__(self):
+        self.cache_terbit = CacheTerbitTerbenam()
+
+    @abc.abstractmethod
+    def posisi(self, observer):
+        pass
+
+    @abc.abstractmethod
+    def posisi_batch(self, lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        pass
+
+    @abc.abstractmethod
+    def fase(self, waktu):
+        pass
+
+    def terbit_terbenam(self, observer):
+        return self.cache_terbit.ambil(observer, float(observer.lat), float(observer.lon))
+
+    def terbit_terbenam_batch(self, lats, lons, tanggal, jumlah_hari=1, zona=None):
+        # Terbit/terbenam per hari lokal mulai `tanggal` (datetime.date) sebagai hari Julian
+        # UT, NaN bila tidak terjadi; sama untuk semua mesin (grid sidias.almanak).
+        # zona: selisih jam terhadap UTC per lokasi (default round(lon / 15)).
+        hasil = hitung_almanak(lats, lons, tanggal, jumlah_hari, zona)
+        return hasil["terbit"], hasil["terbenam"]
+
+    def bersihkan(self):
+        # Dipanggil saat lokasi diubah pengguna
+        self.cache_terbit.bersihkan()
+
+class MesinEphem(MesinEfemeris):
+    nama = "ephem"
+
+    def posisi(self, observer):
+        matahari = ephem.Sun(observer)
+        bulan = ephem.Moon(observer)
+        return HasilBatch(float(matahari.az), float(matahari.alt),
+                          float(bulan.az), float(bulan.alt), bulan.moon_phase)
+
+    def posisi_batch(self, lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        return hitung_posisi_batch(lats, lons, waktu, tekanan, suhu)
+
+    def fase(self, waktu):
+        return posisi_geosentris(ke_tanggal_ephem(waktu))["fase"]
+
+class MesinChebyshev(MesinEfemeris):
+    nama = "chebyshev"
+
+    def __init__(self, panjang_segmen=1.0):
+        super().__init__()
+        self.cheb = CacheChebyshev(panjang_segmen)
+
+    def posisi(self, observer):
+        return self.cheb.posisi(math.degrees(observer.lat), math.degrees(observer.lon), float(observer.date),
+                                observer.pressure, observer.temp)
+
+    def posisi_batch(self, lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        return self.cheb.hitung_posisi_batch(lats, lons, waktu, tekanan, suhu)
+
+    def fase(self, waktu):
+        return self.cheb.posisi_geosentris(ke_tanggal_ephem(waktu))[0]["fase"]
+
+class MesinNumpy(MesinEfemeris):
+    nama = "numpy"
+
+    def posisi(self, observer):
+        hasil = self.posisi_batch(np.degrees(observer.lat), np.degrees(observer.lon),
+                                  observer.date.datetime(), observer.pressure, observer.temp)
+        return HasilBatch(*(float(np.ravel(x)[0]) for x in hasil))
+
+    def posisi_batch(self, lats, lons, waktu, tekanan=TEKANAN_DEFAULT, suhu=SUHU_DEFAULT):
+        az_matahari, alt_matahari = posisi_matahari_numpy(lats, lons, waktu, tekanan, suhu)
+        az_bulan, alt_bulan, fase = posisi_bulan_numpy(lats, lons, waktu, tekanan, suhu)
+        return HasilBatch(az_matahari, alt_matahari, az_bulan, alt_bulan, fase)
+
+    def fase(self, waktu):
+        jd = np.atleast_1d(hari_julian(waktu))
+        ra, dec, jarak, _, _ = posisi_ekuatorial_bulan(jd)
+        return fraksi_tersinari(ra, dec, jarak, *posisi_ekuatorial_matahari(jd)[:3])
+
+MESIN_EFEMERIS = {
+    "ephem": MesinEphem,
+    "chebyshev": MesinChebyshev,
+    "numpy": MesinNumpy,
+}
+
+def buat_mesin(nama=None):
+    if nama is None:
+        nama = os.environ.get("SIDIAS_MESIN", "ephem")
+    try:
+        kelas = MESIN_EFEMERIS[nama]
+    except KeyError:
+        raise ValueError(f"mesin efemeris tidak dikenal: {nama!r} (pilih: {', '.join(MESIN_EFEMERIS)})") from None
+    return kelas()
+
+def buat_snapshot(lat, lon, transformasi=None, waktu=None, mesin=None, pengukur=None):
+    # transformasi: TransformasiKatalog; hasil bintang: (indeks baris, az, alt) dalam radian
+    # mesin: MesinEfemeris sumber posisi, fase dan terbit/terbenam (default ephem)
+    # pengukur: objek dengan catat(tahap, ms) (sidias.profil.PengukurTahap) untuk tahap
+    # "efemeris" (posisi + terbit/terbenam) dan "katalog" (pilih + rotasi bintang)
+    t0 = time.perf_counter()
+    if waktu is None:
+        waktu = datetime.datetime.utcnow()
+    if mesin is None:
+        mesin = MesinEphem()
+    observer = buat_observer(lat, lon, waktu)
+    posisi = mesin.posisi(observer)
+    terbit, terbenam = mesin.terbit_terbenam(observer)
+    t1 = time.perf_counter()
+
+    # Posisi katalog: (indeks baris, az, alt); hanya baris terpilih yang dihitung
+    bintang = None
+    if transformasi is not None:
+        indeks = transformasi.pilih_terlihat(observer)
+        bintang = (indeks,) + transformasi.altaz(observer, indeks)
+
+    if pengukur is not None:
+        pengukur.catat("efemeris", (t1 - t0) * 1000.0)
+        if transformasi is not None:
+            pengukur.catat("katalog", (time.perf_counter() - t1) * 1000.0)
+    return SnapshotLangit(lat, lon, waktu, *posisi, terbit, terbenam, bintang)
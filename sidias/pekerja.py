@@ -0,0 +1,156 @@
+# -------------------------------
+# Si-DiAs: thread pekerja perhitungan langit
+# -------------------------------
+# Semua perhitungan efemeris dan katalog dikerjakan di thread terpisah yang
+# menerbitkan SnapshotLangit (tidak bisa diubah: namedtuple + array read-only) ke
+# antrean. Thread Tk hanya mengambil snapshot terbaru lalu menggambarnya, jadi input
+# di entri lat/lon tetap responsif seberat apa pun model langitnya. Render matplotlib
+# tetap di thread Tk karena widget Tk tidak aman dipakai dari thread lain.
+#
+# Mode di_depan (animasi, lihat sidias.interpolasi): sampel diambil pada kelipatan
+# `interval` detik dan selalu satu sampel di depan waktu sekarang, sehingga sisi
+# tampilan selalu punya dua sampel yang mengapit saat ini untuk diinterpolasi.
+#
+# jeda() menghentikan perhitungan (mis. saat jendela di-iconify) sampai lanjutkan()
+# dipanggil; snapshot untuk waktu sekarang langsung dihitung begitu dilanjutkan.
+
+import datetime
+import logging
+import queue
+import threading
+import time
+
+from sidias.mesin import buat_snapshot
+
+MAKS_ANTREAN = 4  # snapshot yang belum diambil; yang tertua dibuang bila penuh
+
+log = logging.getLogger(__name__)
+
+class PekerjaLangit:
+    def __init__(self, mesin, transformasi=None, interval=1.0, pengukur=None, di_depan=False):
+        self.mesin = mesin
+        self.transformasi = transformasi
+        self.interval = interval
+        self.pengukur = pengukur
+        self.di_depan = di_depan
+        self.antrean = queue.Queue(maxsize=MAKS_ANTREAN)
+        self._lokasi = None
+        # Lokasi terakhir yang snapshot-nya gagal dihitung (None bila berhasil); dibaca thread Tk
+        self.lokasi_gagal = None
+        self._bangun = threading.Event()
+        self._berhenti = threading.Event()
+        self._aktif = threading.Event()  # dikosongkan selama jeda
+        self._aktif.set()
+        self._thread = threading.Thread(target=self._jalan, name="sidias-pekerja", daemon=True)
+
+    def mulai(self, lat, lon):
+        self._lokasi = (lat, lon)
+        self._thread.start()
+
+    def hentikan(self):
+        self._berhenti.set()
+        self._aktif.set()
+        self._bangun.set()
+
+    def jeda(self):
+        # Dipanggil dari thread Tk; perhitungan yang sedang berjalan diselesaikan dulu
+        self._aktif.clear()
+
+    def lanjutkan(self):
+        if not self._aktif.is_set():
+            self._aktif.set()
+            self._bangun.set()
+
+    def atur_lokasi(self, lat, lon):
+        # Dipanggil dari thread Tk; snapshot baru langsung dihitung tanpa menunggu interval
+        if (lat, lon) != self._lokasi:
+            self._lokasi = (lat, lon)
+            self._bangun.set()
+
+    def ambil_terbaru(self):
+        # Kuras antrean dan kembalikan snapshot terakhir (None bila kosong)
+        terbaru = None
+        while True:
+            try:
+                terbaru = self.antrean.get_nowait()
+            except queue.Empty:
+                return terbaru
+
+    def ambil_semua(self):
+        # Kuras antrean: semua snapshot yang belum diambil, urut terbit
+        hasil = []
+        while True:
+            try:
+                hasil.append(self.antrean.get_nowait())
+            except queue.Empty:
+                return hasil
+
+    def _terbitkan(self, snapshot):
+        while True:
+            try:
+                self.antrean.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.antrean.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _hitung(self, lat, lon, waktu=None):
+        t0 = time.perf_counter()
+        snapshot = buat_snapshot(lat, lon, self.transformasi, waktu, mesin=self.mesin, pengukur=self.pengukur)
+        if snapshot.bintang is not None:
+            for array in snapshot.bintang:
+                array.flags.writeable = False
+        durasi = time.perf_counter() - t0
+        if self.pengukur is not None:
+            self.pengukur.catat("snapshot", durasi * 1000.0)
+        self._terbitkan(snapshot)
+        return durasi
+
+    def _waktu_sampel(self, sampel_terakhir):
+        # Waktu sampel berikutnya untuk mode di_depan (kelipatan interval)
+        langkah = datetime.timedelta(seconds=self.interval)
+        sekarang = datetime.datetime.utcnow()
+        # Setelah komputer tidur (sampel tertinggal jauh) mulai lagi dari waktu sekarang
+        if sampel_terakhir is not None and sampel_terakhir > sekarang - langkah:
+            return [sampel_terakhir + langkah]
+        detik = (sekarang - datetime.datetime(1970, 1, 1)).total_seconds()
+        awal = sekarang - datetime.timedelta(seconds=detik % self.interval)
+        return [awal, awal + langkah]
+
+    def _jalan(self):
+        lokasi_terakhir = sampel_terakhir = None
+        while not self._berhenti.is_set():
+            if not self._aktif.is_set():
+                self._aktif.wait()
+                self._bangun.clear()
+                continue
+            lat, lon = lokasi = self._lokasi
+            if lokasi != lokasi_terakhir:
+                # Hasil terbit/terbenam lokasi lama tidak berlaku lagi
+                self.mesin.bersihkan()
+                lokasi_terakhir = lokasi
+                sampel_terakhir = None
+            try:
+                if not self.di_depan:
+                    durasi = self._hitung(lat, lon)
+                    tunggu = self.interval - durasi
+                else:
+                    for waktu in self._waktu_sampel(sampel_terakhir):
+                        self._hitung(lat, lon, waktu)
+                        sampel_terakhir = waktu
+                    # Sampel berikutnya dihitung setengah interval sebelum sampel terakhir tercapai
+                    tunggu = (sampel_terakhir - datetime.datetime.utcnow()).total_seconds() - self.interval / 2
+            except Exception:
+                # Satu snapshot gagal tidak boleh mematikan thread: catat sekali per lokasi,
+                # tandai lokasinya, lalu coba lagi setelah interval atau saat lokasi diubah
+                if self.lokasi_gagal != lokasi:
+                    log.exception("Snapshot untuk lokasi %s gagal dihitung", lokasi)
+                self.lokasi_gagal = lokasi
+                tunggu = self.interval
+            else:
+                self.lokasi_gagal = None
+
+            self._bangun.wait(max(0.0, tunggu))
+            self._bangun.clear()
@@ -0,0 +1,104 @@
+# -------------------------------
+# Si-DiAs: penjadwal refresh multi-laju
+# -------------------------------
+# Tiap tampilan mendeklarasikan kapan ia perlu digambar ulang: jarak waktu minimum
+# (interval), dan/atau ambang perubahan dari snapshot terakhir yang ia gambar
+# (perubahan(lama, baru) >= ambang) dengan batas waktu maksimum (interval_maks).
+# Lokasi yang berganti selalu memaksa semua tampilan digambar ulang.
+#
+# Hanya ada satu callback window.after yang aktif: tick berikutnya dijadwalkan
+# setelah tick ini selesai, jadi tick yang molor tidak menumpuk callback; snapshot
+# yang terlewat digabung (hanya yang terbaru yang dipakai). Saat jendela
+# di-iconify atau tertutup penuh, snapshot hanya disimpan dan callback saat_terlihat
+# memberi tahu sumbernya (mis. PekerjaLangit.jeda) agar berhenti menghitung; begitu
+# terlihat lagi snapshot terbaru langsung diterapkan ke semua tampilan yang perlu.
+
+import time
+
+PERIODE_MS = 50            # polling sumber snapshot saat jendela terlihat
+PERIODE_TERSEMBUNYI_MS = 500
+
+class Tampilan:
+    def __init__(self, nama, fungsi, interval=0.0, perubahan=None, ambang=0.0, interval_maks=None):
+        self.nama = nama
+        self.fungsi = fungsi
+        self.interval = interval
+        self.perubahan = perubahan
+        self.ambang = ambang
+        self.interval_maks = interval_maks
+        self.terakhir = None  # snapshot terakhir yang digambar
+        self.waktu_terakhir = 0.0
+
+    def perlu(self, snapshot, sekarang):
+        lama = self.terakhir
+        if lama is None or (lama.lat, lama.lon) != (snapshot.lat, snapshot.lon):
+            return True
+        berlalu = sekarang - self.waktu_terakhir
+        if berlalu < self.interval:
+            return False
+        if self.perubahan is None:
+            return True
+        if self.interval_maks is not None and berlalu >= self.interval_maks:
+            return True
+        return self.perubahan(lama, snapshot) >= self.ambang
+
+class Penjadwal:
+    def __init__(self, window, sumber, periode_ms=PERIODE_MS, pengukur=None):
+        # sumber(): snapshot terbaru atau None bila belum ada yang baru
+        # pengukur: sidias.profil.PengukurTahap opsional (tahap "total" per tick yang menggambar)
+        self.window = window
+        self.sumber = sumber
+        self.periode_ms = periode_ms
+        self.pengukur = pengukur
+        self.tampilan = []
+        self.terlihat = True
+        self.tertunda = None
+        self.setelah_terapkan = None  # callback(snapshot) setelah tiap tick yang menggambar
+        self.saat_terlihat = None     # callback(terlihat) saat visibilitas jendela berubah
+
+    def tambah(self, nama, fungsi, **opsi):
+        self.tampilan.append(Tampilan(nama, fungsi, **opsi))
+
+    def pantau_visibilitas(self):
+        window = self.window
+        window.bind("<Unmap>", lambda event: self._atur_terlihat(event, False), add="+")
+        window.bind("<Map>", lambda event: self._atur_terlihat(event, True), add="+")
+        window.bind("<Visibility>", lambda event: self._atur_terlihat(
+            event, event.state != "VisibilityFullyObscured"), add="+")
+
+    def _atur_terlihat(self, event, terlihat):
+        # Event anak widget ikut terkirim ke binding toplevel; hanya jendela utama yang dihitung
+        if event.widget is self.window and terlihat != self.terlihat:
+            self.terlihat = terlihat
+            if self.saat_terlihat is not None:
+                self.saat_terlihat(terlihat)
+
+    def mulai(self):
+        self._putar()
+
+    def _putar(self):
+        snapshot = self.sumber()
+        if snapshot is not None:
+            self.tertunda = snapshot
+        if self.terlihat and self.tertunda is not None:
+            snapshot, self.tertunda = self.tertunda, None
+            self.terapkan(snapshot)
+        self.window.after(self.periode_ms if self.terlihat else PERIODE_TERSEMBUNYI_MS, self._putar)
+
+    def terapkan(self, snapshot):
+        # Gambar ulang tampilan yang perlu; hasil: nama-nama tampilan yang digambar
+        t0 = time.perf_counter()
+        sekarang = time.monotonic()
+        digambar = []
+        for tampilan in self.tampilan:
+            if tampilan.perlu(snapshot, sekarang):
+                tampilan.fungsi(snapshot)
+                tampilan.terakhir = snapshot
+                tampilan.waktu_terakhir = sekarang
+                digambar.append(tampilan.nama)
+        if digambar:
+            if self.pengukur is not None:
+                self.pengukur.catat("total", (time.perf_counter() - t0) * 1000.0)
+            if self.setelah_terapkan is not None:
+                self.setelah_terapkan(snapshot)
+        return digambar
@@ -0,0 +1,78 @@
+# -------------------------------
+# Si-DiAs: pengukuran waktu per tahap tick
+# -------------------------------
+# Durasi tiap tahap (ms) disimpan di ring buffer berukuran tetap, jadi memori tidak
+# tumbuh walau kiosk menyala berminggu-minggu. Persentil dihitung dari isi buffer
+# (jendela sampel terakhir) untuk overlay di layar; seluruh isi buffer bisa ditulis
+# ke CSV saat aplikasi ditutup.
+
+import contextlib
+import csv
+import os
+import time
+
+import numpy as np
+
+KAPASITAS_DEFAULT = 600  # 10 menit tick per detik
+PERSENTIL = (50, 95, 99)
+
+class RingBuffer:
+    def __init__(self, kapasitas):
+        self.data = np.zeros(kapasitas)
+        self.waktu = np.zeros(kapasitas)
+        self.jumlah = 0  # total sampel yang pernah masuk
+
+    def tambah(self, nilai, waktu):
+        i = self.jumlah % len(self.data)
+        self.data[i] = nilai
+        self.waktu[i] = waktu
+        self.jumlah += 1
+
+    def isi(self):
+        # Sampel urut dari yang terlama
+        n = len(self.data)
+        if self.jumlah <= n:
+            return self.waktu[:self.jumlah], self.data[:self.jumlah]
+        urutan = np.roll(np.arange(n), -(self.jumlah % n))
+        return self.waktu[urutan], self.data[urutan]
+
+class PengukurTahap:
+    def __init__(self, kapasitas=KAPASITAS_DEFAULT):
+        self.kapasitas = kapasitas
+        self.buffer = {}  # nama tahap -> RingBuffer, urut sesuai kemunculan pertama
+
+    def catat(self, tahap, ms):
+        buffer = self.buffer.get(tahap)
+        if buffer is None:
+            buffer = self.buffer[tahap] = RingBuffer(self.kapasitas)
+        buffer.tambah(ms, time.time())
+
+    @contextlib.contextmanager
+    def ukur(self, tahap):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.catat(tahap, (time.perf_counter() - t0) * 1000.0)
+
+    def persentil(self):
+        # {tahap: (p50, p95, p99)} dalam ms
+        return {tahap: tuple(np.percentile(buffer.isi()[1], PERSENTIL))
+                for tahap, buffer in list(self.buffer.items()) if buffer.jumlah}
+
+    def teks_overlay(self):
+        baris = [f"{'tahap':<10}" + "".join(f"{'p' + str(p):>8}" for p in PERSENTIL) + "  (ms)"]
+        for tahap, nilai in self.persentil().items():
+            baris.append(f"{tahap:<10}" + "".join(f"{v:8.1f}" for v in nilai))
+        return "\n".join(baris)
+
+    def simpan_csv(self, path):
+        # Format panjang: satu baris per sampel (waktu unix, tahap, ms)
+        sementara = path + ".tmp"
+        with open(sementara, "w", newline="", encoding="utf-8") as f:
+            penulis = csv.writer(f)
+            penulis.writerow(["waktu", "tahap", "ms"])
+            for tahap, buffer in list(self.buffer.items()):
+                for waktu, ms in zip(*buffer.isi()):
+                    penulis.writerow([f"{waktu:.3f}", tahap, f"{ms:.3f}"])
+        os.replace(sementara, path)
@@ -0,0 +1,94 @@
+# -------------------------------
+# Si-DiAs: graf dependensi reaktif
+# -------------------------------
+# Nilai turunan (teks label, geometri pointer, lokasi hasil parsing entri, ...)
+# dinyatakan sebagai simpul yang bergantung pada simpul lain. Simpul sumber diisi
+# dari luar lewat atur(); simpul turunan dihitung malas saat nilainya diminta, dan
+# hanya bila versi salah satu masukannya berubah sejak perhitungan terakhir.
+#
+# Versi simpul hanya naik bila nilainya benar-benar berbeda (perbandingan `sama`),
+# jadi perubahan berhenti merambat di simpul yang hasilnya tetap: snapshot baru tiap
+# detik tidak menghitung ulang teks terbit/terbenam bila jamnya sama. Efek (mis.
+# label.config) dipanggil segarkan() hanya saat versi simpulnya naik.
+
+import operator
+
+class Simpul:
+    def __init__(self, nama, fungsi=None, masukan=(), sama=operator.eq):
+        self.nama = nama
+        self.fungsi = fungsi      # None untuk simpul sumber
+        self.masukan = masukan
+        self.sama = sama
+        self.nilai = None
+        self.versi = 0
+        self.versi_masukan = None  # versi masukan saat terakhir dihitung
+        self.diperiksa = -1        # putaran graf saat terakhir diperiksa
+        self.jumlah_hitung = 0
+
+class GrafReaktif:
+    def __init__(self):
+        self.simpul = {}
+        self.efek = []       # [nama simpul, fungsi, versi terakhir yang dikirim]
+        self._putaran = 0    # naik tiap ada sumber yang berubah
+
+    def _tambah(self, simpul):
+        if simpul.nama in self.simpul:
+            raise ValueError(f"Simpul sudah ada: {simpul.nama!r}")
+        for nama in simpul.masukan:
+            # Masukan harus sudah terdaftar, jadi graf tidak mungkin bersiklus
+            if nama not in self.simpul:
+                raise ValueError(f"Masukan simpul {simpul.nama!r} tidak dikenal: {nama!r}")
+        self.simpul[simpul.nama] = simpul
+
+    def sumber(self, nama, nilai=None, sama=operator.eq):
+        self._tambah(Simpul(nama, sama=sama))
+        self.simpul[nama].nilai = nilai
+
+    def turunan(self, nama, fungsi, *masukan, sama=operator.eq):
+        # fungsi(*nilai masukan) -> nilai simpul
+        self._tambah(Simpul(nama, fungsi, masukan, sama))
+
+    def atur(self, nama, nilai):
+        simpul = self.simpul[nama]
+        if simpul.fungsi is not None:
+            raise ValueError(f"Simpul {nama!r} bukan sumber")
+        if not simpul.sama(simpul.nilai, nilai):
+            simpul.nilai = nilai
+            simpul.versi += 1
+            self._putaran += 1
+
+    def nilai(self, nama):
+        return self._perbarui(self.simpul[nama]).nilai
+
+    def _perbarui(self, simpul):
+        if simpul.fungsi is None or simpul.diperiksa == self._putaran:
+            return simpul
+        masukan = [self._perbarui(self.simpul[nama]) for nama in simpul.masukan]
+        versi = tuple(m.versi for m in masukan)
+        if versi != simpul.versi_masukan:
+            baru = simpul.fungsi(*(m.nilai for m in masukan))
+            simpul.versi_masukan = versi
+            simpul.jumlah_hitung += 1
+            if simpul.jumlah_hitung == 1 or not simpul.sama(simpul.nilai, baru):
+                simpul.nilai = baru
+                simpul.versi += 1
+        simpul.diperiksa = self._putaran
+        return simpul
+
+    def amati(self, nama, fungsi):
+        # fungsi(nilai) dipanggil oleh segarkan() setiap kali nilai simpul berubah
+        if nama not in self.simpul:
+            raise ValueError(f"Simpul tidak dikenal: {nama!r}")
+        self.efek.append([nama, fungsi, None])
+
+    def segarkan(self):
+        # Hitung simpul yang kotor lalu jalankan efek yang nilainya berubah
+        # (urut pendaftaran); hasil: nama-nama simpul yang efeknya dijalankan
+        dijalankan = []
+        for efek in self.efek:
+            simpul = self._perbarui(self.simpul[efek[0]])
+            if simpul.versi != efek[2]:
+                efek[2] = simpul.versi
+                efek[1](simpul.nilai)
+                dijalankan.append(efek[0])
+        return dijalankan
@@ -0,0 +1,192 @@
+# -------------------------------
+# Si-DiAs: render batch tanpa Tk (PNG/SVG)
+# -------------------------------
+# Dial 2D dan peta langit 3D yang sama dengan aplikasi, digambar ke Figure Agg
+# offscreen untuk daftar pekerjaan (lokasi, waktu). DialAstrolab dipakai apa adanya
+# lewat KanvasMatplotlib, pengganti tk.Canvas di atas Axes matplotlib. Pekerjaan
+# dibagi ke pool proses; tiap proses membangun figure, katalog dan mesin efemeris
+# sekali lalu hanya memperbarui posisi per frame.
+#
+#   python -m sidias.render --lokasi -6.2 106.8166 --mulai 2025-01-01T00:00 \
+#       --selesai 2025-01-02T00:00 --langkah-menit 10 --keluaran frame/ --proses 4
+#   python -m sidias.render --pekerjaan kota.csv --format svg --keluaran thumbnail/
+#
+# File pekerjaan: CSV dengan kolom nama, lat, lon, waktu (ISO 8601, UTC). Nama file
+# keluaran <nama>_<waktu>; pekerjaan tanpa nama memakai lat/lon sebagai nama, dan
+# pekerjaan yang nama file-nya tetap sama diberi nomor urut pekerjaan agar tidak saling timpa.
+
+import argparse
+import collections
+import concurrent.futures
+import csv
+import datetime
+import logging
+import os
+import re
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Ellipse, FancyArrowPatch
+
+from sidias.efemeris import TransformasiKatalog
+from sidias.katalog import buka_katalog, indeks_bernama
+from sidias.mesin import buat_mesin, buat_snapshot
+from sidias.tampilan import FONT, WARNA_RASI, DialAstrolab, PetaLangit3D
+
+KATALOG_DEFAULT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "rasi_bintang.csv")
+BATAS_MAG = 6.5
+UKURAN_DIAL = 500  # piksel kanvas Tk yang ditiru (DialAstrolab.cx = cy = 250)
+
+# -------------------------------
+# tk.Canvas di atas matplotlib
+# -------------------------------
+class KanvasMatplotlib:
+    # Subset tk.Canvas yang dipakai DialAstrolab: create_line/oval/text dan coords.
+    # Koordinat dalam piksel Tk (y ke bawah); lebar garis piksel -> poin (x 0.75).
+    JANGKAR = {"sw": ("left", "bottom"), "se": ("right", "bottom"), "nw": ("left", "top"),
+               "ne": ("right", "top"), "center": ("center", "center")}
+
+    def __init__(self, ax, lebar=UKURAN_DIAL, tinggi=UKURAN_DIAL):
+        ax.set_xlim(0, lebar)
+        ax.set_ylim(tinggi, 0)
+        ax.set_aspect("equal")
+        ax.axis("off")
+        self.ax = ax
+        self.item = {}
+
+    def _simpan(self, artist):
+        self.item[len(self.item) + 1] = artist
+        return len(self.item)
+
+    def create_line(self, x0, y0, x1, y1, fill="black", width=1, dash=None, arrow=None, tags=()):
+        if arrow:
+            artist = FancyArrowPatch((x0, y0), (x1, y1), arrowstyle="-|>", mutation_scale=12,
+                                     color=fill, linewidth=width * 0.75)
+            self.ax.add_patch(artist)
+        else:
+            artist, = self.ax.plot([x0, x1], [y0, y1], color=fill, linewidth=width * 0.75,
+                                   linestyle=(0, dash) if dash else "-")
+        return self._simpan(artist)
+
+    def create_oval(self, x0, y0, x1, y1, outline="black", width=1, tags=()):
+        artist = Ellipse(((x0 + x1) / 2, (y0 + y1) / 2), x1 - x0, y1 - y0,
+                         fill=False, edgecolor=outline, linewidth=width * 0.75)
+        self.ax.add_patch(artist)
+        return self._simpan(artist)
+
+    def create_text(self, x, y, text="", fill="black", anchor="center", font=(FONT, 10), tags=()):
+        ha, va = self.JANGKAR[anchor]
+        return self._simpan(self.ax.text(x, y, text, color=fill, ha=ha, va=va,
+                                         fontname=font[0], fontsize=font[1]))
+
+    def coords(self, item, *koordinat):
+        artist = self.item[item]
+        if isinstance(artist, FancyArrowPatch):
+            artist.set_positions(koordinat[0:2], koordinat[2:4])
+        elif isinstance(artist, Line2D):
+            artist.set_data(koordinat[0::2], koordinat[1::2])
+        else:
+            artist.set_position(koordinat[0:2])
+
+# -------------------------------
+# Perender satu frame
+# -------------------------------
+class PerenderLangit:
+    def __init__(self, path_katalog=KATALOG_DEFAULT, nama_mesin=None, batas_mag=BATAS_MAG, dpi=100):
+        katalog = buka_katalog(path_katalog)
+        self.mesin = buat_mesin(nama_mesin)
+        self.transformasi = TransformasiKatalog(katalog, batas_mag, indeks_bernama(katalog, WARNA_RASI))
+        self.fig = Figure(figsize=(12, 6), dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.dial = DialAstrolab(KanvasMatplotlib(self.fig.add_subplot(1, 2, 1)))
+        self.peta = PetaLangit3D(self.fig.add_subplot(1, 2, 2, projection="3d"), katalog, WARNA_RASI)
+        self.judul = self.fig.suptitle("", fontname=FONT, fontsize=11)
+
+    def render(self, lat, lon, waktu, path):
+        snapshot = buat_snapshot(lat, lon, self.transformasi, waktu, mesin=self.mesin)
+        self.dial.perbarui(snapshot)
+        self.peta.perbarui(snapshot)
+        self.judul.set_text(f"{lat:.4f}, {lon:.4f}  {waktu:%Y-%m-%d %H:%M:%S} UTC  "
+                            f"(fase Bulan {snapshot.fase_bulan:.2f})")
+        self.fig.savefig(path)
+        return path
+
+# Satu PerenderLangit per proses pool, dibuat oleh initializer
+_perender = None
+
+def _siapkan_proses(path_katalog, nama_mesin, batas_mag, dpi):
+    global _perender
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    _perender = PerenderLangit(path_katalog, nama_mesin, batas_mag, dpi)
+
+def _render_pekerjaan(pekerjaan):
+    lat, lon, waktu, path = pekerjaan
+    return _perender.render(lat, lon, waktu, path)
+
+def nama_file(nama, lat, lon, waktu, format, nomor=None):
+    # nama kosong/None -> lat/lon; nomor: urutan pekerjaan untuk nama yang bentrok
+    aman = re.sub(r"[^A-Za-z0-9_.+-]+", "_", nama or f"{lat:+.4f}_{lon:+.4f}")
+    return f"{aman}_{waktu:%Y%m%dT%H%M%S}" + (f"_{nomor}" if nomor is not None else "") + f".{format}"
+
+def render_batch(pekerjaan, direktori, format="png", proses=None, path_katalog=KATALOG_DEFAULT,
+                 nama_mesin=None, batas_mag=BATAS_MAG, dpi=100):
+    # pekerjaan: iterable (nama atau None, lat, lon, waktu datetime UTC). Hasil: daftar path file.
+    os.makedirs(direktori, exist_ok=True)
+    pekerjaan = list(pekerjaan)
+    jumlah = collections.Counter(nama_file(nama, lat, lon, waktu, format) for nama, lat, lon, waktu in pekerjaan)
+    tugas = []
+    for nomor, (nama, lat, lon, waktu) in enumerate(pekerjaan):
+        berkas = nama_file(nama, lat, lon, waktu, format)
+        if jumlah[berkas] > 1:
+            berkas = nama_file(nama, lat, lon, waktu, format, nomor)
+        tugas.append((lat, lon, waktu, os.path.join(direktori, berkas)))
+    opsi = (path_katalog, nama_mesin, batas_mag, dpi)
+    if proses == 1:
+        _siapkan_proses(*opsi)
+        return [_render_pekerjaan(t) for t in tugas]
+    proses = proses or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(proses, initializer=_siapkan_proses, initargs=opsi) as pool:
+        return list(pool.map(_render_pekerjaan, tugas, chunksize=max(1, len(tugas) // (proses * 4))))
+
+def baca_pekerjaan(path_csv):
+    with open(path_csv, newline="", encoding="utf-8") as f:
+        return [(baris.get("nama") or None, float(baris["lat"]), float(baris["lon"]),
+                 datetime.datetime.fromisoformat(baris["waktu"]))
+                for baris in csv.DictReader(f)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render dial & peta langit Si-DiAs ke PNG/SVG tanpa Tk")
+    sumber = parser.add_mutually_exclusive_group(required=True)
+    sumber.add_argument("--pekerjaan", help="CSV berkolom nama, lat, lon, waktu")
+    sumber.add_argument("--lokasi", type=float, nargs=2, metavar=("LAT", "LON"), help="satu lokasi, time-lapse")
+    parser.add_argument("--mulai", type=datetime.datetime.fromisoformat, help="awal time-lapse (UTC)")
+    parser.add_argument("--selesai", type=datetime.datetime.fromisoformat, help="akhir time-lapse (UTC)")
+    parser.add_argument("--langkah-menit", type=float, default=10.0)
+    parser.add_argument("--nama", default="frame")
+    parser.add_argument("--keluaran", default="render")
+    parser.add_argument("--format", choices=["png", "svg"], default="png")
+    parser.add_argument("--proses", type=int, default=None, help="jumlah proses (default: jumlah CPU)")
+    parser.add_argument("--katalog", default=KATALOG_DEFAULT)
+    parser.add_argument("--mesin", default=None, help="mesin efemeris (default SIDIAS_MESIN atau ephem)")
+    parser.add_argument("--batas-mag", type=float, default=BATAS_MAG)
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    if args.pekerjaan:
+        pekerjaan = baca_pekerjaan(args.pekerjaan)
+    else:
+        if args.mulai is None or args.selesai is None:
+            parser.error("--lokasi membutuhkan --mulai dan --selesai")
+        langkah = datetime.timedelta(minutes=args.langkah_menit)
+        pekerjaan, waktu = [], args.mulai
+        while waktu <= args.selesai:
+            pekerjaan.append((args.nama, args.lokasi[0], args.lokasi[1], waktu))
+            waktu += langkah
+
+    hasil = render_batch(pekerjaan, args.keluaran, args.format, args.proses, args.katalog,
+                         args.mesin, args.batas_mag, args.dpi)
+    print(f"{len(hasil)} frame ditulis ke {args.keluaran}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# -------------------------------
+# Si-DiAs: jadwal waktu sholat untuk banyak kota
+# -------------------------------
+# Semua waktu sholat adalah peristiwa ketinggian Matahari (atau panjang bayangan
+# untuk Ashar), jadi dihitung dengan grid Matahari tervektorisasi yang sama dengan
+# almanak (sidias.almanak): satu grid waktu untuk sebulan/setahun, ratusan kota per
+# potongan sekaligus.
+#
+#   Subuh   : Matahari naik melewati ketinggian konvensi.subuh (Kemenag -20°)
+#   Terbit  : tepi atas Matahari di horizon (akhir waktu Subuh)
+#   Dzuhur  : transit
+#   Ashar   : panjang bayangan = faktor_ashar × tinggi benda + bayangan saat transit,
+#             yaitu cot(h) = faktor + tan|lintang - Dec|
+#   Maghrib : terbenam
+#   Isya    : Matahari turun melewati konvensi.isya, atau maghrib + isya_menit
+#   Imsak   : subuh - imsak_menit
+#
+# Hasil dibulatkan ke menit setelah ditambah ihtiyat (pengaman): ke atas untuk
+# waktu sholat, ke bawah (setelah dikurangi ihtiyat) untuk terbit. Tabel (menit
+# sejak tengah malam waktu lokal, int16) disimpan di cache .npy per kombinasi
+# konvensi × daftar kota × rentang tanggal dan dibuka lagi dengan mmap.
+#
+#   python -m sidias.sholat --tahun 2025 --keluaran jadwal.csv
+#   python -m sidias.sholat --lokasi kabkota.csv --tahun 2025 --bulan 3 --konvensi mwl
+#
+# Daftar default (data/ibukota_provinsi.csv) hanya 38 ibu kota provinsi; untuk
+# seluruh kabupaten/kota berikan CSV sendiri lewat --lokasi (kolom nama, lat, lon[, zona]).
+#
+# Konvensi dipilih lewat --konvensi atau SIDIAS_KONVENSI_SHOLAT (default kemenag).
+
+import argparse
+import calendar
+import collections
+import contextlib
+import csv
+import datetime
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+
+from sidias.almanak import POTONGAN, GridMatahari, ambang_ketinggian, baca_lokasi, zona_default
+
+KOTA_DEFAULT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "ibukota_provinsi.csv")
+DIREKTORI_CACHE = os.environ.get("SIDIAS_CACHE_SHOLAT", os.path.expanduser("~/.cache/sidias/sholat"))
+VERSI_CACHE = 1  # naikkan bila rumus berubah agar cache lama tidak terpakai
+
+# subuh/isya: ketinggian Matahari (derajat); isya_menit: Isya = Maghrib + menit (isya None)
+Konvensi = collections.namedtuple(
+    "Konvensi", ["subuh", "isya", "isya_menit", "faktor_ashar", "ihtiyat_menit", "imsak_menit"])
+
+KONVENSI_SHOLAT = {
+    "kemenag": Konvensi(-20.0, -18.0, None, 1, 2, 10),
+    "mwl": Konvensi(-18.0, -17.0, None, 1, 0, 10),
+    "isna": Konvensi(-15.0, -15.0, None, 1, 0, 10),
+    "mesir": Konvensi(-19.5, -17.5, None, 1, 0, 10),
+    "ummul_qura": Konvensi(-18.5, None, 90, 1, 0, 10),
+}
+
+WAKTU_SHOLAT = ("imsak", "subuh", "terbit", "dzuhur", "ashar", "maghrib", "isya")
+TIDAK_ADA = -1  # peristiwa tidak terjadi (lintang tinggi)
+
+def pilih_konvensi(konvensi=None):
+    # Nama konvensi, Konvensi, atau None (SIDIAS_KONVENSI_SHOLAT, default kemenag)
+    if isinstance(konvensi, Konvensi):
+        return konvensi
+    if konvensi is None:
+        konvensi = os.environ.get("SIDIAS_KONVENSI_SHOLAT", "kemenag")
+    try:
+        return KONVENSI_SHOLAT[konvensi]
+    except KeyError:
+        raise ValueError(f"konvensi sholat tidak dikenal: {konvensi!r} (pilih: {', '.join(KONVENSI_SHOLAT)})") from None
+
+def ambang_ashar(faktor):
+    # sin(h) dengan cot(h) = faktor + tan|lintang - Dec|
+    def ambang(lat, dec, jarak):
+        cot = faktor + np.tan(np.abs(lat - dec))
+        return 1.0 / np.sqrt(1.0 + cot * cot)
+    return ambang
+
+def _menit_lokal(jd, grid, zona):
+    # Menit sejak tengah malam lokal pada hari tabel masing-masing (kolom = hari)
+    hari = np.arange(grid.jumlah_hari)
+    return (jd - grid.jd0 - hari) * 1440.0 + zona[:, np.newaxis] * 60.0
+
+def hitung_jadwal(lats, lons, tanggal_awal, jumlah_hari, konvensi=None, zona=None, grid=None,
+                  potongan=POTONGAN):
+    # Tabel int16 (n_lokasi, jumlah_hari, len(WAKTU_SHOLAT)): menit sejak tengah malam
+    # waktu lokal, TIDAK_ADA bila tidak terjadi. grid: GridMatahari yang bisa dipakai ulang.
+    konvensi = pilih_konvensi(konvensi)
+    lats = np.atleast_1d(np.asarray(lats, dtype=float))
+    lons = np.atleast_1d(np.asarray(lons, dtype=float))
+    zona = zona_default(lons) if zona is None else np.broadcast_to(np.asarray(zona, dtype=float), lats.shape)
+    if grid is None:
+        grid = GridMatahari(tanggal_awal, jumlah_hari)
+    ihtiyat = konvensi.ihtiyat_menit
+
+    tabel = np.full((len(lats), jumlah_hari, len(WAKTU_SHOLAT)), TIDAK_ADA, dtype=np.int16)
+    for awal in range(0, len(lats), potongan):
+        bagian = slice(awal, awal + potongan)
+        lokasi = grid.potongan(lats[bagian], lons[bagian], zona[bagian])
+        z = zona[bagian]
+        maghrib = _menit_lokal(lokasi.peristiwa(ambang_ketinggian(None), naik=False), grid, z)
+        if konvensi.isya is not None:
+            isya = _menit_lokal(lokasi.peristiwa(ambang_ketinggian(konvensi.isya), naik=False), grid, z)
+        else:
+            isya = maghrib + konvensi.isya_menit
+        subuh = np.ceil(_menit_lokal(lokasi.peristiwa(ambang_ketinggian(konvensi.subuh), naik=True), grid, z) + ihtiyat)
+        menit = {
+            "imsak": subuh - konvensi.imsak_menit,
+            "subuh": subuh,
+            "terbit": np.floor(_menit_lokal(lokasi.peristiwa(ambang_ketinggian(None), naik=True), grid, z) - ihtiyat),
+            "dzuhur": np.ceil(_menit_lokal(lokasi.transit(), grid, z) + ihtiyat),
+            "ashar": np.ceil(_menit_lokal(lokasi.peristiwa(ambang_ashar(konvensi.faktor_ashar), naik=False), grid, z)
+                             + ihtiyat),
+            "maghrib": np.ceil(maghrib + ihtiyat),
+            "isya": np.ceil(isya + ihtiyat),
+        }
+        for k, nama in enumerate(WAKTU_SHOLAT):
+            tabel[bagian, :, k] = np.where(np.isnan(menit[nama]), TIDAK_ADA, np.nan_to_num(menit[nama]))
+    return tabel
+
+def _kunci_cache(lokasi, tanggal_awal, jumlah_hari, konvensi):
+    isi = repr((VERSI_CACHE, tuple(konvensi), tanggal_awal.isoformat(), jumlah_hari,
+                [(round(lat, 6), round(lon, 6), zona) for _, lat, lon, zona in lokasi]))
+    return hashlib.sha1(isi.encode("utf-8")).hexdigest()[:16]
+
+def tabel_sholat(lokasi, tanggal_awal, jumlah_hari, konvensi=None, direktori_cache=DIREKTORI_CACHE):
+    # lokasi: daftar (nama, lat, lon, zona atau None). Tabel dihitung sekali per
+    # kombinasi lalu dibuka dari cache (mmap, read-only); direktori_cache None = tanpa cache.
+    konvensi = pilih_konvensi(konvensi)
+    lokasi = [(nama, lat, lon, zona_default(lon).item() if zona is None else float(zona))
+              for nama, lat, lon, zona in lokasi]
+    path = None
+    if direktori_cache is not None:
+        path = os.path.join(direktori_cache, _kunci_cache(lokasi, tanggal_awal, jumlah_hari, konvensi) + ".npy")
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            pass
+    tabel = hitung_jadwal([l[1] for l in lokasi], [l[2] for l in lokasi], tanggal_awal, jumlah_hari,
+                          konvensi, [l[3] for l in lokasi])
+    if path is not None:
+        # Cache yang tidak bisa ditulis tidak boleh membuang tabel yang sudah dihitung
+        sementara = path + ".tmp"
+        try:
+            os.makedirs(direktori_cache, exist_ok=True)
+            with open(sementara, "wb") as f:
+                np.save(f, tabel)
+            os.replace(sementara, path)
+        except OSError as e:
+            print(f"Tabel sholat tidak disimpan ke cache {direktori_cache}: {e}", file=sys.stderr)
+            with contextlib.suppress(OSError):
+                os.remove(sementara)
+    return tabel
+
+def format_menit(menit):
+    return "" if menit == TIDAK_ADA else f"{menit // 60:02d}:{menit % 60:02d}"
+
+def tulis_jadwal_csv(lokasi, tabel, tanggal_awal, path):
+    tanggal = [(tanggal_awal + datetime.timedelta(days=d)).isoformat() for d in range(tabel.shape[1])]
+    teks = np.array([format_menit(m) for m in range(24 * 60)] + [""], dtype=object)
+    sementara = path + ".tmp"
+    with open(sementara, "w", newline="", encoding="utf-8") as f:
+        penulis = csv.writer(f)
+        penulis.writerow(("nama", "lat", "lon", "tanggal") + WAKTU_SHOLAT)
+        for (nama, lat, lon, _), jadwal in zip(lokasi, teks[np.where(tabel == TIDAK_ADA, 24 * 60, tabel % (24 * 60))]):
+            penulis.writerows((nama, lat, lon, tanggal[d]) + tuple(jadwal[d]) for d in range(len(tanggal)))
+    os.replace(sementara, path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jadwal waktu sholat untuk banyak kota ke CSV")
+    parser.add_argument("--lokasi", default=KOTA_DEFAULT, help="CSV berkolom nama, lat, lon[, zona] (default: 38 ibu kota provinsi; "
+                        "berikan daftar kabupaten/kota untuk cakupan penuh)")
+    parser.add_argument("--tahun", type=int, default=datetime.date.today().year)
+    parser.add_argument("--bulan", type=int, choices=range(1, 13), metavar="1-12", help="satu bulan saja")
+    parser.add_argument("--konvensi", default=None, help=f"pilih: {', '.join(KONVENSI_SHOLAT)}")
+    parser.add_argument("--faktor-ashar", type=int, choices=(1, 2), help="1 = Syafi'i (default), 2 = Hanafi")
+    parser.add_argument("--tanpa-cache", action="store_true")
+    parser.add_argument("--keluaran", default="jadwal_sholat.csv")
+    args = parser.parse_args(argv)
+
+    lokasi = baca_lokasi(args.lokasi)
+    konvensi = pilih_konvensi(args.konvensi)
+    if args.faktor_ashar is not None:
+        konvensi = konvensi._replace(faktor_ashar=args.faktor_ashar)
+    if args.bulan:
+        mulai = datetime.date(args.tahun, args.bulan, 1)
+        hari = calendar.monthrange(args.tahun, args.bulan)[1]
+    else:
+        mulai = datetime.date(args.tahun, 1, 1)
+        hari = 366 if calendar.isleap(args.tahun) else 365
+
+    t0 = time.perf_counter()
+    tabel = tabel_sholat(lokasi, mulai, hari, konvensi, None if args.tanpa_cache else DIREKTORI_CACHE)
+    durasi = time.perf_counter() - t0
+    tulis_jadwal_csv(lokasi, tabel, mulai, args.keluaran)
+    print(f"{len(lokasi)} kota × {hari} hari ({durasi:.2f} s) ditulis ke {args.keluaran}")
+
+if __name__ == "__main__":
+    main()
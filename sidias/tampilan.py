@@ -0,0 +1,314 @@
+# -------------------------------
+# Si-DiAs: tampilan (retained mode)
+# -------------------------------
+# Objek gambar dibuat sekali; tiap tick hanya posisinya yang diperbarui dari
+# SnapshotLangit (lihat sidias.efemeris). Modul ini tidak mengimpor tkinter
+# sehingga bisa dipakai juga dengan backend Agg tanpa layar.
+
+import collections
+import datetime
+import math
+import time
+
+import numpy as np
+
+from sidias.katalog import indeks_bernama
+
+FONT = "Lucida Console"
+
+# Warna rasi bintang (digambar dengan marker segitiga dan label)
+WARNA_RASI = {
+    "Orion": "darkorange",
+    "Ursa Major": "indigo",
+    "Ursa Minor": "green",
+    "Crux": "magenta",
+    "Canis Major": "cyan",
+    "Taurus": "sienna",
+    "Scorpius": "firebrick",
+    "Sagittarius": "gold",
+    "Capricornus": "teal",
+    "Leo": "navy"
+}
+
+def altaz_ke_kartesian(az, alt):
+    # Konversi (az, alt) radian ke titik pada bola satuan
+    return math.cos(alt) * math.cos(az), math.cos(alt) * math.sin(az), math.sin(alt)
+
+def polar_to_cartesian(angle, radius, cx, cy):
+    # Konversi koordinat polar ke kartesian untuk dial 2D
+    x = cx + radius * math.cos(angle)
+    y = cy - radius * math.sin(angle)
+    return x, y
+
+def _selisih_sudut(a, b):
+    # Selisih dua sudut (radian) dalam rentang [-pi, pi)
+    return (a - b + math.pi) % (2 * math.pi) - math.pi
+
+# -------------------------------
+# Dial Astrolab 2D pada tk.Canvas
+# -------------------------------
+class DialAstrolab:
+    cx, cy = 250, 250
+    radius = 170
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._gambar_dial()
+        # Pointer dibuat sekali; posisinya dipindah lewat canvas.coords()
+        self.pointer_matahari = canvas.create_line(
+            self.cx, self.cy, self.cx, self.cy, fill="red", width=3, arrow="last", tags=("pointer", "matahari"))
+        self.label_matahari = canvas.create_text(
+            self.cx, self.cy, text="Matahari", fill="red", anchor="sw", font=(FONT, 8), tags=("pointer", "matahari"))
+        self.pointer_bulan = canvas.create_line(
+            self.cx, self.cy, self.cx, self.cy, fill="blue", width=3, arrow="last", tags=("pointer", "bulan"))
+        self.label_bulan = canvas.create_text(
+            self.cx, self.cy, text="Bulan", fill="blue", anchor="se", font=(FONT, 8), tags=("pointer", "bulan"))
+
+    def _gambar_dial(self):
+        # Geometri statis: lingkaran luar, 12 jari-jari putus-putus dan label derajat
+        canvas, cx, cy, radius = self.canvas, self.cx, self.cy, self.radius
+        canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius, outline="black", width=2, tags=("dial",))
+        for deg in range(0, 360, 30):
+            rad = math.radians(deg)
+            x_end, y_end = polar_to_cartesian(rad, radius, cx, cy)
+            canvas.create_line(cx, cy, x_end, y_end, fill="gray", dash=(2,2), tags=("dial",))
+            x_label, y_label = polar_to_cartesian(rad, radius + 15, cx, cy)
+            canvas.create_text(x_label, y_label, text=f"{deg}°", font=(FONT, 8), tags=("dial",))
+
+    def geometri(self, snapshot):
+        # Ujung pointer (piksel) Matahari dan Bulan: ((x, y), (x, y))
+        pointer_length = self.radius * 0.9
+        return (polar_to_cartesian(snapshot.az_matahari, pointer_length, self.cx, self.cy),
+                polar_to_cartesian(snapshot.az_bulan, pointer_length * 0.8, self.cx, self.cy))
+
+    def gambar(self, geometri):
+        canvas, cx, cy = self.canvas, self.cx, self.cy
+        (x_pointer, y_pointer), (x_pointer_bulan, y_pointer_bulan) = geometri
+
+        # Pointer Matahari
+        canvas.coords(self.pointer_matahari, cx, cy, x_pointer, y_pointer)
+        canvas.coords(self.label_matahari, x_pointer, y_pointer)
+
+        # Pointer Bulan
+        canvas.coords(self.pointer_bulan, cx, cy, x_pointer_bulan, y_pointer_bulan)
+        canvas.coords(self.label_bulan, x_pointer_bulan, y_pointer_bulan)
+
+    def perbarui(self, snapshot):
+        self.gambar(self.geometri(snapshot))
+
+# -------------------------------
+# Peta Langit 3D dengan Matplotlib
+# -------------------------------
+class PetaLangit3D:
+    def __init__(self, ax, katalog, warna_rasi):
+        # ax: Axes3D; katalog: sidias.katalog.Katalog; warna_rasi: {nama: warna}.
+        # Baris katalog yang namanya ada di warna_rasi digambar sebagai rasi bintang
+        # (segitiga + label), sisanya sebagai titik bintang kecil.
+        self.ax = ax
+        self.idx_rasi = indeks_bernama(katalog, warna_rasi)
+        nama_rasi = [katalog.nama[katalog.data["nama"][i]] for i in self.idx_rasi]
+        self._gambar_latar()
+
+        self.titik_matahari = ax.scatter([0], [0], [0], color='red', s=100, label='Matahari')
+        self.titik_bulan = ax.scatter([0], [0], [0], color='blue', s=100, label='Bulan')
+
+        # Bintang katalog: satu scatter, ukuran titik mengikuti magnitudo. Jumlah titiknya
+        # berubah tiap tick (hanya bintang terpilih), jadi ukuran disimpan per baris katalog.
+        mag = np.nan_to_num(np.asarray(katalog.data["mag"], dtype=float), nan=6.0)
+        self.ukuran_bintang = np.clip(6.5 - mag, 0.3, 6.0) ** 1.5
+        self.titik_bintang = ax.scatter([], [], [], color='k', s=[], marker='.', linewidths=0)
+
+        # Semua rasi bintang dalam satu scatter dengan marker segitiga
+        warna = [warna_rasi[nama] for nama in nama_rasi]
+        nol = np.zeros(len(self.idx_rasi))
+        self.titik_rasi = ax.scatter(nol, nol, nol, color=warna, s=50, marker='^')
+        self.teks_rasi = [
+            ax.text(0, 0, 0, f" {nama}", color=w, fontsize=8, fontname=FONT)
+            for nama, w in zip(nama_rasi, warna)
+        ]
+
+        ax.legend(loc='upper right', prop={"family": FONT, "size": 10})
+
+    def _gambar_latar(self):
+        ax = self.ax
+        # Buat grid untuk permukaan bola
+        u = np.linspace(0, np.pi, 50)
+        v = np.linspace(0, 2*np.pi, 50)
+        x = np.outer(np.sin(u), np.cos(v))
+        y = np.outer(np.sin(u), np.sin(v))
+        z = np.outer(np.cos(u), np.ones_like(v))
+
+        # Warna: bagian atas (z>=0) = langit (biru), bagian bawah (z<0) = bumi (coklat)
+        colors = np.empty(x.shape, dtype=object)
+        colors[z >= 0] = 'skyblue'
+        colors[z < 0] = 'saddlebrown'
+
+        ax.plot_surface(x, y, z, facecolors=colors, rstride=1, cstride=1, alpha=0.5, linewidth=0)
+
+        ax.set_xlim([-1, 1])
+        ax.set_ylim([-1, 1])
+        ax.set_zlim([-1, 1])
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_zticks([])
+        ax.set_box_aspect([1,1,1])
+
+        # Tambahkan label arah: Utara, Selatan, Barat, Timur
+        ax.text(0, 1.05, 0, "T", color="k", fontsize=10, ha="center", fontname=FONT)
+        ax.text(0, -1.05, 0, "B", color="k", fontsize=10, ha="center", fontname=FONT)
+        ax.text(1.05, 0, 0, "S", color="k", fontsize=10, va="center", fontname=FONT)
+        ax.text(-1.05, 0, 0, "U", color="k", fontsize=10, va="center", fontname=FONT)
+
+    @staticmethod
+    def perubahan_derajat(lama, baru):
+        # Perubahan tampilan peta (derajat) antara dua snapshot: rotasi langit akibat
+        # waktu yang berlalu, atau pergeseran Matahari/Bulan bila lebih besar
+        rotasi = abs((baru.waktu - lama.waktu).total_seconds()) * 360.9856 / 86400.0
+        gerak = max(abs(_selisih_sudut(baru.az_matahari, lama.az_matahari)) * math.cos(baru.alt_matahari),
+                    abs(baru.alt_matahari - lama.alt_matahari),
+                    abs(_selisih_sudut(baru.az_bulan, lama.az_bulan)) * math.cos(baru.alt_bulan),
+                    abs(baru.alt_bulan - lama.alt_bulan))
+        return max(rotasi, math.degrees(gerak))
+
+    @property
+    def benda(self):
+        # Artist yang berubah tiap tick (lihat CacheLatarLangit)
+        return self.titik_matahari, self.titik_bulan
+
+    def perbarui(self, snapshot):
+        # Per tick hanya posisi marker (_offsets3d) dan teks yang berubah
+        self.perbarui_benda(snapshot)
+        self.perbarui_latar(snapshot)
+
+    def perbarui_benda(self, snapshot):
+        x, y, z = altaz_ke_kartesian(snapshot.az_matahari, snapshot.alt_matahari)
+        self.titik_matahari._offsets3d = ([x], [y], [z])
+        x, y, z = altaz_ke_kartesian(snapshot.az_bulan, snapshot.alt_bulan)
+        self.titik_bulan._offsets3d = ([x], [y], [z])
+
+    def perbarui_latar(self, snapshot):
+        # Bintang dan rasi bintang: hanya bergantung pada lintang dan waktu sideris lokal
+        indeks, az, alt = snapshot.bintang
+        cos_alt = np.cos(alt)
+        x, y, z = cos_alt * np.cos(az), cos_alt * np.sin(az), np.sin(alt)
+        # indeks terurut dan selalu memuat baris rasi bintang
+        posisi_rasi = np.searchsorted(indeks, self.idx_rasi)
+        bukan_rasi = np.ones(len(indeks), dtype=bool)
+        bukan_rasi[posisi_rasi] = False
+        self.titik_bintang._offsets3d = (x[bukan_rasi], y[bukan_rasi], z[bukan_rasi])
+        self.titik_bintang.set_sizes(self.ukuran_bintang[indeks[bukan_rasi]])
+        i = posisi_rasi
+        self.titik_rasi._offsets3d = (x[i], y[i], z[i])
+        for teks, posisi in zip(self.teks_rasi, zip(x[i], y[i], z[i])):
+            teks.set_position_3d(posisi)
+
+# -------------------------------
+# Cache render latar peta 3D
+# -------------------------------
+# Latar peta (bola, bintang, rasi, label, legenda) hanya bergantung pada lintang dan
+# waktu sideris lokal (LST), bukan tanggal atau bujur. Hasil render latar disimpan
+# (copy_from_bbox) per (kuantum lintang, kuantum LST, sudut pandang, ukuran kanvas);
+# per tick latar cukup dipulihkan (restore_region) lalu hanya Matahari & Bulan
+# (artist animated) yang digambar di atasnya dan di-blit. Eviksi LRU dengan batas
+# total byte. Kuantum default 0.25° = 1 menit waktu sideris.
+#
+# Cache hanya berguna bila latar yang sama digambar lebih dari sekali: peta yang
+# di-refresh lebih rapat dari kuantum LST (animasi, ambang 0.02°), atau banyak
+# lokasi/klien di lintang serupa. Peta yang baru digambar ulang setelah langit
+# berputar >= satu kuantum selalu jatuh ke ember baru (hanya gagal). Latar langit
+# bergerak maju terus, jadi beberapa entri sudah cukup; batas default kecil.
+MAKS_BYTE_LATAR = 8 * 2**20
+KUANTUM_LAT = 0.25   # derajat
+KUANTUM_LST = 0.25   # derajat
+J2000 = datetime.datetime(2000, 1, 1, 12)
+
+def lst_derajat(waktu, lon):
+    # Waktu sideris lokal rata-rata (derajat) dari datetime UTC; cukup untuk kuantisasi
+    hari = (waktu - J2000).total_seconds() / 86400.0
+    return (280.46061837 + 360.98564736629 * hari + lon) % 360.0
+
+class CacheLatarLangit:
+    def __init__(self, peta, kanvas, maks_byte=MAKS_BYTE_LATAR, kuantum_lat=KUANTUM_LAT, kuantum_lst=KUANTUM_LST,
+                 pengukur=None):
+        # peta: PetaLangit3D; kanvas: FigureCanvasAgg/TkAgg milik figure peta
+        # pengukur: sidias.profil.PengukurTahap opsional (tahap "peta" = artist, "draw" = render/blit)
+        self.peta = peta
+        self.kanvas = kanvas
+        self.pengukur = pengukur
+        self.maks_byte = maks_byte
+        self.kuantum_lat = kuantum_lat
+        self.kuantum_lst = kuantum_lst
+        self._isi = collections.OrderedDict()  # kunci -> (region, byte)
+        self.byte = 0
+        self.kena = self.gagal = 0  # jumlah gambar dari cache / render latar baru
+        self._terakhir = None
+        self._mengisi = False
+        for artist in peta.benda:
+            artist.set_animated(True)
+        # Draw penuh di luar cache (resize, rotasi tetikus) tidak menyertakan artist
+        # animated; gambar ulang Matahari & Bulan ke buffer sebelum ditampilkan
+        kanvas.mpl_connect("draw_event", self._setelah_draw)
+
+    def _kunci(self, snapshot):
+        ax, bbox = self.peta.ax, self.kanvas.figure.bbox
+        return (round(snapshot.lat / self.kuantum_lat),
+                int(lst_derajat(snapshot.waktu, snapshot.lon) // self.kuantum_lst),
+                ax.elev, ax.azim, ax.roll, int(bbox.width), int(bbox.height))
+
+    def _gambar_benda(self):
+        ax = self.peta.ax
+        for artist in self.peta.benda:
+            artist.do_3d_projection()
+            ax.draw_artist(artist)
+
+    def _setelah_draw(self, event):
+        if not self._mengisi and self._terakhir is not None:
+            self._gambar_benda()
+
+    def _catat(self, tahap, t0):
+        if self.pengukur is not None:
+            self.pengukur.catat(tahap, (time.perf_counter() - t0) * 1000.0)
+
+    def teks_statistik(self):
+        total = self.kena + self.gagal
+        persen = 100.0 * self.kena / total if total else 0.0
+        return (f"cache latar: {self.kena}/{total} kena ({persen:.0f}%), "
+                f"{len(self._isi)} entri, {self.byte / 2**20:.1f} MB")
+
+    def gambar(self, snapshot):
+        kanvas = self.kanvas
+        bbox = kanvas.figure.bbox
+        self._terakhir = snapshot
+        t0 = time.perf_counter()
+        self.peta.perbarui_benda(snapshot)
+        kunci = self._kunci(snapshot)
+        isi = self._isi.get(kunci)
+        if isi is None:
+            self.gagal += 1
+            self.peta.perbarui_latar(snapshot)
+            self._catat("peta", t0)
+            t0 = time.perf_counter()
+            self._mengisi = True
+            try:
+                kanvas.draw()
+            finally:
+                self._mengisi = False
+            ukuran = int(bbox.width) * int(bbox.height) * 4
+            self._isi[kunci] = (kanvas.copy_from_bbox(bbox), ukuran)
+            self.byte += ukuran
+            while self.byte > self.maks_byte and len(self._isi) > 1:
+                _, (_, lama) = self._isi.popitem(last=False)
+                self.byte -= lama
+        else:
+            self.kena += 1
+            self._catat("peta", t0)
+            t0 = time.perf_counter()
+            self._isi.move_to_end(kunci)
+            kanvas.restore_region(isi[0])
+        self._gambar_benda()
+        kanvas.blit(bbox)
+        self._catat("draw", t0)
+
+    def bersihkan(self):
+        self._isi.clear()
+        self.byte = 0